@@ -0,0 +1,139 @@
+"""Spec builders, binding loading and timing shared by the benchmark scripts.
+
+The scripts are run from the repository root as ``python benchmarks/<name>.py``,
+which puts this directory first on ``sys.path``, so they import this module
+as ``_common``.
+"""
+
+import timeit
+
+import black
+from stellar_sdk import xdr
+
+from stellar_contract_bindings.python import GeneratorOptions, generate_binding
+
+ADDRESS = "GBMBVAHBE6D4AJXJJVTBQTVU4G7SN4FEIJOL5YTOHZ4WCUMKQ52ANL2B"
+TOPIC = xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_TOPIC_LIST
+DATA = xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_DATA
+
+
+def type_def(t: xdr.SCSpecType) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(t)
+
+
+def udt(name: bytes) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_UDT, udt=xdr.SCSpecTypeUDT(name=name)
+    )
+
+
+def vec(element: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_VEC, vec=xdr.SCSpecTypeVec(element_type=element)
+    )
+
+
+def option(value: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_OPTION,
+        option=xdr.SCSpecTypeOption(value_type=value),
+    )
+
+
+def struct(name: bytes, fields: dict) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+        udt_struct_v0=xdr.SCSpecUDTStructV0(
+            doc=b"",
+            lib=b"",
+            name=name,
+            fields=[
+                xdr.SCSpecUDTStructFieldV0(doc=b"", name=n, type=td)
+                for n, td in fields.items()
+            ],
+        ),
+    )
+
+
+def union(name: bytes, cases: dict) -> xdr.SCSpecEntry:
+    # A case with no types is a void case.
+    kind = xdr.SCSpecUDTUnionCaseV0Kind
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0,
+        udt_union_v0=xdr.SCSpecUDTUnionV0(
+            doc=b"",
+            lib=b"",
+            name=name,
+            cases=[
+                (
+                    xdr.SCSpecUDTUnionCaseV0(
+                        kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0,
+                        tuple_case=xdr.SCSpecUDTUnionCaseTupleV0(
+                            doc=b"", name=n, type=types
+                        ),
+                    )
+                    if types
+                    else xdr.SCSpecUDTUnionCaseV0(
+                        kind.SC_SPEC_UDT_UNION_CASE_VOID_V0,
+                        void_case=xdr.SCSpecUDTUnionCaseVoidV0(doc=b"", name=n),
+                    )
+                )
+                for n, types in cases.items()
+            ],
+        ),
+    )
+
+
+def event(
+    name: bytes,
+    params: list,
+    data_format: xdr.SCSpecEventDataFormat = (
+        xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_SINGLE_VALUE
+    ),
+) -> xdr.SCSpecEntry:
+    # params are (name, type, TOPIC or DATA); the event's name is its only
+    # prefix topic.
+    entry = xdr.SCSpecEntry(xdr.SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0)
+    entry.event_v0 = xdr.SCSpecEventV0(
+        doc=b"",
+        lib=b"",
+        name=xdr.SCSymbol(sc_symbol=name),
+        prefix_topics=[xdr.SCSymbol(sc_symbol=name)],
+        params=[
+            xdr.SCSpecEventParamV0(doc=b"", name=n, type=td, location=location)
+            for n, td, location in params
+        ],
+        data_format=data_format,
+    )
+    return entry
+
+
+def transfer_event() -> xdr.SCSpecEntry:
+    # The token transfer event: both addresses are topics, the amount is data.
+    address = type_def(xdr.SCSpecType.SC_SPEC_TYPE_ADDRESS)
+    return event(
+        b"transfer",
+        [
+            (b"from", address, TOPIC),
+            (b"to", address, TOPIC),
+            (b"amount", type_def(xdr.SCSpecType.SC_SPEC_TYPE_I128), DATA),
+        ],
+    )
+
+
+def binding_source(specs: list, **options) -> str:
+    source = generate_binding(specs, "none", options=GeneratorOptions(**options))
+    return black.format_str(source, mode=black.Mode())
+
+
+def load(specs: list, **options) -> dict:
+    namespace: dict = {}
+    exec(binding_source(specs, **options), namespace)
+    return namespace
+
+
+def us_per_call(statement: str, number: int = 20_000, **names) -> float:
+    # The best of five runs, so that noise from other processes only ever
+    # makes a run slower.
+    timings = timeit.repeat(statement, globals=names, number=number, repeat=5)
+    return min(timings) / number * 1e6
@@ -0,0 +1,50 @@
+"""Address encoding and decoding over a working set of a few hundred accounts.
+
+Generated codecs convert addresses through LRU caches; the SDK converters
+they replace parse or build the strkey on every call. Run from the
+repository root:
+
+    python benchmarks/python_address_cache.py
+"""
+
+import itertools
+
+from stellar_sdk import Keypair, scval, xdr
+
+from _common import load, struct, type_def, us_per_call
+
+ACCOUNTS = 300
+
+
+def _specs() -> list:
+    return [
+        struct(b"Holder", {b"account": type_def(xdr.SCSpecType.SC_SPEC_TYPE_ADDRESS)})
+    ]
+
+
+def main():
+    ns = load(_specs())
+    helpers = {
+        "encode": ns["_address_to_scval"],
+        "decode": ns["_address_from_scval"],
+    }
+    accounts = [Keypair.random().public_key for _ in range(ACCOUNTS)]
+    encoded = [scval.to_address(account) for account in accounts]
+    inputs = {"encode": accounts, "decode": encoded}
+    sdk = {"encode": scval.to_address, "decode": scval.from_address}
+    print(f"{'':<16}{'sdk (us)':>12}{'cached (us)':>14}{'hit ratio':>12}")
+    for direction in ("encode", "decode"):
+        timings = [
+            us_per_call(
+                "convert(next(values))",
+                convert=convert,
+                values=itertools.cycle(inputs[direction]),
+            )
+            for convert in (sdk[direction], helpers[direction])
+        ]
+        ratio = ns["address_cache_stats"]()[direction]["hit_ratio"]
+        print(f"{direction:<16}{timings[0]:>12.2f}{timings[1]:>14.2f}{ratio:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Memory and decode time of a 10,000-element Vec<u64>, as a list and as an array.
+
+Run from the repository root:
+
+    python benchmarks/python_arrays.py
+"""
+
+import sys
+
+from stellar_sdk import xdr
+
+from _common import load, struct, type_def, us_per_call, vec
+
+COUNT = 10_000
+
+
+def _specs() -> list:
+    return [
+        struct(b"Feed", {b"prices": vec(type_def(xdr.SCSpecType.SC_SPEC_TYPE_U64))})
+    ]
+
+
+def _size(prices) -> int:
+    # The container plus every int object it holds; an array holds none.
+    if isinstance(prices, list):
+        return sys.getsizeof(prices) + sum(sys.getsizeof(p) for p in prices)
+    return sys.getsizeof(prices)
+
+
+def main():
+    prices = [10**12 + i for i in range(COUNT)]
+    print(f"{'':<24}{'list':>12}{'array':>12}")
+    rows = {"memory (KiB)": [], "from_scval (ms)": [], "from_xdr_bytes (ms)": []}
+    for arrays in (False, True):
+        feed = load(_specs(), arrays=arrays)["Feed"]
+        value = feed(prices).to_scval()
+        data = value.to_xdr_bytes()
+        rows["memory (KiB)"].append(_size(feed.from_scval(value).prices) / 1024)
+        for label, statement in (
+            ("from_scval (ms)", "feed.from_scval(value)"),
+            ("from_xdr_bytes (ms)", "feed.from_xdr_bytes(data)"),
+        ):
+            us = us_per_call(statement, number=5, feed=feed, value=value, data=data)
+            rows[label].append(us / 1e3)
+    for label, values in rows.items():
+        print(f"{label:<24}" + "".join(f"{v:>12.1f}" for v in values))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Decoding a 10,000-element vector of generated values, one by one and batched.
+
+Run from the repository root:
+
+    python benchmarks/python_batch_decode.py
+"""
+
+from stellar_sdk import xdr
+
+from _common import load, struct, type_def, union, us_per_call
+
+COUNT = 10_000
+
+
+def _specs() -> list:
+    i128 = type_def(xdr.SCSpecType.SC_SPEC_TYPE_I128)
+    u32 = type_def(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+    side = xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0,
+        udt_enum_v0=xdr.SCSpecUDTEnumV0(
+            doc=b"",
+            lib=b"",
+            name=b"Side",
+            cases=[
+                xdr.SCSpecUDTEnumCaseV0(doc=b"", name=name, value=xdr.Uint32(value))
+                for value, name in enumerate((b"Buy", b"Sell"))
+            ],
+        ),
+    )
+    return [
+        struct(b"Position", {b"collateral": i128, b"debt": i128}),
+        side,
+        union(b"Order", {b"Limit": [u32], b"Market": [u32]}),
+    ]
+
+
+def _ms_per_call(statement: str, **names) -> float:
+    return us_per_call(statement, number=5, **names) / 1e3
+
+
+def main():
+    ns = load(_specs())
+    position, side, order = ns["Position"], ns["Side"], ns["Order"]
+    values = {
+        "Position": (position, [position(i, -i).to_scval() for i in range(COUNT)]),
+        "Side": (side, [side(i % 2).to_scval() for i in range(COUNT)]),
+        "Order": (
+            order,
+            [order(ns["OrderKind"].Limit, limit=i).to_scval() for i in range(COUNT)],
+        ),
+    }
+    print(f"{'':<14}{'from_scval (ms)':>18}{'from_scval_many (ms)':>24}")
+    for label, (cls, vals) in values.items():
+        one_by_one = _ms_per_call(
+            "[cls.from_scval(v) for v in vals]", cls=cls, vals=vals
+        )
+        batched = _ms_per_call("cls.from_scval_many(vals)", cls=cls, vals=vals)
+        print(f"{label:<14}{one_by_one:>18.1f}{batched:>24.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""parse_event on a contract declaring many events: topic index against a scan.
+
+parse_event looks its candidates up by the first topic and the topic count;
+before, it called matches() on every declared event, most specific first,
+until one accepted. The scan is reproduced here over the same classes. Events
+are passed as already decoded (topics, data) pairs so that dispatch is what is
+measured. Run from the repository root:
+
+    python benchmarks/python_event_dispatch.py
+"""
+
+from stellar_sdk import scval, xdr
+
+from _common import ADDRESS, DATA, TOPIC, event, load, type_def, us_per_call
+
+EVENT_COUNTS = (5, 20, 60)
+
+
+def _event(name: bytes) -> xdr.SCSpecEntry:
+    return event(
+        name,
+        [
+            (b"account", type_def(xdr.SCSpecType.SC_SPEC_TYPE_ADDRESS), TOPIC),
+            (b"amount", type_def(xdr.SCSpecType.SC_SPEC_TYPE_I128), DATA),
+        ],
+    )
+
+
+def _scan(events: list):
+    # The dispatch parse_event did before it had an index.
+    def parse_event(event):
+        for cls in events:
+            if cls.matches(event):
+                return cls.parse(event)
+        return None
+
+    return parse_event
+
+
+def _us_per_event(parse_event, stream: list) -> float:
+    us = us_per_call(
+        "for e in stream: parse_event(e)",
+        number=20,
+        parse_event=parse_event,
+        stream=stream,
+    )
+    return us / len(stream)
+
+
+def main():
+    account = scval.to_address(ADDRESS)
+    print(f"{'declared events':<18}{'scan us':>10}{'index us':>10}")
+    for count in EVENT_COUNTS:
+        names = [f"event_{i}".encode() for i in range(count)]
+        ns = load([_event(name) for name in names])
+        # Every declared event once, so the scan stops half-way on average.
+        stream = [
+            ([scval.to_symbol(name.decode()), account], scval.to_int128(i))
+            for i, name in enumerate(names)
+        ]
+        scan = _scan(ns["_EVENTS"])
+        assert all(scan(e) == ns["parse_event"](e) for e in stream)
+        print(
+            f"{count:<18}{_us_per_event(scan, stream):>10.2f}"
+            f"{_us_per_event(ns['parse_event'], stream):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
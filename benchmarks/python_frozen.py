@@ -0,0 +1,44 @@
+"""Dict lookups keyed by nested generated values, with and without frozen types.
+
+Run from the repository root:
+
+    python benchmarks/python_frozen.py
+"""
+
+from stellar_sdk import xdr
+
+from _common import load, struct, type_def, udt, us_per_call
+
+
+def _specs() -> list:
+    i128 = type_def(xdr.SCSpecType.SC_SPEC_TYPE_I128)
+    return [
+        struct(b"Point", {b"x": i128, b"y": i128}),
+        struct(b"Segment", {b"start": udt(b"Point"), b"end": udt(b"Point")}),
+        struct(b"Path", {b"first": udt(b"Segment"), b"second": udt(b"Segment")}),
+    ]
+
+
+def main():
+    print(f"{'':<30}{'default':>12}{'frozen':>12}")
+    results = []
+    for frozen in (False, True):
+        ns = load(_specs(), frozen=frozen)
+        point, segment, path = ns["Point"], ns["Segment"], ns["Path"]
+        keys = [
+            path(
+                segment(point(i, i + 1), point(i + 2, i + 3)),
+                segment(point(i + 4, i + 5), point(i + 6, i + 7)),
+            )
+            for i in range(1_000)
+        ]
+        table = {key: index for index, key in enumerate(keys)}
+        us = us_per_call(
+            "for key in keys: table[key]", number=100, keys=keys, table=table
+        )
+        results.append(us / len(keys) * 1e3)
+    print(f"{'Path dict lookup (ns)':<30}{results[0]:>12.1f}{results[1]:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Memory held by a stream of parsed events, with and without interned symbols.
+
+Synthesizes swap events whose Symbol fields take a handful of recurring
+values, as pool and asset codes do, parses all of them from base64 XDR and
+keeps the results, the way an indexer buffering a batch would. Without
+interning every decoded symbol is a fresh ``str``. Run from the repository
+root:
+
+    python benchmarks/python_intern.py
+"""
+
+import gc
+import tracemalloc
+
+from stellar_sdk import Keypair, scval, xdr
+
+from _common import DATA, TOPIC, event, load, type_def, us_per_call
+
+EVENTS = 20_000
+POOLS = [f"pool_{a}_{b}" for a in ("usdc", "eurc", "aqua") for b in ("xlm", "btc")]
+ASSETS = ["native_xlm", "usdc_circle", "eurc_circle", "aqua_token", "btc_wrapped"]
+
+
+def _specs() -> list:
+    t = xdr.SCSpecType
+    symbol = type_def(t.SC_SPEC_TYPE_SYMBOL)
+    return [
+        event(
+            b"swap",
+            [
+                (b"trader", type_def(t.SC_SPEC_TYPE_ADDRESS), TOPIC),
+                (b"pool", symbol, DATA),
+                (b"sold", symbol, DATA),
+                (b"bought", symbol, DATA),
+                (b"amount", type_def(t.SC_SPEC_TYPE_I128), DATA),
+            ],
+            xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_MAP,
+        )
+    ]
+
+
+def _stream() -> list:
+    # Base64 topics and data, as RPC returns them.
+    traders = [
+        scval.to_address(Keypair.random().public_key).to_xdr() for _ in range(100)
+    ]
+    name = scval.to_symbol("swap").to_xdr()
+    events = []
+    for i in range(EVENTS):
+        data = scval.to_map(
+            {
+                scval.to_symbol("amount"): scval.to_int128(i),
+                scval.to_symbol("bought"): scval.to_symbol(
+                    ASSETS[(i + 1) % len(ASSETS)]
+                ),
+                scval.to_symbol("pool"): scval.to_symbol(POOLS[i % len(POOLS)]),
+                scval.to_symbol("sold"): scval.to_symbol(ASSETS[i % len(ASSETS)]),
+            }
+        )
+        events.append(([name, traders[i % len(traders)]], data.to_xdr()))
+    return events
+
+
+def _retained(parse_event, stream: list):
+    gc.collect()
+    tracemalloc.start()
+    parsed = [parse_event(event) for event in stream]
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return parsed, retained
+
+
+def _us_per_event(parse_event, stream: list) -> float:
+    # Timed separately, since tracing allocations slows everything down.
+    us = us_per_call(
+        "for e in stream: parse_event(e)",
+        number=1,
+        parse_event=parse_event,
+        stream=stream,
+    )
+    return us / len(stream)
+
+
+def main():
+    stream = _stream()
+    print(f"{EVENTS} swap events{'':<6}{'retained MB':>12}{'parse us':>10}")
+    for intern_symbols in (False, True):
+        ns = load(_specs(), intern_symbols=intern_symbols)
+        # One warm-up pass so the address caches start out full either way.
+        ns["parse_event"](stream[0])
+        parsed, retained = _retained(ns["parse_event"], stream)
+        assert parsed[-1].pool == POOLS[(EVENTS - 1) % len(POOLS)]
+        del parsed
+        us = _us_per_event(ns["parse_event"], stream)
+        label = "intern_symbols" if intern_symbols else "default"
+        print(f"{label:<25}{retained / 2**20:>12.1f}{us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
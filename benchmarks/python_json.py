@@ -0,0 +1,68 @@
+"""JSON serialization of a decoded value: to_dict() against a reflective walk.
+
+A reflective serializer inspects every attribute at run time to decide how to
+convert it; the generated to_dict() and from_dict() already know each field's
+type. Run from the repository root:
+
+    python benchmarks/python_json.py
+"""
+
+import enum
+import json
+
+from stellar_sdk import Address, xdr
+
+from _common import ADDRESS, load, struct, type_def, us_per_call, vec
+
+
+def _specs() -> list:
+    t = xdr.SCSpecType
+    return [
+        struct(
+            b"Position",
+            {
+                b"owner": type_def(t.SC_SPEC_TYPE_ADDRESS),
+                b"amount": type_def(t.SC_SPEC_TYPE_I128),
+                b"memo": type_def(t.SC_SPEC_TYPE_STRING),
+                b"hash": type_def(t.SC_SPEC_TYPE_BYTES),
+                b"history": vec(type_def(t.SC_SPEC_TYPE_U64)),
+            },
+        )
+    ]
+
+
+def _reflective(value):
+    # The kind of walk an indexer writes by hand when no to_dict() exists.
+    if isinstance(value, (bool, int, str)) or value is None:
+        return value
+    if isinstance(value, Address):
+        return value.address
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [_reflective(v) for v in value]
+    if isinstance(value, dict):
+        return [[_reflective(k), _reflective(v)] for k, v in value.items()]
+    return {name: _reflective(v) for name, v in vars(value).items()}
+
+
+def main():
+    position = load(_specs())["Position"]
+    value = position.from_scval(
+        position(ADDRESS, 10**20, b"rebalance", bytes(32), list(range(16))).to_scval()
+    )
+    data = json.loads(json.dumps(value.to_dict()))
+    assert position.from_dict(data) == value
+    rows = {
+        "reflective walk": us_per_call("walk(value)", walk=_reflective, value=value),
+        "to_dict()": us_per_call("value.to_dict()", value=value),
+        "from_dict()": us_per_call("cls.from_dict(data)", cls=position, data=data),
+    }
+    for label, us in rows.items():
+        print(f"{label:<18}{us:>8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
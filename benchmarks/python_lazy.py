@@ -0,0 +1,53 @@
+"""Reading one field of a wide, nested struct, with and without lazy decoding.
+
+Run from the repository root:
+
+    python benchmarks/python_lazy.py
+"""
+
+from stellar_sdk import xdr
+
+from _common import load, struct, type_def, udt, us_per_call
+
+WIDTH = 20
+NUMBER = 2_000
+
+
+def _specs() -> list:
+    i128 = type_def(xdr.SCSpecType.SC_SPEC_TYPE_I128)
+    return [
+        struct(b"Position", {b"debt": i128, b"collateral": i128}),
+        struct(
+            b"Book",
+            {f"p{index:02}".encode(): udt(b"Position") for index in range(WIDTH)},
+        ),
+    ]
+
+
+def main():
+    print(f"{'':<30}{'default':>12}{'lazy':>12}")
+    rows = {"from_scval + one field": [], "from_scval + every field": []}
+    for lazy in (False, True):
+        ns = load(_specs(), lazy=lazy)
+        position, book = ns["Position"], ns["Book"]
+        encoded = book(*(position(i, -i) for i in range(WIDTH))).to_scval()
+        rows["from_scval + one field"].append(
+            us_per_call(
+                "book.from_scval(v).p07.debt", number=NUMBER, book=book, v=encoded
+            )
+        )
+        rows["from_scval + every field"].append(
+            us_per_call(
+                "b = book.from_scval(v)\nfor n in names: getattr(b, n).debt",
+                number=NUMBER,
+                book=book,
+                v=encoded,
+                names=[f"p{index:02}" for index in range(WIDTH)],
+            )
+        )
+    for label, timings in rows.items():
+        print(f"{label + ' (us)':<30}" + "".join(f"{t:>12.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
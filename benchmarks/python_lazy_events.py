@@ -0,0 +1,90 @@
+"""A topic filter over parsed events, with and without lazy event data.
+
+Synthesizes swap events whose trader is a topic and whose pool, amounts and
+fee are a data map, parses each from base64 XDR, and keeps those of a few
+watched traders, reading their amounts. The rest are dropped after looking at
+the trader alone, so with ``lazy_events`` their data is never decoded. Run
+from the repository root:
+
+    python benchmarks/python_lazy_events.py
+"""
+
+from stellar_sdk import Keypair, scval, xdr
+
+from _common import DATA, TOPIC, event, load, type_def, us_per_call
+
+EVENTS = 5_000
+TRADERS = 200
+WATCHED = 4
+
+
+def _specs() -> list:
+    t = xdr.SCSpecType
+    address, i128 = type_def(t.SC_SPEC_TYPE_ADDRESS), type_def(t.SC_SPEC_TYPE_I128)
+    return [
+        event(
+            b"swap",
+            [
+                (b"trader", address, TOPIC),
+                (b"pool", address, DATA),
+                (b"sold", i128, DATA),
+                (b"bought", i128, DATA),
+                (b"fee", i128, DATA),
+            ],
+            xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_MAP,
+        )
+    ]
+
+
+def _stream(traders: list) -> list:
+    # Base64 topics and data, as RPC returns them.
+    pool = scval.to_address(Keypair.random().public_key)
+    name = scval.to_symbol("swap").to_xdr()
+    events = []
+    for i in range(EVENTS):
+        data = scval.to_map(
+            {
+                scval.to_symbol("bought"): scval.to_int128(i * 3),
+                scval.to_symbol("fee"): scval.to_int128(i),
+                scval.to_symbol("pool"): pool,
+                scval.to_symbol("sold"): scval.to_int128(i * 2),
+            }
+        )
+        trader = scval.to_address(traders[i % len(traders)]).to_xdr()
+        events.append(([name, trader], data.to_xdr()))
+    return events
+
+
+def _watch(parse_event, stream: list, watched: set) -> int:
+    total = 0
+    for raw in stream:
+        event = parse_event(raw)
+        if event.trader.address in watched:
+            total += event.sold
+    return total
+
+
+def main():
+    traders = [Keypair.random().public_key for _ in range(TRADERS)]
+    watched = set(traders[:WATCHED])
+    stream = _stream(traders)
+    print(f"{EVENTS} swaps, {WATCHED} of {TRADERS} traders watched")
+    totals = set()
+    for lazy_events in (False, True):
+        parse_event = load(_specs(), lazy_events=lazy_events)["parse_event"]
+        totals.add(_watch(parse_event, stream, watched))
+        us = us_per_call(
+            "watch(parse_event, stream, watched)",
+            number=1,
+            watch=_watch,
+            parse_event=parse_event,
+            stream=stream,
+            watched=watched,
+        )
+        label = "lazy_events" if lazy_events else "default"
+        print(f"{label:<14}{us / EVENTS:>8.2f} us/event")
+    assert len(totals) == 1
+
+
+if __name__ == "__main__":
+    main()
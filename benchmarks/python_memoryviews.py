@@ -0,0 +1,40 @@
+"""from_xdr_bytes on a struct holding a large Bytes value, copied and as a view.
+
+Run from the repository root:
+
+    python benchmarks/python_memoryviews.py
+"""
+
+from stellar_sdk import xdr
+
+from _common import load, struct, type_def, us_per_call
+
+SIZES = (64, 4096, 65536)
+
+
+def _specs() -> list:
+    t = xdr.SCSpecType
+    fields = {
+        b"proof": type_def(t.SC_SPEC_TYPE_BYTES),
+        b"round": type_def(t.SC_SPEC_TYPE_U64),
+    }
+    return [struct(b"Attestation", fields)]
+
+
+def main():
+    print(f"{'from_xdr_bytes (us)':<24}{'bytes':>12}{'memoryview':>12}")
+    classes = [
+        load(_specs(), memoryviews=memoryviews)["Attestation"]
+        for memoryviews in (False, True)
+    ]
+    for size in SIZES:
+        data = classes[0](b"\x07" * size, 1).to_xdr_bytes()
+        timings = [
+            us_per_call("cls.from_xdr_bytes(data)", cls=cls, data=data)
+            for cls in classes
+        ]
+        print(f"{f'{size} bytes':<24}" + "".join(f"{t:>12.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
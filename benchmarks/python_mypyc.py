@@ -0,0 +1,146 @@
+"""Codec throughput of the test contract's types, interpreted and compiled.
+
+Generates the test contract's struct, enum and union types, plus a transfer
+event, with ``GeneratorOptions(mypyc=True)`` and times the same source twice:
+imported as a plain module, and compiled to a C extension with mypyc.
+Compiling takes a minute or so and needs mypy and a C compiler; without them
+only the interpreted column is printed. Run from the repository root:
+
+    python benchmarks/python_mypyc.py
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+
+from stellar_sdk import scval, xdr
+
+from _common import (
+    ADDRESS,
+    binding_source,
+    struct,
+    transfer_event,
+    type_def,
+    udt,
+    union,
+    us_per_call,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _specs() -> list:
+    t = xdr.SCSpecType
+    return [
+        struct(
+            b"SimpleStruct",
+            {
+                b"a": type_def(t.SC_SPEC_TYPE_U32),
+                b"b": type_def(t.SC_SPEC_TYPE_BOOL),
+                b"c": type_def(t.SC_SPEC_TYPE_SYMBOL),
+            },
+        ),
+        union(b"SimpleEnum", {b"First": [], b"Second": [], b"Third": []}),
+        struct(b"TupleStruct", {b"0": udt(b"SimpleStruct"), b"1": udt(b"SimpleEnum")}),
+        union(
+            b"ComplexEnum",
+            {
+                b"Struct": [udt(b"SimpleStruct")],
+                b"Tuple": [udt(b"TupleStruct")],
+                b"Enum": [udt(b"SimpleEnum")],
+                b"Asset": [
+                    type_def(t.SC_SPEC_TYPE_ADDRESS),
+                    type_def(t.SC_SPEC_TYPE_I128),
+                ],
+                b"Void": [],
+            },
+        ),
+        transfer_event(),
+    ]
+
+
+def _write(directory: str, name: str) -> None:
+    with open(os.path.join(directory, f"{name}.py"), "w") as f:
+        f.write(binding_source(_specs(), mypyc=True))
+
+
+def _compile(directory: str, name: str) -> bool:
+    try:
+        import mypyc  # noqa: F401
+    except ImportError:
+        return False
+    env = dict(os.environ, MYPYPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-m", "mypyc", f"{name}.py"],
+        cwd=directory,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stdout[-2000:], result.stderr[-2000:], file=sys.stderr)
+        return False
+    # Leave only the extension behind for the import to find.
+    os.remove(os.path.join(directory, f"{name}.py"))
+    return True
+
+
+def _timings(module) -> dict:
+    simple = module.SimpleStruct(7, True, "symbol")
+    value = module.ComplexEnum(
+        module.ComplexEnumKind.Tuple,
+        tuple=module.TupleStruct(
+            (simple, module.SimpleEnum(module.SimpleEnumKind.Second))
+        ),
+    )
+    asset = module.ComplexEnum(module.ComplexEnumKind.Asset, asset=(ADDRESS, 10**20))
+    rows = {}
+    for label, v in (("ComplexEnum::Tuple", value), ("ComplexEnum::Asset", asset)):
+        cls = type(v)
+        encoded, data = v.to_scval(), v.to_xdr_bytes()
+        v = cls.from_scval(encoded)
+        assert cls.from_xdr_bytes(data) == v
+        rows[f"{label} from_scval"] = us_per_call("f(x)", f=cls.from_scval, x=encoded)
+        rows[f"{label} to_scval"] = us_per_call("v.to_scval()", v=v)
+        rows[f"{label} from_xdr_bytes"] = us_per_call(
+            "f(x)", f=cls.from_xdr_bytes, x=data
+        )
+        rows[f"{label} to_xdr_bytes"] = us_per_call("v.to_xdr_bytes()", v=v)
+    topics = [
+        scval.to_symbol("transfer").to_xdr(),
+        scval.to_address(ADDRESS).to_xdr(),
+        scval.to_address(ADDRESS).to_xdr(),
+    ]
+    event = (topics, scval.to_int128(10**20).to_xdr())
+    assert module.parse_event(event).amount == 10**20
+    rows["TransferEvent parse_event"] = us_per_call(
+        "f(x)", f=module.parse_event, x=event
+    )
+    rows["TransferEvent topic_filter"] = us_per_call(
+        "f(to=x)", f=module.TransferEvent.topic_filter, x=ADDRESS
+    )
+    return rows
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        _write(directory, "interpreted_bindings")
+        _write(directory, "compiled_bindings")
+        compiled = _compile(directory, "compiled_bindings")
+        sys.path.insert(0, directory)
+        interpreted = _timings(importlib.import_module("interpreted_bindings"))
+        native = (
+            _timings(importlib.import_module("compiled_bindings")) if compiled else {}
+        )
+    print(f"{'':<36}{'interpreted':>12}{'compiled':>12}")
+    for label, us in interpreted.items():
+        row = f"{label:<36}{us:>9.2f} us"
+        if label in native:
+            row += f"{native[label]:>9.2f} us"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
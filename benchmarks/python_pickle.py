@@ -0,0 +1,99 @@
+"""Pickle size and time of decoded values, as a process pool would send them.
+
+Generated types pickle as their class and constructor arguments. For
+comparison the same values are pickled through the default attribute dict,
+which is what removing that __reduce__ gives, and as their SCVal XDR bytes,
+which carry map keys, type tags and padding and cost an encode and decode per
+value. Run from the repository root:
+
+    python benchmarks/python_pickle.py
+"""
+
+import pickle
+import sys
+import types
+
+from stellar_sdk import Keypair, xdr
+
+from _common import binding_source, struct, type_def, udt, us_per_call, vec
+
+COUNT = 200
+ACCOUNTS = 50
+
+
+def _specs() -> list:
+    t = xdr.SCSpecType
+    return [
+        struct(
+            b"Leg",
+            {
+                b"from": type_def(t.SC_SPEC_TYPE_ADDRESS),
+                b"to": type_def(t.SC_SPEC_TYPE_ADDRESS),
+                b"amount": type_def(t.SC_SPEC_TYPE_I128),
+            },
+        ),
+        struct(
+            b"Trade",
+            {b"ledger": type_def(t.SC_SPEC_TYPE_U32), b"legs": vec(udt(b"Leg"))},
+        ),
+    ]
+
+
+def _by_xdr(value):
+    return value.from_xdr_bytes, (value.to_xdr_bytes(),)
+
+
+def _module(name: str, reduce) -> types.ModuleType:
+    # pickle finds classes by module, so each copy gets an importable one.
+    module = types.ModuleType(name)
+    exec(binding_source(_specs()), module.__dict__)
+    sys.modules[name] = module
+    for cls in (module.Leg, module.Trade):
+        if reduce is None:
+            del cls.__reduce__
+        elif reduce != "generated":
+            cls.__reduce__ = reduce
+    return module
+
+
+def _trades(module: types.ModuleType) -> list:
+    accounts = [Keypair.random().public_key for _ in range(ACCOUNTS)]
+    trades = []
+    for ledger in range(COUNT):
+        legs = [
+            module.Leg(
+                accounts[(ledger + i) % ACCOUNTS],
+                accounts[(ledger * 7 + i) % ACCOUNTS],
+                ledger * 10**18 + i,
+            )
+            for i in range(3)
+        ]
+        value = module.Trade(ledger, legs)
+        trades.append(module.Trade.from_xdr_bytes(value.to_xdr_bytes()))
+    return trades
+
+
+def _ms(statement: str, **names) -> float:
+    return us_per_call(statement, number=10, **names) / 1e3
+
+
+def main():
+    print(
+        f"{COUNT} trades of 3 legs{'':<12}{'bytes':>10}{'dumps ms':>10}{'loads ms':>10}"
+    )
+    variants = {
+        "attribute dict": None,
+        "SCVal XDR": _by_xdr,
+        "constructor args": "generated",
+    }
+    for index, (label, reduce) in enumerate(variants.items()):
+        module = _module(f"pickle_bench_{index}", reduce)
+        trades = _trades(module)
+        payload = pickle.dumps(trades)
+        dumps = _ms("pickle.dumps(trades)", pickle=pickle, trades=trades)
+        loads = _ms("pickle.loads(payload)", pickle=pickle, payload=payload)
+        print(f"{label:<30}{len(payload):>10}{dumps:>10.2f}{loads:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
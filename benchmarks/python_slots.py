@@ -0,0 +1,80 @@
+"""Memory per instance and attribute-access time, with and without __slots__.
+
+Run from the repository root:
+
+    python benchmarks/python_slots.py
+"""
+
+import gc
+import tracemalloc
+
+from stellar_sdk import scval, xdr
+
+from _common import ADDRESS, load, struct, transfer_event, type_def, us_per_call
+
+INSTANCES = 100_000
+
+
+def _specs() -> list:
+    t = xdr.SCSpecType
+    position = struct(
+        b"Position",
+        {
+            b"owner": type_def(t.SC_SPEC_TYPE_ADDRESS),
+            b"amount": type_def(t.SC_SPEC_TYPE_I128),
+            b"ledger": type_def(t.SC_SPEC_TYPE_U32),
+            b"active": type_def(t.SC_SPEC_TYPE_BOOL),
+        },
+    )
+    return [position, transfer_event()]
+
+
+def _bytes_per_instance(make) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [make() for _ in range(INSTANCES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding them costs one pointer per instance.
+    per_instance = (after - before) / INSTANCES - 8
+    del instances
+    return per_instance
+
+
+def _read_ns(instance) -> float:
+    return us_per_call("o.amount", number=1_000_000, o=instance) * 1e3
+
+
+def main():
+    topic = scval.to_address(ADDRESS)
+    event = ([scval.to_symbol("transfer"), topic, topic], scval.to_int128(10))
+    print(f"{'':<28}{'dict':>12}{'slots':>12}")
+    rows = {}
+    for slots in (False, True):
+        ns = load(_specs(), slots=slots)
+        position = ns["Position"]
+        transfer = ns["TransferEvent"]
+        # Fields hold shared objects, so only the instance itself is measured.
+        owner = ns["Address"](ADDRESS)
+        sample = position(owner, 5, 1, True)
+        parsed = transfer.parse(event)
+        for label, value in [
+            (
+                "Position bytes/instance",
+                _bytes_per_instance(lambda: position(owner, 5, 1, True)),
+            ),
+            (
+                "TransferEvent bytes/inst.",
+                _bytes_per_instance(lambda: transfer(owner, owner, 5)),
+            ),
+            ("Position.amount read (ns)", _read_ns(sample)),
+            ("TransferEvent.amount (ns)", _read_ns(parsed)),
+        ]:
+            rows.setdefault(label, []).append(value)
+    for label, (plain, slotted) in rows.items():
+        print(f"{label:<28}{plain:>12.1f}{slotted:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Rebuilding per-account getEvents filters with topic_filter().
+
+An indexer subscribed to one transfer filter per watched account rebuilds all
+of them on every reconnect. topic_filter() now reads the static prefix topics
+from a class constant and encodes each address topic once, through a cache;
+before, every call encoded both again. That call is reproduced here next to
+the generated one. Run from the repository root:
+
+    python benchmarks/python_topic_filter.py
+"""
+
+from stellar_sdk import Keypair, scval
+
+from _common import load, transfer_event, us_per_call
+
+ACCOUNTS = 2_000
+
+
+def _encoding_filter(from_=..., to=...) -> list:
+    # The row topic_filter() built before, encoding every topic on each call.
+    return [
+        scval.to_symbol("transfer").to_xdr(),
+        "*" if from_ is ... else scval.to_address(from_).to_xdr(),
+        "*" if to is ... else scval.to_address(to).to_xdr(),
+        "**",
+    ]
+
+
+def _us_per_filter(topic_filter, accounts: list) -> float:
+    us = us_per_call(
+        "for a in accounts: topic_filter(to=a)",
+        number=5,
+        topic_filter=topic_filter,
+        accounts=accounts,
+    )
+    return us / len(accounts)
+
+
+def main():
+    topic_filter = load([transfer_event()])["TransferEvent"].topic_filter
+    accounts = [Keypair.random().public_key for _ in range(ACCOUNTS)]
+    assert [topic_filter(to=a) for a in accounts] == [
+        _encoding_filter(to=a) for a in accounts
+    ]
+    print(f"{ACCOUNTS} per-account transfer filters, rebuilt")
+    rows = {
+        "encode every topic": _us_per_filter(_encoding_filter, accounts),
+        "precomputed topics": _us_per_filter(topic_filter, accounts),
+    }
+    for label, us in rows.items():
+        print(f"{label:<22}{us:>8.2f} us/filter")
+
+
+if __name__ == "__main__":
+    main()
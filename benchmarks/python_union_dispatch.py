@@ -0,0 +1,47 @@
+"""Codec and comparison cost by case position in a 40-case union.
+
+Union codecs dispatch through per-class tables, so the last case should cost
+the same as the first. Run from the repository root:
+
+    python benchmarks/python_union_dispatch.py
+"""
+
+from stellar_sdk import xdr
+
+from _common import load, type_def, union, us_per_call
+
+WIDTH = 40
+
+
+def _specs() -> list:
+    u32 = type_def(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+    return [union(b"Wide", {f"Case{index}".encode(): [u32] for index in range(WIDTH)})]
+
+
+def _ns_per_call(statement: str, **names) -> float:
+    return us_per_call(statement, **names) * 1e3
+
+
+def main():
+    ns = load(_specs())
+    wide, kind = ns["Wide"], ns["WideKind"]
+    positions = {"first": 0, "middle": WIDTH // 2, "last": WIDTH - 1}
+    print(f"{'':<20}" + "".join(f"{label:>12}" for label in positions))
+    rows = {"to_scval": [], "from_scval": [], "__eq__": [], "__hash__": []}
+    for index in positions.values():
+        member = list(kind)[index]
+        value = wide(member, **{f"case{index}": 7})
+        other = wide(member, **{f"case{index}": 7})
+        encoded = value.to_scval()
+        rows["to_scval"].append(_ns_per_call("value.to_scval()", value=value))
+        rows["from_scval"].append(
+            _ns_per_call("wide.from_scval(encoded)", wide=wide, encoded=encoded)
+        )
+        rows["__eq__"].append(_ns_per_call("value == other", value=value, other=other))
+        rows["__hash__"].append(_ns_per_call("hash(value)", value=value))
+    for label, timings in rows.items():
+        print(f"{label + ' (ns)':<20}" + "".join(f"{t:>12.0f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
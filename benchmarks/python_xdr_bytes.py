@@ -0,0 +1,73 @@
+"""Decoding and encoding through XDR bytes, with and without xdr.SCVal objects.
+
+``from_scval(xdr.SCVal.from_xdr_bytes(data))`` unpacks the whole SCVal tree
+before decoding it; ``from_xdr_bytes(data)`` reads the bytes directly, and
+``to_xdr_bytes()`` likewise skips the tree ``to_scval()`` builds. Run from the
+repository root:
+
+    python benchmarks/python_xdr_bytes.py
+"""
+
+from stellar_sdk import xdr
+
+from _common import ADDRESS, load, option, struct, type_def, us_per_call, vec
+
+NUMBER = 2_000
+
+
+def _specs() -> list:
+    t = xdr.SCSpecType
+    i128 = type_def(t.SC_SPEC_TYPE_I128)
+    return [
+        struct(
+            b"Quote",
+            {
+                b"asset": type_def(t.SC_SPEC_TYPE_SYMBOL),
+                b"bid": i128,
+                b"ask": i128,
+                b"volume": i128,
+                b"ledger": type_def(t.SC_SPEC_TYPE_U64),
+                b"prices": vec(type_def(t.SC_SPEC_TYPE_U32)),
+            },
+        ),
+        struct(
+            b"Transfer",
+            {
+                b"from": type_def(t.SC_SPEC_TYPE_ADDRESS),
+                b"to": type_def(t.SC_SPEC_TYPE_ADDRESS),
+                b"amount": i128,
+                b"memo": option(type_def(t.SC_SPEC_TYPE_STRING)),
+            },
+        ),
+    ]
+
+
+def main():
+    ns = load(_specs())
+    values = {
+        "Quote": ns["Quote"](
+            "XLM", 10**9, 10**9 + 7, 2**80, 52_000_000, list(range(8))
+        ),
+        "Transfer": ns["Transfer"](ADDRESS, ADDRESS, 10**7, b"rent"),
+    }
+    print(f"{'':<30}{'via SCVal':>12}{'direct':>12}")
+    for name, value in values.items():
+        cls = type(value)
+        data = value.to_xdr_bytes()
+        names = {"cls": cls, "data": data, "value": value, "SCVal": xdr.SCVal}
+        decode = (
+            us_per_call(
+                "cls.from_scval(SCVal.from_xdr_bytes(data))", number=NUMBER, **names
+            ),
+            us_per_call("cls.from_xdr_bytes(data)", number=NUMBER, **names),
+        )
+        encode = (
+            us_per_call("value.to_scval().to_xdr_bytes()", number=NUMBER, **names),
+            us_per_call("value.to_xdr_bytes()", number=NUMBER, **names),
+        )
+        print(f"{name + ' decode (us)':<30}{decode[0]:>12.1f}{decode[1]:>12.1f}")
+        print(f"{name + ' encode (us)':<30}{encode[0]:>12.1f}{encode[1]:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
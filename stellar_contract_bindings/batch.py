@@ -0,0 +1,223 @@
+"""Generate bindings for many spec sets in one call.
+
+Generation is CPU-bound Python, so a loop over ``generate_binding`` keeps one
+core busy no matter how many the machine has. ``generate_many`` spreads the
+spec sets over a process pool instead. Each worker imports the backends once,
+so the templates compiled at import are shared by every spec set that worker
+handles rather than rebuilt per item.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Mapping
+from typing import Optional, Tuple, Union
+
+import black
+from stellar_sdk import xdr
+
+from stellar_contract_bindings import flutter, java, kmp, php, python, swift
+
+SpecSets = Union[
+    Mapping[Hashable, List[xdr.SCSpecEntry]], Iterable[List[xdr.SCSpecEntry]]
+]
+
+
+def _generate_python(
+    specs: List[xdr.SCSpecEntry],
+    client_type: str = "both",
+    runtime: str = "inline",
+    **features,
+) -> Tuple[str, List[str]]:
+    generated, diagnostics = python.generate_binding_with_diagnostics(
+        specs,
+        client_type=client_type,
+        runtime=runtime,
+        options=python.GeneratorOptions(**features),
+    )
+    return black.format_str(generated, mode=black.Mode()), diagnostics
+
+
+def _generate_php(
+    specs: List[xdr.SCSpecEntry],
+    namespace: str = "GeneratedContracts",
+    class_name: str = "ContractClient",
+) -> Tuple[str, List[str]]:
+    return (
+        php.generate_binding(specs, namespace=namespace, contract_name=class_name),
+        [],
+    )
+
+
+def _without_diagnostics(
+    generate: Callable[..., str],
+) -> Callable[..., Tuple[str, List[str]]]:
+    return lambda specs, **options: (generate(specs, **options), [])
+
+
+# Options are named after the CLI flags and default to the CLI defaults, so a
+# batch produces exactly what the matching command would have written.
+_BACKENDS: Dict[str, Tuple[Callable[..., Tuple[str, List[str]]], Tuple[str, ...]]] = {
+    "python": (
+        _generate_python,
+        ("client_type", "runtime", *python.GeneratorOptions().as_dict()),
+    ),
+    "java": (_without_diagnostics(java.generate_binding), ("package",)),
+    "flutter": (_without_diagnostics(flutter.generate_binding), ("class_name",)),
+    "php": (_generate_php, ("namespace", "class_name")),
+    "swift": (_without_diagnostics(swift.generate_binding), ("class_name",)),
+    "kmp": (_without_diagnostics(kmp.generate_binding), ("package", "class_name")),
+}
+_DEFAULT_OPTIONS: Dict[str, Dict[str, Any]] = {
+    "java": {"package": "org.stellar"},
+    "flutter": {"class_name": "Contract"},
+    "swift": {"class_name": "ContractClient"},
+    "kmp": {"class_name": "Contract"},
+}
+_REQUIRED_OPTIONS: Dict[str, Tuple[str, ...]] = {"kmp": ("package",)}
+
+
+class BindingResult:
+    """The outcome of generating one spec set.
+
+    Exactly one of ``binding`` and ``error`` is set. ``key`` is the mapping key
+    the spec set was given under, or its position in the input iterable.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        binding: Optional[str] = None,
+        diagnostics: Optional[List[str]] = None,
+        error: Optional[BaseException] = None,
+    ):
+        self.key = key
+        self.binding = binding
+        self.diagnostics = diagnostics or []
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"<BindingResult [key={self.key!r}, {status}]>"
+
+
+def _render(
+    backend: str, spec_xdr: List[bytes], options: Dict[str, Any]
+) -> Tuple[str, List[str]]:
+    # Specs cross the process boundary as XDR: compact to pickle, and decoding
+    # gives the worker its own copy for the generator to rename in place.
+    specs = [xdr.SCSpecEntry.from_xdr_bytes(entry) for entry in spec_xdr]
+    generate, _ = _BACKENDS[backend]
+    return generate(specs, **options)
+
+
+def generate_many(
+    spec_sets: SpecSets,
+    backend: str,
+    max_workers: Optional[int] = None,
+    **options,
+) -> Iterator[BindingResult]:
+    """Generate bindings for every spec set, yielding results as they complete.
+
+    A spec set that fails to generate yields a result carrying the exception;
+    the rest of the batch carries on. Python bindings come back formatted with
+    black, as the ``python`` command writes them.
+
+    :param spec_sets: Spec entry lists, either as an iterable or as a mapping
+        whose keys (e.g. contract IDs) identify each result.
+    :param backend: One of ``python``, ``java``, ``flutter``, ``php``,
+        ``swift`` or ``kmp``.
+    :param max_workers: Worker processes to use, defaulting to one per CPU.
+        ``1`` generates in this process, in input order.
+    :param options: Backend options, named after the command's flags:
+        ``client_type``, ``runtime``, ``package``, ``class_name`` or
+        ``namespace``, plus each :class:`~.python.GeneratorOptions` option
+        (e.g. ``slots``) for the python backend.
+    :return: An iterator of :class:`BindingResult`, in completion order.
+    :raises ValueError: If the backend or an option is not recognized, or a
+        required option is missing.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    unknown = set(options) - set(_BACKENDS[backend][1])
+    if unknown:
+        raise ValueError(
+            f"Unknown option(s) for the {backend} backend: {sorted(unknown)}"
+        )
+    missing = set(_REQUIRED_OPTIONS.get(backend, ())) - set(options)
+    if missing:
+        raise ValueError(
+            f"Missing option(s) for the {backend} backend: {sorted(missing)}"
+        )
+    options = {**_DEFAULT_OPTIONS.get(backend, {}), **options}
+    items = (
+        spec_sets.items() if isinstance(spec_sets, Mapping) else enumerate(spec_sets)
+    )
+    if max_workers == 1:
+        return _generate_in_process(items, backend, options)
+    return _generate_in_pool(items, backend, options, max_workers)
+
+
+def _generate_in_process(
+    items: Iterable[Tuple[Hashable, List[xdr.SCSpecEntry]]],
+    backend: str,
+    options: Dict[str, Any],
+) -> Iterator[BindingResult]:
+    for key, specs in items:
+        try:
+            binding, diagnostics = _render(
+                backend, [entry.to_xdr_bytes() for entry in specs], options
+            )
+        except Exception as exc:
+            yield BindingResult(key, error=exc)
+        else:
+            yield BindingResult(key, binding, diagnostics)
+
+
+def _generate_in_pool(
+    items: Iterable[Tuple[Hashable, List[xdr.SCSpecEntry]]],
+    backend: str,
+    options: Dict[str, Any],
+    max_workers: Optional[int],
+) -> Iterator[BindingResult]:
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # Keep only a few items per worker in flight, so a batch the size of
+        # mainnet is not serialized into the pool's queue all at once.
+        window = max_workers * 4
+        items = iter(items)
+        pending: Dict[Future, Hashable] = {}
+        failed: List[BindingResult] = []
+
+        def submit_next() -> bool:
+            for key, specs in items:
+                try:
+                    spec_xdr = [entry.to_xdr_bytes() for entry in specs]
+                except Exception as exc:
+                    failed.append(BindingResult(key, error=exc))
+                    continue
+                pending[pool.submit(_render, backend, spec_xdr, options)] = key
+                return True
+            return False
+
+        for _ in range(window):
+            if not submit_next():
+                break
+        while pending or failed:
+            while failed:
+                yield failed.pop(0)
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    yield BindingResult(key, error=exc)
+                else:
+                    binding, diagnostics = future.result()
+                    yield BindingResult(key, binding, diagnostics)
+                submit_next()
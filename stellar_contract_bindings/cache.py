@@ -0,0 +1,161 @@
+"""On-disk cache of finished bindings.
+
+Generated bindings are a pure function of the contract code, the backend, the
+backend's options and the code of this package and stellar_sdk. Keyed on
+those, a cached entry can be handed back as-is, skipping the wasm download,
+generation and formatting. The key covers this package through a hash of its
+source files rather than its version string, so editing the generators or
+templates (a development checkout keeps one version across many changes) also
+misses the cache; stellar_sdk is covered by its version only. Deleting the
+``--cache-dir`` directory discards every entry.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from typing import Callable, Optional
+
+import click
+from stellar_sdk import __version__ as stellar_sdk_version
+
+from stellar_contract_bindings import __version__ as stellar_contract_bindings_version
+from stellar_contract_bindings.utils import get_code_hash_by_contract_id
+
+CACHE_DIR_ENV = "STELLAR_CONTRACT_BINDINGS_CACHE_DIR"
+
+
+@functools.lru_cache(maxsize=None)
+def _source_fingerprint() -> str:
+    """Hash the source files of this package, runtime and templates included."""
+    root = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for directory, subdirectories, names in os.walk(root):
+        subdirectories[:] = sorted(d for d in subdirectories if d != "__pycache__")
+        for name in sorted(names):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(directory, name)
+            digest.update(os.path.relpath(path, root).encode() + b"\0")
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def binding_cache_key(code_hash: bytes, backend: str, **options) -> str:
+    """Build the cache key for one generated binding.
+
+    :param code_hash: The wasm hash, see ``get_code_hash_by_contract_id``.
+    :param backend: The backend name, e.g. ``"python"``.
+    :param options: Every backend option that affects the output, e.g.
+        ``client_type``, ``package``, ``class_name`` or ``namespace``.
+    :return: A hex digest, safe to use as a file name.
+    """
+    payload = json.dumps(
+        {
+            "code_hash": code_hash.hex(),
+            "backend": backend,
+            "options": options,
+            "stellar_contract_bindings": stellar_contract_bindings_version,
+            "source": _source_fingerprint(),
+            "stellar_sdk": stellar_sdk_version,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class BindingCache:
+    """A directory of generated bindings, one file per cache key.
+
+    Entries are written to a temporary file and renamed into place, so a
+    concurrent reader (parallel CI jobs, web workers) sees either the whole
+    entry or none of it.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, content: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get_or_generate(
+        self, code_hash: bytes, backend: str, generate: Callable[[], str], **options
+    ) -> str:
+        """Return the cached binding, calling ``generate`` only on a miss.
+
+        Nothing is stored if ``generate`` raises.
+        """
+        key = binding_cache_key(code_hash, backend, **options)
+        content = self.get(key)
+        if content is None:
+            content = generate()
+            self.put(key, content)
+        return content
+
+
+class CachedBinding:
+    """The cache lookup for one CLI invocation.
+
+    ``content`` holds the finished binding on a hit and is None on a miss or
+    when caching is disabled; ``store`` is a no-op in the latter case, so a
+    command runs the same code path either way.
+    """
+
+    def __init__(self, cache: Optional[BindingCache], key: Optional[str]):
+        self.cache = cache
+        self.key = key
+        self.content = cache.get(key) if cache is not None and key else None
+
+    def store(self, content: str) -> None:
+        if self.cache is not None and self.key:
+            self.cache.put(self.key, content)
+
+
+def lookup_contract_binding(
+    cache_dir: Optional[str], contract_id: str, rpc_url: str, backend: str, **options
+) -> CachedBinding:
+    """Look up the binding for a deployed contract.
+
+    Resolving the key costs one ledger-entry read and nothing at all when
+    ``cache_dir`` is None.
+
+    :raises ValueError: If contract not found.
+    """
+    if not cache_dir:
+        return CachedBinding(None, None)
+    code_hash = get_code_hash_by_contract_id(contract_id, rpc_url)
+    return CachedBinding(
+        BindingCache(cache_dir), binding_cache_key(code_hash, backend, **options)
+    )
+
+
+cache_dir_option = click.option(
+    "--cache-dir",
+    default=None,
+    envvar=CACHE_DIR_ENV,
+    help=(
+        "Cache generated bindings in this directory, keyed by the contract's "
+        f"wasm hash, options and versions (or set ${CACHE_DIR_ENV})"
+    ),
+)
@@ -8,6 +8,7 @@ from stellar_sdk import __version__ as stellar_sdk_version, StrKey
 from stellar_sdk import xdr
 
 from stellar_contract_bindings import __version__ as stellar_contract_bindings_version
+from stellar_contract_bindings.cache import cache_dir_option, lookup_contract_binding
 from stellar_contract_bindings.utils import get_specs_by_contract_id
 
 
@@ -849,7 +850,10 @@ def generate_binding(specs: List[xdr.SCSpecEntry], package: str) -> str:
     default="org.stellar",
     help="Package name for generated bindings",
 )
-def command(contract_id: str, rpc_url: str, output: str, package: str):
+@cache_dir_option
+def command(
+    contract_id: str, rpc_url: str, output: str, package: str, cache_dir: str
+):
     """Generate Java bindings for a Soroban contract"""
     if not StrKey.is_valid_contract(contract_id):
         click.echo(f"Invalid contract ID: {contract_id}", err=True)
@@ -859,13 +863,22 @@ def command(contract_id: str, rpc_url: str, output: str, package: str):
     if output is None:
         output = os.getcwd()
     try:
-        specs = get_specs_by_contract_id(contract_id, rpc_url)
+        cached = lookup_contract_binding(
+            cache_dir, contract_id, rpc_url, "java", package=package
+        )
+        if cached.content is None:
+            specs = get_specs_by_contract_id(contract_id, rpc_url)
     except Exception as e:
         click.echo(f"Get contract specs failed: {e}", err=True)
         raise click.Abort()
 
-    click.echo("Generating Java bindings")
-    generated = generate_binding(specs, package=package)
+    if cached.content is not None:
+        click.echo("Using cached Java bindings")
+        generated = cached.content
+    else:
+        click.echo("Generating Java bindings")
+        generated = generate_binding(specs, package=package)
+        cached.store(generated)
 
     if not os.path.exists(output):
         os.makedirs(output)
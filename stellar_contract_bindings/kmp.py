@@ -8,6 +8,7 @@ from stellar_sdk import __version__ as stellar_sdk_version, StrKey
 from stellar_sdk import xdr
 
 from stellar_contract_bindings import __version__ as stellar_contract_bindings_version
+from stellar_contract_bindings.cache import cache_dir_option, lookup_contract_binding
 from stellar_contract_bindings.utils import get_specs_by_contract_id
 
 
@@ -1073,7 +1074,8 @@ def generate_binding(
     default="Contract",
     help="Name for the generated client class, defaults to 'Contract'",
 )
-def command(contract_id: str, rpc_url: str, output: str, package: str, class_name: str):
+@cache_dir_option
+def command(contract_id: str, rpc_url: str, output: str, package: str, class_name: str, cache_dir: str):
     """Generate Kotlin Multiplatform bindings for a Soroban contract"""
     if not StrKey.is_valid_contract(contract_id):
         click.echo(f"Invalid contract ID: {contract_id}", err=True)
@@ -1083,13 +1085,22 @@ def command(contract_id: str, rpc_url: str, output: str, package: str, class_nam
         output = os.getcwd()
 
     try:
-        specs = get_specs_by_contract_id(contract_id, rpc_url)
+        cached = lookup_contract_binding(
+            cache_dir, contract_id, rpc_url, "kmp", package=package, class_name=class_name
+        )
+        if cached.content is None:
+            specs = get_specs_by_contract_id(contract_id, rpc_url)
     except Exception as e:
         click.echo(f"Get contract specs failed: {e}", err=True)
         raise click.Abort()
 
-    click.echo("Generating Kotlin Multiplatform bindings")
-    generated = generate_binding(specs, package=package, class_name=class_name)
+    if cached.content is not None:
+        click.echo("Using cached Kotlin Multiplatform bindings")
+        generated = cached.content
+    else:
+        click.echo("Generating Kotlin Multiplatform bindings")
+        generated = generate_binding(specs, package=package, class_name=class_name)
+        cached.store(generated)
 
     package_dir = os.path.join(output, *package.split("."))
     if not os.path.exists(package_dir):
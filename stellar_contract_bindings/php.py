@@ -8,6 +8,7 @@ from stellar_sdk import __version__ as stellar_sdk_version, StrKey
 from stellar_sdk import xdr
 
 from stellar_contract_bindings import __version__ as stellar_contract_bindings_version
+from stellar_contract_bindings.cache import cache_dir_option, lookup_contract_binding
 from stellar_contract_bindings.utils import get_specs_by_contract_id
 
 # Minimum Soneso stellar-php-sdk version providing the SorobanClient API the
@@ -940,7 +941,8 @@ def generate_binding(specs: List[xdr.SCSpecEntry], namespace: str = "GeneratedCo
     default="ContractClient",
     help="Name for the generated client class",
 )
-def command(contract_id: str, rpc_url: str, output: str, namespace: str, class_name: str):
+@cache_dir_option
+def command(contract_id: str, rpc_url: str, output: str, namespace: str, class_name: str, cache_dir: str):
     """Generate PHP bindings for a Soroban contract"""
     if not StrKey.is_valid_contract(contract_id):
         click.echo(f"Invalid contract ID: {contract_id}", err=True)
@@ -951,13 +953,22 @@ def command(contract_id: str, rpc_url: str, output: str, namespace: str, class_n
         output = os.getcwd()
     
     try:
-        specs = get_specs_by_contract_id(contract_id, rpc_url)
+        cached = lookup_contract_binding(
+            cache_dir, contract_id, rpc_url, "php", namespace=namespace, class_name=class_name
+        )
+        if cached.content is None:
+            specs = get_specs_by_contract_id(contract_id, rpc_url)
     except Exception as e:
         click.echo(f"Get contract specs failed: {e}", err=True)
         raise click.Abort()
 
-    click.echo("Generating PHP bindings")
-    generated = generate_binding(specs, namespace=namespace, contract_name=class_name)
+    if cached.content is not None:
+        click.echo("Using cached PHP bindings")
+        generated = cached.content
+    else:
+        click.echo("Generating PHP bindings")
+        generated = generate_binding(specs, namespace=namespace, contract_name=class_name)
+        cached.store(generated)
     
     if not os.path.exists(output):
         os.makedirs(output)
@@ -1,19 +1,21 @@
 import ast
 import builtins
+import json
 import keyword
 import os
 import re
 import unicodedata
-from typing import Callable, List, Tuple
+from typing import AbstractSet, Callable, List, Mapping, Tuple
 
 import black
 
 import click
 from jinja2 import Environment, Template
 from stellar_sdk import __version__ as stellar_sdk_version, StrKey
-from stellar_sdk import xdr
+from stellar_sdk import scval, xdr
 
 from stellar_contract_bindings import __version__ as stellar_contract_bindings_version
+from stellar_contract_bindings.cache import cache_dir_option, lookup_contract_binding
 from stellar_contract_bindings.utils import get_specs_by_contract_id
 
 UdtNameResolver = Callable[[str], str]
@@ -22,6 +24,7 @@ _GENERATED_MODULE_NAMES = {
     "Address",
     "AssembledTransaction",
     "AssembledTransactionAsync",
+    "ClassVar",
     "Client",
     "ClientAsync",
     "ContractClient",
@@ -31,8 +34,10 @@ _GENERATED_MODULE_NAMES = {
     "Enum",
     "EventInfo",
     "IntEnum",
+    "Iterable",
     "Keypair",
     "List",
+    "Mapping",
     "MuxedAccount",
     "NULL_ACCOUNT",
     "Optional",
@@ -41,14 +46,53 @@ _GENERATED_MODULE_NAMES = {
     "Union",
     "UnparsedEventError",
     "_EVENTS",
+    "_LAZY",
+    "_TYPE_CHECKING",
+    "_address_from_json",
+    "_address_from_raw",
+    "_address_from_scval",
+    "_address_from_strkey",
+    "_address_to_scval",
+    "_address_topic",
+    "_EVENT_INDEX",
+    "_MAX_EVENT_TOPICS",
+    "_EVENT_TOPIC_KEYS",
     "_coerce_event_scval",
+    "_event_dispatch_key",
     "_event_topics_and_data",
+    "_event_topics_and_raw_data",
     "_from_error_scval",
+    "_importlib",
+    "_json_address",
+    "_json_string",
     "_logger",
+    "_pkg",
+    "_static_topic_key",
+    "_static_topic_keys",
     "_static_topic_matches",
+    "_struct_values",
+    "_xdr_decode",
+    "_xdr_mismatch",
+    "_xdr_read_address",
+    "_xdr_read_as",
+    "_xdr_read_bool",
+    "_xdr_read_header",
+    "_xdr_read_int",
+    "_xdr_read_interned_symbol",
+    "_xdr_read_opaque",
+    "_xdr_read_symbol",
+    "_xdr_read_view",
+    "_xdr_write_bool",
+    "_xdr_write_header",
+    "_xdr_write_int",
+    "_xdr_write_opaque",
+    "address_cache_stats",
+    "array",
+    "functools",
     "logging",
     "parse_event",
     "scval",
+    "sys",
     "xdr",
 }
 _RESERVED_MODULE_NAMES = frozenset(dir(builtins)) | _GENERATED_MODULE_NAMES
@@ -242,11 +286,14 @@ def to_py_type(
     td: xdr.SCSpecTypeDef,
     input_type: bool = False,
     resolve_udt_name: UdtNameResolver = _default_udt_name,
+    codecs: "CodecFunctions | None" = None,
 ):
     def recur(inner: xdr.SCSpecTypeDef) -> str:
-        return to_py_type(inner, input_type, resolve_udt_name)
+        return to_py_type(inner, input_type, resolve_udt_name, codecs)
 
     t = td.type
+    if _decodes_to_view(td, codecs):
+        return "Union[bytes, memoryview]" if input_type else "memoryview"
     if t in _PY_TYPES:
         return _PY_TYPES[t]
     if t in _ADDRESS_TYPES:
@@ -255,9 +302,20 @@ def to_py_type(
         return f"Optional[{recur(td.option.value_type)}]"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_RESULT:
         return f"Union[{recur(td.result.ok_type)}, {recur(td.result.error_type)}]"
+    # mypy checks mypyc output, and List and Dict are invariant: a decoded
+    # List[Address] is not a List[Union[Address, str]]. Its inputs take the
+    # covariant Sequence and Mapping instead, whose keys stay as decoded.
+    covariant = input_type and codecs is not None and codecs.mypyc
     if t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+        if not input_type and _decodes_to_array(td, codecs):
+            return "array.array[int]"
+        if covariant:
+            return f"Sequence[{recur(td.vec.element_type)}]"
         return f"List[{recur(td.vec.element_type)}]"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
+        if covariant:
+            key_type = to_py_type(td.map.key_type, False, resolve_udt_name, codecs)
+            return f"Mapping[{key_type}, {recur(td.map.value_type)}]"
         return f"Dict[{recur(td.map.key_type)}, {recur(td.map.value_type)}]"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_TUPLE:
         if len(td.tuple.value_types) == 0:
@@ -273,9 +331,25 @@ def to_scval(
     td: xdr.SCSpecTypeDef,
     name: str,
     resolve_udt_name: UdtNameResolver = _default_udt_name,
+    codecs: "CodecFunctions | None" = None,
 ):
+    """Return an expression encoding the Python value ``name`` as ``td``.
+
+    With ``codecs``, composite types become calls to its shared functions.
+    """
+    if codecs is not None and codecs.handles(td):
+        return codecs.encode(td, name, resolve_udt_name)
+    return _to_scval_expr(td, name, resolve_udt_name, codecs)
+
+
+def _to_scval_expr(
+    td: xdr.SCSpecTypeDef,
+    name: str,
+    resolve_udt_name: UdtNameResolver,
+    codecs: "CodecFunctions | None",
+) -> str:
     def recur(inner: xdr.SCSpecTypeDef, inner_name: str) -> str:
-        return to_scval(inner, inner_name, resolve_udt_name)
+        return to_scval(inner, inner_name, resolve_udt_name, codecs)
 
     t = td.type
     if t == xdr.SCSpecType.SC_SPEC_TYPE_VAL:
@@ -284,6 +358,11 @@ def to_scval(
         return "scval.to_void()"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_ERROR:
         return f"xdr.SCVal(xdr.SCValType.SCV_ERROR, error={name})"
+    if _decodes_to_view(td, codecs):
+        # The SDK only packs bytes; bytes() of a bytes value is not a copy.
+        return f"scval.to_bytes(bytes({name}))"
+    if t in _ADDRESS_TYPES:
+        return f"_address_to_scval({name})"
     if t in _SCVAL_CODECS:
         return f"scval.to_{_SCVAL_CODECS[t]}({name})"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
@@ -320,9 +399,40 @@ def from_scval(
     td: xdr.SCSpecTypeDef,
     name: str,
     resolve_udt_name: UdtNameResolver = _default_udt_name,
+    depth: int = 0,
+    codecs: "CodecFunctions | None" = None,
 ):
+    """Return an expression decoding the SCVal expression ``name`` as ``td``.
+
+    With ``codecs``, composite types become calls to its shared functions.
+    Otherwise they are expanded inline, and ``name`` is evaluated once. Where
+    the expression needs the value more than once, it binds it to
+    ``_scv<depth>``, so nested values never re-evaluate an outer one and
+    siblings, which run one after another, can share the name. Children are
+    only ever handed plain names or subscripts of them, which keeps assignment
+    expressions out of the comprehension iterables that ``Vec`` and ``Map``
+    build.
+    """
+    if codecs is not None and codecs.handles(td):
+        return codecs.decode(td, name, resolve_udt_name)
+    return _from_scval_expr(td, name, resolve_udt_name, depth, codecs)
+
+
+def _from_scval_expr(
+    td: xdr.SCSpecTypeDef,
+    name: str,
+    resolve_udt_name: UdtNameResolver,
+    depth: int,
+    codecs: "CodecFunctions | None",
+) -> str:
     def recur(inner: xdr.SCSpecTypeDef, inner_name: str) -> str:
-        return from_scval(inner, inner_name, resolve_udt_name)
+        return from_scval(inner, inner_name, resolve_udt_name, depth + 1, codecs)
+
+    def bind(expr: str) -> Tuple[str, str]:
+        # The first use binds the value; the later ones read it back.
+        if expr.isidentifier():
+            return expr, expr
+        return f"(_scv{depth} := {expr})", f"_scv{depth}"
 
     t = td.type
     if t == xdr.SCSpecType.SC_SPEC_TYPE_VAL:
@@ -331,18 +441,35 @@ def from_scval(
         return f"scval.from_void({name})"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_ERROR:
         return f"_from_error_scval({name})"
+    if _decodes_to_view(td, codecs):
+        return f"memoryview(scval.from_bytes({name}))"
+    if t in _ADDRESS_TYPES:
+        return f"_address_from_scval({name})"
+    if _interns_symbol(td, codecs):
+        return f"sys.intern(scval.from_symbol({name}))"
     if t in _SCVAL_CODECS:
         return f"scval.from_{_SCVAL_CODECS[t]}({name})"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
-        return f"{recur(td.option.value_type, name)} if {name}.type != xdr.SCValType.SCV_VOID else scval.from_void({name})"
+        # The condition runs first, so it is where the value gets bound.
+        first, value = bind(name)
+        return f"{recur(td.option.value_type, value)} if {first}.type != xdr.SCValType.SCV_VOID else None"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_RESULT:
+        first, value = bind(name)
         return (
-            f"{recur(td.result.error_type, name)} "
-            f"if {name}.type == xdr.SCValType.SCV_ERROR else "
-            f"{recur(td.result.ok_type, name)}"
+            f"{recur(td.result.error_type, value)} "
+            f"if {first}.type == xdr.SCValType.SCV_ERROR else "
+            f"{recur(td.result.ok_type, value)}"
         )
     if t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
-        return f"[{recur(td.vec.element_type, 'e')} for e in scval.from_vec({name})]"
+        element = td.vec.element_type
+        if element.type == xdr.SCSpecType.SC_SPEC_TYPE_UDT:
+            # Generated types decode a whole vector at once.
+            udt = resolve_udt_name(element.udt.name.decode())
+            return f"{udt}.from_scval_many(scval.from_vec({name}))"
+        items = f"[{recur(element, 'e')} for e in scval.from_vec({name})]"
+        if _decodes_to_array(td, codecs):
+            return f"array.array({_ARRAY_TYPECODES[element.type]!r}, {items})"
+        return items
     if t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
         return (
             f"{{{recur(td.map.key_type, 'k')}: {recur(td.map.value_type, 'v')} "
@@ -351,24 +478,856 @@ def from_scval(
     if t == xdr.SCSpecType.SC_SPEC_TYPE_TUPLE:
         if len(td.tuple.value_types) == 0:
             return "None"
-        elements = f"scval.from_tuple_struct({name})"
+        # Decode the vector once and index into it; the elements come from a
+        # lambda parameter because a tuple has no condition to bind in.
+        elements = f"_scv{depth}"
         values = [
             recur(v, f"{elements}[{i}]") for i, v in enumerate(td.tuple.value_types)
         ]
-        return f"({', '.join(values)})"
+        return f"(lambda {elements}: ({', '.join(values)},))(scval.from_tuple_struct({name}))"
     if t == xdr.SCSpecType.SC_SPEC_TYPE_UDT:
         return f"{resolve_udt_name(td.udt.name.decode())}.from_scval({name})"
     raise ValueError(f"Unsupported SCValType: {t}")
 
 
-def _codec_helpers(resolve_udt_name: UdtNameResolver) -> dict:
-    """Template context for the three type mappers, bound to one resolver."""
+def _scv_tag(value_type: xdr.SCValType) -> bytes:
+    return value_type.value.to_bytes(4, "big")
+
+
+# Integer SCSpecTypes: the SCVal tag of each, and the width and signedness of
+# the big-endian integer that follows the tag on the wire. The 128- and 256-bit
+# parts are stored high to low, so they read as one integer of the full width.
+_XDR_INTS = {
+    xdr.SCSpecType.SC_SPEC_TYPE_U32: (_scv_tag(xdr.SCValType.SCV_U32), 4, False),
+    xdr.SCSpecType.SC_SPEC_TYPE_I32: (_scv_tag(xdr.SCValType.SCV_I32), 4, True),
+    xdr.SCSpecType.SC_SPEC_TYPE_U64: (_scv_tag(xdr.SCValType.SCV_U64), 8, False),
+    xdr.SCSpecType.SC_SPEC_TYPE_I64: (_scv_tag(xdr.SCValType.SCV_I64), 8, True),
+    xdr.SCSpecType.SC_SPEC_TYPE_TIMEPOINT: (
+        _scv_tag(xdr.SCValType.SCV_TIMEPOINT),
+        8,
+        False,
+    ),
+    xdr.SCSpecType.SC_SPEC_TYPE_DURATION: (
+        _scv_tag(xdr.SCValType.SCV_DURATION),
+        8,
+        False,
+    ),
+    xdr.SCSpecType.SC_SPEC_TYPE_U128: (_scv_tag(xdr.SCValType.SCV_U128), 16, False),
+    xdr.SCSpecType.SC_SPEC_TYPE_I128: (_scv_tag(xdr.SCValType.SCV_I128), 16, True),
+    xdr.SCSpecType.SC_SPEC_TYPE_U256: (_scv_tag(xdr.SCValType.SCV_U256), 32, False),
+    xdr.SCSpecType.SC_SPEC_TYPE_I256: (_scv_tag(xdr.SCValType.SCV_I256), 32, True),
+}
+
+# SCSpecTypes carried as length-prefixed, zero-padded opaque data.
+_XDR_OPAQUES = {
+    xdr.SCSpecType.SC_SPEC_TYPE_BYTES: _scv_tag(xdr.SCValType.SCV_BYTES),
+    xdr.SCSpecType.SC_SPEC_TYPE_BYTES_N: _scv_tag(xdr.SCValType.SCV_BYTES),
+    xdr.SCSpecType.SC_SPEC_TYPE_STRING: _scv_tag(xdr.SCValType.SCV_STRING),
+    xdr.SCSpecType.SC_SPEC_TYPE_SYMBOL: _scv_tag(xdr.SCValType.SCV_SYMBOL),
+}
+
+_XDR_VEC = _scv_tag(xdr.SCValType.SCV_VEC)
+_XDR_MAP = _scv_tag(xdr.SCValType.SCV_MAP)
+_XDR_VOID = _scv_tag(xdr.SCValType.SCV_VOID)
+
+# Composite types with a reader or writer function of their own. Map writers
+# are left to scval.to_map, which puts the keys in Soroban's order, and
+# results always go through xdr.SCVal.
+_XDR_READ_TYPES = frozenset(
+    {
+        xdr.SCSpecType.SC_SPEC_TYPE_OPTION,
+        xdr.SCSpecType.SC_SPEC_TYPE_VEC,
+        xdr.SCSpecType.SC_SPEC_TYPE_MAP,
+        xdr.SCSpecType.SC_SPEC_TYPE_TUPLE,
+    }
+)
+_XDR_WRITE_TYPES = frozenset(
+    {
+        xdr.SCSpecType.SC_SPEC_TYPE_OPTION,
+        xdr.SCSpecType.SC_SPEC_TYPE_VEC,
+        xdr.SCSpecType.SC_SPEC_TYPE_TUPLE,
+    }
+)
+
+
+def _xdr_header(tag: bytes, count: int) -> bytes:
+    """The tag, present flag and length that open an SCVal vector or map."""
+    return tag + (1).to_bytes(4, "big") + count.to_bytes(4, "big")
+
+
+def _bytes_literal(value: bytes) -> str:
+    """A bytes literal spelling every byte but letters, digits and ``_`` in hex.
+
+    repr() would show tags such as SCV_I128 as ``\\n``, hiding the byte value.
+    """
+    chars = []
+    for byte in value:
+        char = chr(byte)
+        if char.isascii() and (char.isalnum() or char == "_"):
+            chars.append(char)
+        else:
+            chars.append(f"\\x{byte:02x}")
+    return 'b"' + "".join(chars) + '"'
+
+
+def _xdr_symbol(text: str) -> bytes:
+    symbol = xdr.SCSymbol(text.encode())
+    return xdr.SCVal(xdr.SCValType.SCV_SYMBOL, sym=symbol).to_xdr_bytes()
+
+
+def read_xdr(
+    td: xdr.SCSpecTypeDef,
+    pos: str,
+    resolve_udt_name: UdtNameResolver = _default_udt_name,
+    codecs: "CodecFunctions | None" = None,
+) -> str:
+    """Return an expression reading ``td`` from the XDR bytes ``data``.
+
+    The expression starts at offset ``pos`` and evaluates to the decoded value
+    and the offset just past it. Scalars, UDTs and, with ``codecs``, vectors,
+    maps, options and tuples are read straight from the bytes; anything else is
+    unpacked as an ``xdr.SCVal`` and decoded as :func:`from_scval` would.
+    """
+    t = td.type
+    if t in _XDR_INTS:
+        tag, size, signed = _XDR_INTS[t]
+        return f"_xdr_read_int(data, {pos}, {_bytes_literal(tag)}, {size}, {signed})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_SYMBOL:
+        if _interns_symbol(td, codecs):
+            return f"_xdr_read_interned_symbol(data, {pos})"
+        return f"_xdr_read_symbol(data, {pos})"
+    if _decodes_to_view(td, codecs):
+        return f"_xdr_read_view(data, {pos}, {_bytes_literal(_XDR_OPAQUES[t])})"
+    if t in _XDR_OPAQUES:
+        return f"_xdr_read_opaque(data, {pos}, {_bytes_literal(_XDR_OPAQUES[t])})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_BOOL:
+        return f"_xdr_read_bool(data, {pos})"
+    if t in _ADDRESS_TYPES:
+        return f"_xdr_read_address(data, {pos})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_UDT:
+        return f"{resolve_udt_name(td.udt.name.decode())}._read_xdr(data, {pos})"
+    if codecs is not None and codecs.handles(td):
+        if t in _XDR_READ_TYPES:
+            return f"{codecs.reader(td, resolve_udt_name)}(data, {pos})"
+        return f"_xdr_read_as({codecs.decoder(td, resolve_udt_name)}, data, {pos})"
+    decode = from_scval(td, "val", resolve_udt_name, codecs=codecs)
+    return f"_xdr_read_as(lambda val: {decode}, data, {pos})"
+
+
+def write_xdr(
+    td: xdr.SCSpecTypeDef,
+    name: str,
+    resolve_udt_name: UdtNameResolver = _default_udt_name,
+    codecs: "CodecFunctions | None" = None,
+) -> str:
+    """Return a statement appending the XDR of the Python value ``name`` to ``out``.
+
+    The counterpart of :func:`read_xdr`: what it cannot write directly is
+    encoded with :func:`to_scval` and packed.
+    """
+    t = td.type
+    if t in _XDR_INTS:
+        tag, size, signed = _XDR_INTS[t]
+        return f"_xdr_write_int(out, {name}, {_bytes_literal(tag)}, {size}, {signed})"
+    if t in _XDR_OPAQUES:
+        return f"_xdr_write_opaque(out, {name}, {_bytes_literal(_XDR_OPAQUES[t])})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_BOOL:
+        return f"_xdr_write_bool(out, {name})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_UDT:
+        return f"{name}._write_xdr(out)"
+    if codecs is not None and codecs.handles(td) and t in _XDR_WRITE_TYPES:
+        return f"{codecs.writer(td, resolve_udt_name)}(out, {name})"
+    encode = to_scval(td, name, resolve_udt_name, codecs)
+    if " if " in encode:
+        encode = f"({encode})"
+    return f"out.append({encode}.to_xdr_bytes())"
+
+
+# The array typecode holding each integer type a Vec can decode into; none
+# is wide enough for the 128- and 256-bit types.
+_ARRAY_TYPECODES = {
+    xdr.SCSpecType.SC_SPEC_TYPE_U32: "I",
+    xdr.SCSpecType.SC_SPEC_TYPE_I32: "i",
+    xdr.SCSpecType.SC_SPEC_TYPE_U64: "Q",
+    xdr.SCSpecType.SC_SPEC_TYPE_I64: "q",
+    xdr.SCSpecType.SC_SPEC_TYPE_TIMEPOINT: "Q",
+    xdr.SCSpecType.SC_SPEC_TYPE_DURATION: "Q",
+}
+
+
+def _decodes_to_array(td: xdr.SCSpecTypeDef, codecs: "CodecFunctions | None") -> bool:
+    return (
+        codecs is not None
+        and codecs.arrays
+        and td.type == xdr.SCSpecType.SC_SPEC_TYPE_VEC
+        and td.vec.element_type.type in _ARRAY_TYPECODES
+    )
+
+
+def _decodes_to_view(td: xdr.SCSpecTypeDef, codecs: "CodecFunctions | None") -> bool:
+    return (
+        codecs is not None
+        and codecs.memoryviews
+        and td.type
+        in (xdr.SCSpecType.SC_SPEC_TYPE_BYTES, xdr.SCSpecType.SC_SPEC_TYPE_BYTES_N)
+    )
+
+
+def _interns_symbol(td: xdr.SCSpecTypeDef, codecs: "CodecFunctions | None") -> bool:
+    return (
+        codecs is not None
+        and codecs.intern_symbols
+        and td.type == xdr.SCSpecType.SC_SPEC_TYPE_SYMBOL
+    )
+
+
+# Scalar SCSpecTypes whose Python values are already JSON-native.
+_JSON_NATIVE_TYPES = frozenset(
+    set(_XDR_INTS)
+    | {xdr.SCSpecType.SC_SPEC_TYPE_BOOL, xdr.SCSpecType.SC_SPEC_TYPE_SYMBOL}
+)
+
+
+def _option_value(td: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    # Option<Option<T>> has a single None, as both levels encode to void, so
+    # one check covers every level.
+    while td.option.value_type.type == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+        td = td.option.value_type
+    return td.option.value_type
+
+
+def to_json(
+    td: xdr.SCSpecTypeDef,
+    name: str,
+    resolve_udt_name: UdtNameResolver = _default_udt_name,
+    codecs: "CodecFunctions | None" = None,
+    depth: int = 0,
+) -> str:
+    """Return an expression converting the Python value ``name`` to JSON-native values.
+
+    Integers and booleans are kept, bytes become hex strings, strings, symbols
+    and addresses become ``str``, vectors and tuples lists, maps lists of
+    ``[key, value]`` pairs, and generated types whatever their ``to_dict``
+    returns. ``Val``, ``Error`` and ``Result`` values, which have no natural
+    JSON form, become their base64 SCVal XDR. :func:`from_json` reverses it.
+    """
+
+    def recur(inner: xdr.SCSpecTypeDef, inner_name: str) -> str:
+        return to_json(inner, inner_name, resolve_udt_name, codecs, depth + 1)
+
+    t = td.type
+    if t in (xdr.SCSpecType.SC_SPEC_TYPE_VAL, xdr.SCSpecType.SC_SPEC_TYPE_ERROR):
+        return f"{name}.to_xdr()"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_VOID:
+        return "None"
+    if t in _JSON_NATIVE_TYPES:
+        return name
+    if t in (xdr.SCSpecType.SC_SPEC_TYPE_BYTES, xdr.SCSpecType.SC_SPEC_TYPE_BYTES_N):
+        return f"{name}.hex()"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_STRING:
+        return f"_json_string({name})"
+    if t in _ADDRESS_TYPES:
+        return f"_json_address({name})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+        return f"(None if {name} is None else {recur(_option_value(td), name)})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_RESULT:
+        return f"({to_scval(td, name, resolve_udt_name, codecs)}).to_xdr()"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+        element = f"e{depth}"
+        value = recur(td.vec.element_type, element)
+        if value == element:
+            return f"list({name})"
+        return f"[{value} for {element} in {name}]"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
+        key, value = f"k{depth}", f"v{depth}"
+        return (
+            f"[[{recur(td.map.key_type, key)}, {recur(td.map.value_type, value)}] "
+            f"for {key}, {value} in {name}.items()]"
+        )
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_TUPLE:
+        if len(td.tuple.value_types) == 0:
+            return "None"
+        values = [recur(v, f"{name}[{i}]") for i, v in enumerate(td.tuple.value_types)]
+        return f"[{', '.join(values)}]"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_UDT:
+        return f"{name}.to_dict()"
+    raise ValueError(f"Unsupported SCValType: {t}")
+
+
+def from_json(
+    td: xdr.SCSpecTypeDef,
+    name: str,
+    resolve_udt_name: UdtNameResolver = _default_udt_name,
+    codecs: "CodecFunctions | None" = None,
+    depth: int = 0,
+) -> str:
+    """Return an expression rebuilding a value of ``td`` from :func:`to_json` output."""
+
+    def recur(inner: xdr.SCSpecTypeDef, inner_name: str) -> str:
+        return from_json(inner, inner_name, resolve_udt_name, codecs, depth + 1)
+
+    t = td.type
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_VAL:
+        return f"xdr.SCVal.from_xdr({name})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_ERROR:
+        return f"xdr.SCError.from_xdr({name})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_VOID:
+        return "None"
+    if t in _JSON_NATIVE_TYPES:
+        return name
+    if t in (xdr.SCSpecType.SC_SPEC_TYPE_BYTES, xdr.SCSpecType.SC_SPEC_TYPE_BYTES_N):
+        if _decodes_to_view(td, codecs):
+            return f"memoryview(bytes.fromhex({name}))"
+        return f"bytes.fromhex({name})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_STRING:
+        return f'{name}.encode("utf-8", "surrogateescape")'
+    if t in _ADDRESS_TYPES:
+        # Through a cache, so repeated accounts parse once.
+        return f"_address_from_json({name})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+        return f"(None if {name} is None else {recur(_option_value(td), name)})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_RESULT:
+        value = f"xdr.SCVal.from_xdr({name})"
+        return from_scval(td, value, resolve_udt_name, codecs=codecs)
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+        if _decodes_to_array(td, codecs):
+            return f"array.array({_ARRAY_TYPECODES[td.vec.element_type.type]!r}, {name})"
+        element = f"e{depth}"
+        value = recur(td.vec.element_type, element)
+        if value == element:
+            return f"list({name})"
+        return f"[{value} for {element} in {name}]"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
+        key, value = f"k{depth}", f"v{depth}"
+        return (
+            f"{{{recur(td.map.key_type, key)}: {recur(td.map.value_type, value)} "
+            f"for {key}, {value} in {name}}}"
+        )
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_TUPLE:
+        if len(td.tuple.value_types) == 0:
+            return "None"
+        values = [recur(v, f"{name}[{i}]") for i, v in enumerate(td.tuple.value_types)]
+        return f"({', '.join(values)},)"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_UDT:
+        return f"{resolve_udt_name(td.udt.name.decode())}.from_dict({name})"
+    raise ValueError(f"Unsupported SCValType: {t}")
+
+
+def _tuple_of(types: List[xdr.SCSpecTypeDef]) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_TUPLE, tuple=xdr.SCSpecTypeTuple(value_types=types)
+    )
+
+
+def _optional(td: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_OPTION, option=xdr.SCSpecTypeOption(value_type=td)
+    )
+
+
+def _holds_view(td: xdr.SCSpecTypeDef, codecs: "CodecFunctions | None") -> bool:
+    t = td.type
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+        return _holds_view(td.option.value_type, codecs)
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_RESULT:
+        return _holds_view(td.result.ok_type, codecs)
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+        return _holds_view(td.vec.element_type, codecs)
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
+        return _holds_view(td.map.key_type, codecs) or _holds_view(
+            td.map.value_type, codecs
+        )
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_TUPLE:
+        return any(_holds_view(v, codecs) for v in td.tuple.value_types)
+    return _decodes_to_view(td, codecs)
+
+
+def to_pickle(
+    td: xdr.SCSpecTypeDef,
+    name: str,
+    resolve_udt_name: UdtNameResolver = _default_udt_name,
+    codecs: "CodecFunctions | None" = None,
+    depth: int = 0,
+) -> str:
+    """Return an expression for the Python value ``name`` that pickle accepts.
+
+    Pickle rejects ``memoryview``, so values decoded into views are copied to
+    ``bytes``, inside containers too; unpickling then gives the constructor
+    bytes, which it accepts in place of views. Anything else, generated types
+    included, is pickled as it is.
+    """
+
+    def recur(inner: xdr.SCSpecTypeDef, inner_name: str) -> str:
+        return to_pickle(inner, inner_name, resolve_udt_name, codecs, depth + 1)
+
+    if not _holds_view(td, codecs):
+        return name
+    t = td.type
+    if _decodes_to_view(td, codecs):
+        return f"bytes({name})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+        return f"(None if {name} is None else {recur(td.option.value_type, name)})"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_RESULT:
+        error_t = td.result.error_type
+        error_type = (
+            "xdr.SCError"
+            if error_t.type == xdr.SCSpecType.SC_SPEC_TYPE_ERROR
+            else to_py_type(error_t, True, resolve_udt_name)
+        )
+        return (
+            f"({name} if isinstance({name}, {error_type}) "
+            f"else {recur(td.result.ok_type, name)})"
+        )
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+        element = f"e{depth}"
+        return f"[{recur(td.vec.element_type, element)} for {element} in {name}]"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
+        key, value = f"k{depth}", f"v{depth}"
+        return (
+            f"{{{recur(td.map.key_type, key)}: {recur(td.map.value_type, value)} "
+            f"for {key}, {value} in {name}.items()}}"
+        )
+    values = [recur(v, f"{name}[{i}]") for i, v in enumerate(td.tuple.value_types)]
+    return f"({', '.join(values)},)"
+
+
+def _codec_helpers(
+    resolve_udt_name: UdtNameResolver, codecs: "CodecFunctions | None" = None
+) -> dict:
+    """Template context for the type mappers, bound to one resolver."""
     return {
         "to_py_type": lambda td, input_type=False: to_py_type(
-            td, input_type, resolve_udt_name
+            td, input_type, resolve_udt_name, codecs
+        ),
+        "to_scval": lambda td, name: to_scval(td, name, resolve_udt_name, codecs),
+        "from_scval": lambda td, name: from_scval(
+            td, name, resolve_udt_name, codecs=codecs
         ),
-        "to_scval": lambda td, name: to_scval(td, name, resolve_udt_name),
-        "from_scval": lambda td, name: from_scval(td, name, resolve_udt_name),
+        "read_xdr": lambda td, pos: read_xdr(td, pos, resolve_udt_name, codecs),
+        "write_xdr": lambda td, name: write_xdr(td, name, resolve_udt_name, codecs),
+        "to_json": lambda td, name: to_json(td, name, resolve_udt_name, codecs),
+        "from_json": lambda td, name: from_json(td, name, resolve_udt_name, codecs),
+        "to_pickle": lambda td, name: to_pickle(td, name, resolve_udt_name, codecs),
+    }
+
+
+# Types whose codecs CodecFunctions turns into module-level functions. The
+# empty tuple is excluded below: it encodes to a constant and decodes to None.
+_COMPOSITE_TYPES = frozenset(
+    {
+        xdr.SCSpecType.SC_SPEC_TYPE_OPTION,
+        xdr.SCSpecType.SC_SPEC_TYPE_RESULT,
+        xdr.SCSpecType.SC_SPEC_TYPE_VEC,
+        xdr.SCSpecType.SC_SPEC_TYPE_MAP,
+        xdr.SCSpecType.SC_SPEC_TYPE_TUPLE,
+    }
+)
+
+
+def type_shape_name(td: xdr.SCSpecTypeDef) -> str:
+    """A readable identifier fragment for a type, e.g. ``vec_map_address_i128``."""
+    t = td.type
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+        return f"option_{type_shape_name(td.option.value_type)}"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_RESULT:
+        ok, error = td.result.ok_type, td.result.error_type
+        return f"result_{type_shape_name(ok)}_{type_shape_name(error)}"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+        return f"vec_{type_shape_name(td.vec.element_type)}"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
+        key, value = td.map.key_type, td.map.value_type
+        return f"map_{type_shape_name(key)}_{type_shape_name(value)}"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_TUPLE:
+        return "_".join(["tuple"] + [type_shape_name(v) for v in td.tuple.value_types])
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_BYTES_N:
+        return f"bytes{td.bytes_n.n.uint32}"
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_UDT:
+        return camel_to_snake(_default_udt_name(td.udt.name.decode())).strip("_")
+    return t.name.removeprefix("SC_SPEC_TYPE_").lower()
+
+
+class CodecFunctions:
+    """The shared codec functions of one generated module.
+
+    Every distinct composite type the module encodes or decodes gets one
+    module-level function per direction, named after its shape (e.g.
+    ``_dec_vec_map_address_i128``), which structs, unions, events and clients
+    all call instead of each inlining the expression. The byte-level codecs
+    behind ``from_xdr_bytes`` and ``to_xdr_bytes`` get ``_read_`` and
+    ``_write_`` functions the same way. Functions are created on first use;
+    :meth:`render` returns their definitions.
+
+    :param reserved: Module-level names the functions must not take.
+    :param arrays: Decode vectors of 32- and 64-bit integers into
+        ``array.array`` rather than lists (see :class:`GeneratorOptions`).
+    :param memoryviews: Decode ``Bytes`` and ``BytesN`` into ``memoryview``
+        rather than ``bytes`` (see :class:`GeneratorOptions`).
+    :param mypyc: Give every decoder passed as a value, such as a client's
+        ``parse_result_xdr_fn``, a function of its own rather than a lambda
+        (see :class:`GeneratorOptions`).
+    :param intern_symbols: Decode ``Symbol`` values through ``sys.intern``
+        (see :class:`GeneratorOptions`).
+    """
+
+    def __init__(
+        self,
+        reserved: frozenset[str] | set[str] = frozenset(),
+        arrays: bool = False,
+        memoryviews: bool = False,
+        mypyc: bool = False,
+        intern_symbols: bool = False,
+    ):
+        self.arrays = arrays
+        self.memoryviews = memoryviews
+        self.mypyc = mypyc
+        self.intern_symbols = intern_symbols
+        self._taken = set(reserved)
+        self._names: dict[Tuple[str, bytes, str], str] = {}
+        self._definitions: List[str] = []
+
+    @staticmethod
+    def handles(td: xdr.SCSpecTypeDef) -> bool:
+        if td.type not in _COMPOSITE_TYPES:
+            return False
+        return td.type != xdr.SCSpecType.SC_SPEC_TYPE_TUPLE or bool(
+            td.tuple.value_types
+        )
+
+    def encode(
+        self, td: xdr.SCSpecTypeDef, name: str, resolve_udt_name: UdtNameResolver
+    ) -> str:
+        return f"{self._function('enc', td, resolve_udt_name)}({name})"
+
+    def decode(
+        self, td: xdr.SCSpecTypeDef, name: str, resolve_udt_name: UdtNameResolver
+    ) -> str:
+        return f"{self.decoder(td, resolve_udt_name)}({name})"
+
+    def decoder(self, td: xdr.SCSpecTypeDef, resolve_udt_name: UdtNameResolver) -> str:
+        """The name of the function decoding ``td``."""
+        return self._function("dec", td, resolve_udt_name)
+
+    def reader(self, td: xdr.SCSpecTypeDef, resolve_udt_name: UdtNameResolver) -> str:
+        """The name of the function reading ``td`` from XDR bytes."""
+        return self._function("read", td, resolve_udt_name)
+
+    def writer(self, td: xdr.SCSpecTypeDef, resolve_udt_name: UdtNameResolver) -> str:
+        """The name of the function appending the XDR of ``td`` to a list."""
+        return self._function("write", td, resolve_udt_name)
+
+    def render(self) -> str:
+        return "".join(self._definitions)
+
+    def _function(
+        self, direction: str, td: xdr.SCSpecTypeDef, resolve_udt_name: UdtNameResolver
+    ) -> str:
+        # The same spec type can name different classes within one module (a
+        # family's shared types come from several contracts), so the resolved
+        # annotation is part of the key.
+        value_type = to_py_type(
+            td, direction in ("enc", "write"), resolve_udt_name, self
+        )
+        key = (direction, td.to_xdr_bytes(), value_type)
+        if key in self._names:
+            return self._names[key]
+        base = f"_{direction}_{type_shape_name(td)}"
+        name = base
+        suffix = 2
+        while name in self._taken:
+            name = f"{base}{suffix}"
+            suffix += 1
+        self._taken.add(name)
+        self._names[key] = name
+        # Rendering the body registers the functions it calls, so those are
+        # defined ahead of this one.
+        if direction == "read":
+            definition = self._reader_definition(name, td, value_type, resolve_udt_name)
+        elif direction == "write":
+            definition = self._writer_definition(name, td, value_type, resolve_udt_name)
+        elif direction == "enc":
+            body = _to_scval_expr(td, "val", resolve_udt_name, self)
+            definition = f"""
+def {name}(val: {value_type}) -> xdr.SCVal:
+    return {body}
+"""
+        elif td.type == xdr.SCSpecType.SC_SPEC_TYPE_VOID:
+            # scval.from_void only validates; mypy rejects using its result.
+            definition = f"""
+def {name}(val: xdr.SCVal) -> None:
+    scval.from_void(val)
+"""
+        elif td.type == xdr.SCSpecType.SC_SPEC_TYPE_TUPLE:
+            values = [
+                from_scval(v, f"elements[{i}]", resolve_udt_name, codecs=self)
+                for i, v in enumerate(td.tuple.value_types)
+            ]
+            definition = f"""
+def {name}(val: xdr.SCVal) -> {value_type}:
+    elements = scval.from_tuple_struct(val)
+    return ({', '.join(values)},)
+"""
+        else:
+            body = _from_scval_expr(td, "val", resolve_udt_name, 0, self)
+            definition = f"""
+def {name}(val: xdr.SCVal) -> {value_type}:
+    return {body}
+"""
+        self._definitions.append(definition)
+        return name
+
+    def _reader_definition(
+        self,
+        name: str,
+        td: xdr.SCSpecTypeDef,
+        value_type: str,
+        resolve_udt_name: UdtNameResolver,
+    ) -> str:
+        def read(inner: xdr.SCSpecTypeDef) -> str:
+            return read_xdr(inner, "pos", resolve_udt_name, self)
+
+        t = td.type
+        if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+            body = f"""
+    if data.startswith({_bytes_literal(_XDR_VOID)}, pos):
+        return None, pos + 4
+    return {read(td.option.value_type)}"""
+        elif t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+            items = "[]"
+            if _decodes_to_array(td, self):
+                items = f"array.array({_ARRAY_TYPECODES[td.vec.element_type.type]!r})"
+            body = f"""
+    count, pos = _xdr_read_header(data, pos, {_bytes_literal(_XDR_VEC)})
+    items: {value_type} = {items}
+    for _ in range(count):
+        item, pos = {read(td.vec.element_type)}
+        items.append(item)
+    return items, pos"""
+        elif t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
+            body = f"""
+    count, pos = _xdr_read_header(data, pos, {_bytes_literal(_XDR_MAP)})
+    items: {value_type} = {{}}
+    for _ in range(count):
+        key, pos = {read(td.map.key_type)}
+        value, pos = {read(td.map.value_type)}
+        items[key] = value
+    return items, pos"""
+        else:
+            types = td.tuple.value_types
+            reads = "".join(f"\n    v{i}, pos = {read(v)}" for i, v in enumerate(types))
+            values = ", ".join(f"v{i}" for i in range(len(types)))
+            if len(types) == 1:
+                values += ","
+            body = f"""
+    count, pos = _xdr_read_header(data, pos, {_bytes_literal(_XDR_VEC)})
+    if count != {len(types)}:
+        raise ValueError(f"expected a tuple of {len(types)} values, got {{count}}"){reads}
+    return ({values}), pos"""
+        return f"""
+def {name}(data: bytes, pos: int) -> Tuple[{value_type}, int]:{body}
+"""
+
+    def _writer_definition(
+        self,
+        name: str,
+        td: xdr.SCSpecTypeDef,
+        value_type: str,
+        resolve_udt_name: UdtNameResolver,
+    ) -> str:
+        def write(inner: xdr.SCSpecTypeDef, inner_name: str) -> str:
+            return write_xdr(inner, inner_name, resolve_udt_name, self)
+
+        t = td.type
+        if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+            body = f"""
+    if val is None:
+        out.append({_bytes_literal(_XDR_VOID)})
+    else:
+        {write(td.option.value_type, "val")}"""
+        elif t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+            body = f"""
+    _xdr_write_header(out, {_bytes_literal(_XDR_VEC)}, len(val))
+    for item in val:
+        {write(td.vec.element_type, "item")}"""
+        else:
+            types = td.tuple.value_types
+            writes = "".join(
+                f"\n    {write(v, f'val[{i}]')}" for i, v in enumerate(types)
+            )
+            body = f"""
+    _xdr_write_header(out, {_bytes_literal(_XDR_VEC)}, {len(types)}){writes}"""
+        return f"""
+def {name}(out: List[bytes], val: {value_type}) -> None:{body}
+"""
+
+
+class GeneratorOptions:
+    """Opt-in variations on the generated code.
+
+    Every option defaults to off, which produces the same bindings as earlier
+    releases.
+
+    :param slots: Give structs, tuple structs, unions and events
+        ``__slots__`` instead of a per-instance ``__dict__``. Instances take
+        less memory and read attributes faster, but no longer accept
+        attributes beyond their fields, nor weak references.
+    :param frozen: Make structs, tuple structs and unions immutable value
+        types: slot-based, rejecting assignment after construction, and
+        caching their hash on first use, so nested values used as dict keys
+        or set members are not re-hashed field by field on every lookup.
+        Fields holding a list or dict can still be mutated in place, but such
+        values were never hashable to begin with.
+    :param lazy: Have ``from_scval`` on structs keep the field values as
+        ``xdr.SCVal`` and decode each field the first time it is read, caching
+        the result. Reading one field of a large nested struct then decodes
+        that field alone; comparing, hashing or re-encoding an instance reads,
+        and so decodes, all of them. An instance holds on to the values it was
+        decoded from until garbage collected. ``from_xdr_bytes`` still decodes
+        eagerly.
+    :param arrays: Decode ``Vec`` values of ``u32``, ``i32``, ``u64``,
+        ``i64``, ``timepoint`` and ``duration`` into an ``array.array`` of
+        the matching typecode instead of a list of ints, which takes about a
+        fifth of the memory for large 64-bit values (see
+        ``benchmarks/python_arrays.py``). Arrays support indexing, slicing and
+        iteration like lists, and encode back the same way, but do not compare
+        equal to lists.
+    :param memoryviews: Decode ``Bytes`` and ``BytesN`` values into
+        ``memoryview`` instead of ``bytes``. ``from_xdr_bytes`` then returns
+        views into the buffer it was given rather than copies: the views keep
+        that buffer alive for as long as any of them is, and if it is a
+        ``bytearray`` it cannot be resized meanwhile, later writes to it show
+        through, and the views are not hashable. ``from_scval`` wraps the
+        bytes already held by the ``xdr.SCVal``. Views compare and hash like
+        the bytes they cover, encode back unchanged, and ``bytes(view)`` makes
+        an independent copy when one is needed.
+    :param mypyc: Emit code that type-checks under mypy and compiles with
+        mypyc. Union dispatch tables move to module level, since compiled
+        classes cannot refer to their own methods while being defined, client
+        methods pass named decoder functions instead of lambdas, and enum
+        codecs use ``value`` rather than enum internals. The bindings behave
+        the same either way; compile them with ``mypyc bindings.py``. It
+        cannot be combined with ``frozen``, ``lazy``, ``lazy_events``,
+        ``arrays`` or ``memoryviews``, whose attribute tricks and container
+        types mypy does not accept.
+    :param intern_symbols: Decode ``Symbol`` values through ``sys.intern``,
+        in ``from_scval`` and ``from_xdr_bytes`` alike, so every decoded copy
+        of the same symbol is one shared ``str``. An indexer holding millions
+        of values that repeat a few symbols keeps one string per distinct
+        symbol instead of one per value, at the cost of a lookup per decode.
+        Interned strings are freed once nothing refers to them. Union kinds
+        and event names are enum members and class constants already.
+    :param lazy_events: Have ``parse`` on events decode the topic parameters
+        and keep the event data as it was given, base64 XDR included,
+        decoding each data parameter the first time it is read and caching the
+        result. Pipelines that drop most events after looking at their topics
+        then never decode the data of those events. Malformed data is
+        reported when it is read rather than by ``parse`` or ``parse_event``:
+        reading a data parameter, directly or through ``repr``, ``==``,
+        ``hash`` or ``to_dict``, raises ``ValueError`` (or a subclass such as
+        ``binascii.Error``), and raises again on every later read. Events
+        whose topics another declared event can also match are still decoded
+        eagerly, since ``parse_event`` tells those apart by whether their data
+        parses.
+    """
+
+    def __init__(
+        self,
+        slots: bool = False,
+        frozen: bool = False,
+        lazy: bool = False,
+        arrays: bool = False,
+        memoryviews: bool = False,
+        mypyc: bool = False,
+        intern_symbols: bool = False,
+        lazy_events: bool = False,
+    ):
+        if mypyc:
+            conflicts = [
+                name
+                for name, value in (
+                    ("frozen", frozen),
+                    ("lazy", lazy),
+                    ("lazy_events", lazy_events),
+                    ("arrays", arrays),
+                    ("memoryviews", memoryviews),
+                )
+                if value
+            ]
+            if conflicts:
+                raise ValueError(
+                    f"mypyc cannot be combined with {', '.join(conflicts)}"
+                )
+        self.slots = slots
+        self.frozen = frozen
+        self.lazy = lazy
+        self.arrays = arrays
+        self.memoryviews = memoryviews
+        self.mypyc = mypyc
+        self.intern_symbols = intern_symbols
+        self.lazy_events = lazy_events
+
+    def as_dict(self) -> dict:
+        return dict(vars(self))
+
+    def __repr__(self):
+        return f"<GeneratorOptions {self.as_dict()}>"
+
+
+_DEFAULT_OPTIONS = GeneratorOptions()
+
+
+def _codec_functions(reserved: set[str], options: GeneratorOptions) -> CodecFunctions:
+    return CodecFunctions(
+        reserved,
+        arrays=options.arrays,
+        memoryviews=options.memoryviews,
+        mypyc=options.mypyc,
+        intern_symbols=options.intern_symbols,
+    )
+
+
+def _slots(
+    options: GeneratorOptions,
+    names: List[str],
+    class_attributes: AbstractSet[str],
+    value_type: bool = False,
+) -> List[str] | None:
+    # A slot is a descriptor on the class, so an attribute sharing its name with
+    # a method or constant cannot have one; that class keeps its __dict__.
+    frozen = value_type and options.frozen
+    if not (options.slots or frozen) or set(names) & class_attributes:
+        return None
+    if frozen:
+        names = names + [_hash_attribute(names)]
+    return list(dict.fromkeys(names))
+
+
+def _hash_attribute(names: List[str]) -> str:
+    return _unused_attribute("_hash", names)
+
+
+def _unused_attribute(name: str, names: List[str]) -> str:
+    while name in names:
+        name += "_"
+    return name
+
+
+def _value_type_helpers(options: GeneratorOptions, names: List[str]) -> dict:
+    """Template context for the attribute writes and hash of a UDT class.
+
+    Frozen classes reject ``__setattr__``, so ``__init__`` writes through
+    ``object.__setattr__``, and the hash is kept in an extra attribute once
+    computed.
+    """
+    if not options.frozen:
+        return {
+            "frozen": False,
+            "hash_attr": None,
+            "set_attr": lambda name, value: f"self.{name} = {value}",
+        }
+    return {
+        "frozen": True,
+        "hash_attr": _hash_attribute(names),
+        "set_attr": lambda name, value: f"object.__setattr__(self, {name!r}, {value})",
     }
 
 
@@ -380,13 +1339,25 @@ _IMPORTS_TEMPLATE = _template(
     """
 from __future__ import annotations
 
+{%- if has_arrays %}
+import array
+{%- endif %}
+{%- if has_caches %}
+import functools
+{%- endif %}
 {%- if has_events %}
 import logging
+{%- endif %}
+{%- if has_intern %}
+import sys
+{%- endif %}
+{%- if has_events %}
 from types import EllipsisType
 {%- endif %}
 from enum import IntEnum, Enum
-{#- Sequence is only used by the event input types. #}
-from typing import Dict, List, {% if has_events %}Sequence, {% endif %}Tuple, Optional, Union
+{#- ClassVar is only used by event classes, Sequence and Mapping by event and
+    mypyc input types. #}
+from typing import {% if has_events %}ClassVar, {% endif %}Dict, Iterable, List, {% if has_mappings %}Mapping, {% endif %}{% if has_events or has_sequences %}Sequence, {% endif %}Tuple, Optional, Union
 
 from stellar_sdk import scval, xdr, Address, MuxedAccount, Keypair
 {%- if client_type == "sync" or client_type == "both" %}
@@ -404,17 +1375,278 @@ NULL_ACCOUNT = "GAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWHF"
 )
 
 
-def render_imports(client_type: str = "both", has_events: bool = False):
-    return _IMPORTS_TEMPLATE.render(client_type=client_type, has_events=has_events)
+def render_imports(
+    client_type: str = "both",
+    has_events: bool = False,
+    has_arrays: bool = False,
+    has_caches: bool = False,
+    has_intern: bool = False,
+    has_sequences: bool = False,
+    has_mappings: bool = False,
+):
+    return _IMPORTS_TEMPLATE.render(
+        client_type=client_type,
+        has_events=has_events,
+        has_arrays=has_arrays,
+        has_caches=has_caches,
+        has_intern=has_intern,
+        has_sequences=has_sequences,
+        has_mappings=has_mappings,
+    )
 
 
-def render_scval_helpers():
-    return """
+_SCVAL_HELPERS = {
+    "_address_cache": """
+# Bindings convert the same few addresses over and over, and parsing a strkey
+# or encoding one from its raw key is the slow part, so both directions go
+# through bounded LRU caches. Cached values are shared between callers, which
+# only read them.
+@functools.lru_cache(maxsize=4096)
+def _address_from_strkey(value: str) -> xdr.SCAddress:
+    return Address(value).to_xdr_sc_address()
+
+
+@functools.lru_cache(maxsize=4096)
+def _address_from_raw(contract: bool, key: bytes) -> Address:
+    if contract:
+        return Address.from_raw_contract(key)
+    return Address.from_raw_account(key)
+
+
+def _address_to_scval(value: Union[Address, str]) -> xdr.SCVal:
+    if isinstance(value, str):
+        address = _address_from_strkey(value)
+    else:
+        address = value.to_xdr_sc_address()
+    return xdr.SCVal(xdr.SCValType.SCV_ADDRESS, address=address)
+
+
+# Topic filters name the same accounts for every subscription rebuilt.
+@functools.lru_cache(maxsize=4096)
+def _address_topic(value: Union[Address, str]) -> str:
+    return _address_to_scval(value).to_xdr()
+
+
+# from_dict reads back the strkeys to_dict wrote, or the Address itself.
+@functools.lru_cache(maxsize=4096)
+def _address_from_json(value: Union[Address, str]) -> Address:
+    return Address(value) if isinstance(value, str) else value
+
+
+def _address_from_scval(value: xdr.SCVal) -> Address:
+    address = value.address
+    if value.type == xdr.SCValType.SCV_ADDRESS and address is not None:
+        account, contract = address.account_id, address.contract_id
+        if address.type == xdr.SCAddressType.SC_ADDRESS_TYPE_ACCOUNT and account is not None:
+            key = account.account_id.ed25519
+            if key is not None:
+                return _address_from_raw(False, key.uint256)
+        if address.type == xdr.SCAddressType.SC_ADDRESS_TYPE_CONTRACT and contract is not None:
+            return _address_from_raw(True, contract.contract_id.hash)
+    # Other kinds of address are not cached, and scval rejects other values.
+    return scval.from_address(value)
+
+
+def address_cache_stats() -> Dict[str, Dict[str, Optional[float]]]:
+    \"\"\"Hits, misses and hit ratio of the address caches used by the codecs.
+
+    ``encode`` counts strkey strings passed where an address is expected;
+    ``decode`` counts account and contract addresses decoded into Address;
+    ``topic`` counts addresses encoded into event topic filters; ``json``
+    counts addresses rebuilt by ``from_dict``.
+    \"\"\"
+    stats: Dict[str, Dict[str, Optional[float]]] = {}
+    for name, cache in (
+        ("encode", _address_from_strkey),
+        ("decode", _address_from_raw),
+        ("topic", _address_topic),
+        ("json", _address_from_json),
+    ):
+        info = cache.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_ratio": info.hits / lookups if lookups else 0.0,
+        }
+    return stats
+""",
+    "_from_error_scval": """
 def _from_error_scval(value: xdr.SCVal) -> xdr.SCError:
     if value.type != xdr.SCValType.SCV_ERROR or value.error is None:
         raise ValueError(f"expected SCV_ERROR, got {value.type}")
     return value.error
-"""
+""",
+    "_json_string": """
+def _json_string(value: Union[str, bytes]) -> str:
+    # Decoded strings are bytes and need not be UTF-8; the escapes keep any
+    # other bytes, and from_dict encodes them back the same way.
+    if isinstance(value, str):
+        return value
+    return bytes(value).decode("utf-8", "surrogateescape")
+""",
+    "_json_address": """
+def _json_address(value: Union[Address, str]) -> str:
+    return value if isinstance(value, str) else value.address
+""",
+    "_struct_values": """
+def _struct_values(
+    value: xdr.SCVal, symbols: Tuple[bytes, ...]
+) -> Optional[List[xdr.SCVal]]:
+    # A struct is a map keyed by its field names in sorted order. When the map
+    # has exactly that layout its values are taken by position; otherwise the
+    # caller falls back to scval.from_struct.
+    if (
+        not isinstance(value, xdr.SCVal)
+        or value.type != xdr.SCValType.SCV_MAP
+        or value.map is None
+    ):
+        return None
+    entries = value.map.sc_map
+    if len(entries) != len(symbols):
+        return None
+    values = []
+    for entry, symbol in zip(entries, symbols):
+        key = entry.key.sym
+        if key is None or key.sc_symbol != symbol:
+            return None
+        values.append(entry.val)
+    return values
+""",
+    "_xdr_decode": """
+def _xdr_decode(read, data: bytes):
+    value, pos = read(data, 0)
+    if pos != len(data):
+        raise ValueError(f"Unexpected trailing {len(data) - pos} bytes in XDR data")
+    return value
+""",
+    "_xdr_mismatch": """
+def _xdr_mismatch(tag: bytes, pos: int) -> ValueError:
+    expected = xdr.SCValType(int.from_bytes(tag, "big")).name
+    return ValueError(f"expected {expected} at byte {pos}")
+""",
+    "_xdr_read_as": """
+def _xdr_read_as(decode, data: bytes, pos: int):
+    # The general path: unpack one xdr.SCVal in place and decode that.
+    unpacker = xdr.base.Unpacker(data)
+    unpacker.set_position(pos)
+    value = xdr.SCVal.unpack(unpacker)
+    return decode(value), unpacker.get_position()
+""",
+    "_xdr_read_int": """
+def _xdr_read_int(
+    data: bytes, pos: int, tag: bytes, size: int, signed: bool
+) -> Tuple[int, int]:
+    start = pos + 4
+    end = start + size
+    if not data.startswith(tag, pos) or len(data) < end:
+        raise _xdr_mismatch(tag, pos)
+    return int.from_bytes(data[start:end], "big", signed=signed), end
+""",
+    "_xdr_read_opaque": """
+def _xdr_read_opaque(data: bytes, pos: int, tag: bytes) -> Tuple[bytes, int]:
+    start = pos + 8
+    if not data.startswith(tag, pos) or len(data) < start:
+        raise _xdr_mismatch(tag, pos)
+    length = int.from_bytes(data[pos + 4 : start], "big")
+    end = start + length
+    if len(data) < end:
+        raise _xdr_mismatch(tag, pos)
+    # Opaque data is zero-padded to a multiple of four bytes.
+    return data[start:end], end + (-length % 4)
+""",
+    "_xdr_read_view": """
+def _xdr_read_view(data: bytes, pos: int, tag: bytes) -> Tuple[memoryview, int]:
+    # As _xdr_read_opaque, but the value is a view of data rather than a copy.
+    start = pos + 8
+    if not data.startswith(tag, pos) or len(data) < start:
+        raise _xdr_mismatch(tag, pos)
+    length = int.from_bytes(data[pos + 4 : start], "big")
+    end = start + length
+    if len(data) < end:
+        raise _xdr_mismatch(tag, pos)
+    return memoryview(data)[start:end], end + (-length % 4)
+""",
+    "_xdr_read_symbol": r"""
+def _xdr_read_symbol(data: bytes, pos: int) -> Tuple[str, int]:
+    value, pos = _xdr_read_opaque(data, pos, b"\x00\x00\x00\x0f")
+    return value.decode(), pos
+""",
+    "_xdr_read_interned_symbol": r"""
+def _xdr_read_interned_symbol(data: bytes, pos: int) -> Tuple[str, int]:
+    value, pos = _xdr_read_symbol(data, pos)
+    return sys.intern(value), pos
+""",
+    "_xdr_read_bool": r"""
+def _xdr_read_bool(data: bytes, pos: int) -> Tuple[bool, int]:
+    if data.startswith(b"\x00\x00\x00\x00\x00\x00\x00\x01", pos):
+        return True, pos + 8
+    if data.startswith(b"\x00\x00\x00\x00\x00\x00\x00\x00", pos):
+        return False, pos + 8
+    raise _xdr_mismatch(b"\x00\x00\x00\x00", pos)
+""",
+    "_xdr_read_header": r"""
+def _xdr_read_header(data: bytes, pos: int, tag: bytes) -> Tuple[int, int]:
+    # Returns the length of a vector or map, which SCVal makes optional: the
+    # flag between the tag and the length must be set.
+    end = pos + 12
+    if (
+        not data.startswith(tag, pos)
+        or not data.startswith(b"\x00\x00\x00\x01", pos + 4)
+        or len(data) < end
+    ):
+        raise _xdr_mismatch(tag, pos)
+    return int.from_bytes(data[pos + 8 : end], "big"), end
+""",
+    "_xdr_read_address": r"""
+def _xdr_read_address(data: bytes, pos: int) -> Tuple[Address, int]:
+    # Account and contract addresses are read in place, the other kinds
+    # through xdr.SCVal.
+    if data.startswith(b"\x00\x00\x00\x12\x00\x00\x00\x00\x00\x00\x00\x00", pos):
+        end = pos + 44
+        if len(data) >= end:
+            return _address_from_raw(False, data[pos + 12 : end]), end
+    elif data.startswith(b"\x00\x00\x00\x12\x00\x00\x00\x01", pos):
+        end = pos + 40
+        if len(data) >= end:
+            return _address_from_raw(True, data[pos + 8 : end]), end
+    return _xdr_read_as(_address_from_scval, data, pos)
+""",
+    "_xdr_write_int": """
+def _xdr_write_int(
+    out: List[bytes], value: int, tag: bytes, size: int, signed: bool
+) -> None:
+    try:
+        out.append(tag + value.to_bytes(size, "big", signed=signed))
+    except OverflowError:
+        expected = xdr.SCValType(int.from_bytes(tag, "big")).name
+        raise ValueError(f"{value} is out of range for {expected}") from None
+""",
+    "_xdr_write_opaque": r"""
+def _xdr_write_opaque(out: List[bytes], value: Union[str, bytes], tag: bytes) -> None:
+    if isinstance(value, str):
+        value = value.encode()
+    length = len(value)
+    out.append(tag + length.to_bytes(4, "big") + value + b"\x00" * (-length % 4))
+""",
+    "_xdr_write_bool": r"""
+def _xdr_write_bool(out: List[bytes], value: bool) -> None:
+    out.append(b"\x00\x00\x00\x00\x00\x00\x00\x01" if value else bytes(8))
+""",
+    "_xdr_write_header": r"""
+def _xdr_write_header(out: List[bytes], tag: bytes, count: int) -> None:
+    out.append(tag + b"\x00\x00\x00\x01" + count.to_bytes(4, "big"))
+""",
+}
+
+
+def render_scval_helpers(names: List[str] | None = None):
+    """The helpers named in ``names`` (all of them by default), in a fixed order."""
+    if names is None:
+        names = list(_SCVAL_HELPERS)
+    return "".join(_SCVAL_HELPERS[name] for name in names)
 
 
 _ENUM_TEMPLATE = _template(
@@ -432,14 +1664,63 @@ class {{ class_name }}(IntEnum):
     @classmethod
     def from_scval(cls, val: xdr.SCVal):
         return cls(scval.from_uint32(val))
+
+    @classmethod
+    def from_scval_many(cls, vals: Iterable[xdr.SCVal]) -> List[{{ class_name }}]:
+        {%- if mypyc %}
+        return [cls(scval.from_uint32(val)) for val in vals]
+        {%- else %}
+        values = [scval.from_uint32(val) for val in vals]
+        members = cls._value2member_map_
+        try:
+            return [members[value] for value in values]
+        except KeyError:
+            # Calling the class raises the ValueError from_scval would.
+            return [cls(value) for value in values]
+        {%- endif %}
+
+    def to_dict(self) -> int:
+        return self.value
+
+    @classmethod
+    def from_dict(cls, data: int):
+        return cls(data)
+
+    @classmethod
+    def from_xdr_bytes(cls, data: bytes):
+        return _xdr_decode(cls._read_xdr, data)
+
+    def to_xdr_bytes(self) -> bytes:
+        out: List[bytes] = []
+        self._write_xdr(out)
+        return b"".join(out)
+
+    @classmethod
+    def _read_xdr(cls, data: bytes, pos: int):
+        value, pos = {{ read_value }}
+        return cls(value), pos
+
+    def _write_xdr(self, out: List[bytes]) -> None:
+        {{ write_value }}
 """
 )
 
 
-def render_enum(entry: xdr.SCSpecUDTEnumV0, class_name: str | None = None):
+def render_enum(
+    entry: xdr.SCSpecUDTEnumV0,
+    class_name: str | None = None,
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+):
     class_name = class_name or _default_udt_name(entry.name.decode())
 
-    return _ENUM_TEMPLATE.render(entry=entry, class_name=class_name)
+    u32 = xdr.SCSpecTypeDef(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+    return _ENUM_TEMPLATE.render(
+        entry=entry,
+        class_name=class_name,
+        mypyc=options.mypyc,
+        read_value=read_xdr(u32, "pos"),
+        write_value=write_xdr(u32, "self.value"),
+    )
 
 
 _ERROR_ENUM_TEMPLATE = _template(
@@ -466,6 +1747,34 @@ class {{ class_name }}(IntEnum):
         if error.type != xdr.SCErrorType.SCE_CONTRACT or error.contract_code is None:
             raise ValueError("expected an SCE_CONTRACT error")
         return cls(error.contract_code.uint32)
+
+    @classmethod
+    def from_scval_many(cls, vals: Iterable[xdr.SCVal]) -> List[{{ class_name }}]:
+        from_scval = cls.from_scval
+        return [from_scval(val) for val in vals]
+
+    def to_dict(self) -> int:
+        return self.value
+
+    @classmethod
+    def from_dict(cls, data: int):
+        return cls(data)
+
+    @classmethod
+    def from_xdr_bytes(cls, data: bytes):
+        return _xdr_decode(cls._read_xdr, data)
+
+    def to_xdr_bytes(self) -> bytes:
+        out: List[bytes] = []
+        self._write_xdr(out)
+        return b"".join(out)
+
+    @classmethod
+    def _read_xdr(cls, data: bytes, pos: int):
+        return _xdr_read_as(cls.from_scval, data, pos)
+
+    def _write_xdr(self, out: List[bytes]) -> None:
+        out.append(self.to_scval().to_xdr_bytes())
     """
 )
 
@@ -476,20 +1785,76 @@ def render_error_enum(entry: xdr.SCSpecUDTErrorEnumV0, class_name: str | None =
     return _ERROR_ENUM_TEMPLATE.render(entry=entry, class_name=class_name)
 
 
+# Class attributes every struct, tuple struct and union defines, which a
+# field of the same name would shadow.
+_UDT_CLASS_ATTRIBUTES = frozenset(
+    {
+        "to_scval",
+        "from_scval",
+        "from_scval_many",
+        "to_dict",
+        "from_dict",
+        "to_xdr_bytes",
+        "from_xdr_bytes",
+        "_read_xdr",
+        "_write_xdr",
+    }
+)
+
+
 _STRUCT_TEMPLATE = _template(
     """
 class {{ class_name }}:
     {%- if entry.doc %}
     __doc__ = {{ python_docstring(entry.doc) }}
     {%- endif %}
+    {%- if slots is not none %}
+    __slots__ = ({% for name in slots %}{{ name | tojson }}, {% endfor %})
+    {%- endif %}
     {%- for field in entry.fields %}
-    {{ field.name.decode() }}: {{ to_py_type(field.type) }}
+    {{ field.name.decode() }}: {{ to_py_type(field.type, annotate_inputs) }}
     {%- endfor %}
 
-    def __init__(self, {% for field in entry.fields %}{{ field.name.decode() }}: {{ to_py_type(field.type, True) }}{% if not loop.last %}, {% endif %}{% endfor %}):
+    def __init__(self, {% for field in entry.fields %}{{ field.name.decode() }}: {{ to_py_type(field.type, True) }}{% if not loop.last %}, {% endif %}{% endfor %}):
+        {%- for field in entry.fields %}
+        {{ set_attr(field.name.decode(), field.name.decode()) }}
+        {%- endfor %}
+
+    {%- if frozen %}
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to {name!r}: {{ class_name }} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete {name!r}: {{ class_name }} is frozen")
+    {%- endif %}
+
+    def __reduce__(self):
+        # Pickles as the constructor arguments alone, which is smaller and
+        # faster than the default attribute dict and bypasses __setattr__.
+        return {{ class_name }}, ({% for arg in reduce_args %}{{ arg }}, {% endfor %})
+    {%- if lazy_attr %}
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set, which includes the
+        # fields from_scval has not decoded yet.
+        try:
+            position, decode = self._FIELD_DECODERS[name]
+            values = object.__getattribute__(self, {{ lazy_attr | tojson }})
+        except (KeyError, AttributeError):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        value = decode(values[position])
+        object.__setattr__(self, name, value)
+        return value
+
+    _FIELD_DECODERS = {
         {%- for field in entry.fields %}
-        self.{{ field.name.decode() }} = {{ field.name.decode() }}
+        {{ field.name.decode() | tojson }}: ({{ wire_positions[loop.index0] }}, lambda val: {{ from_scval(field.type, 'val') }}),
         {%- endfor %}
+    }
+    {%- endif %}
 
     def to_scval(self) -> xdr.SCVal:
         return scval.to_struct({
@@ -500,12 +1865,95 @@ class {{ class_name }}:
 
     @classmethod
     def from_scval(cls, val: xdr.SCVal):
+        values = _struct_values(val, {{ wire_symbols }})
+        {%- if lazy_attr %}
+        if values is None:
+            elements = scval.from_struct(val)
+            values = [{% for wire in wire_order %}elements[{{ wire | tojson }}]{% if not loop.last %}, {% endif %}{% endfor %}]
+        # The fields are decoded from these values as they are first read.
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, {{ lazy_attr | tojson }}, values)
+        return instance
+        {%- else %}
+        if values is not None:
+            return cls(
+                {%- for field in entry.fields %}
+                {{ from_scval(field.type, 'values[' ~ wire_positions[loop.index0] ~ ']') }}{% if not loop.last %},{% endif %}
+                {%- endfor %}
+            )
         elements = scval.from_struct(val)
         return cls(
             {%- for index, field in enumerate(entry.fields) %}
             {{ from_scval(field.type, 'elements["' ~ (field.name_r.decode() if field.name_r else field.name.decode()) ~ '"]') }}{% if not loop.last %},{% endif %}
             {%- endfor %}
         )
+        {%- endif %}
+
+    @classmethod
+    def from_scval_many(cls, vals: Iterable[xdr.SCVal]) -> List[{{ class_name }}]:
+        from_scval = cls.from_scval
+        {%- if lazy_attr %}
+        return [from_scval(val) for val in vals]
+        {%- else %}
+        # from_scval for each value, with the lookups it repeats bound once.
+        struct_values = _struct_values
+        symbols = {{ wire_symbols }}
+        items: List[{{ class_name }}] = []
+        append = items.append
+        for val in vals:
+            values = struct_values(val, symbols)
+            if values is None:
+                append(from_scval(val))
+                continue
+            append(cls(
+                {%- for field in entry.fields %}
+                {{ from_scval(field.type, 'values[' ~ wire_positions[loop.index0] ~ ']') }}{% if not loop.last %},{% endif %}
+                {%- endfor %}
+            ))
+        return items
+        {%- endif %}
+
+    def to_dict(self) -> dict:
+        return {
+            {%- for field in entry.fields %}
+            {{ (field.name_r or field.name).decode() | tojson }}: {{ to_json(field.type, 'self.' ~ field.name.decode()) }},
+            {%- endfor %}
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            {%- for field in entry.fields %}
+            {{ from_json(field.type, 'data[' ~ ((field.name_r or field.name).decode() | tojson) ~ ']') }},
+            {%- endfor %}
+        )
+
+    @classmethod
+    def from_xdr_bytes(cls, data: bytes):
+        return _xdr_decode(cls._read_xdr, data)
+
+    def to_xdr_bytes(self) -> bytes:
+        out: List[bytes] = []
+        self._write_xdr(out)
+        return b"".join(out)
+
+    @classmethod
+    def _read_xdr(cls, data: bytes, pos: int):
+        # A map holding exactly the fields in wire order is read in place; any
+        # other layout goes through xdr.SCVal and from_scval.
+        start = pos
+        {%- for field in xdr_fields %}
+        if not data.startswith({{ field.prefix }}, pos):
+            return _xdr_read_as(cls.from_scval, data, start)
+        {{ field.local }}, pos = {{ read_xdr(field.type, 'pos + ' ~ field.skip) }}
+        {%- endfor %}
+        return cls({% for name in xdr_locals %}{{ name }}{% if not loop.last %}, {% endif %}{% endfor %}), pos
+
+    def _write_xdr(self, out: List[bytes]) -> None:
+        {%- for field in xdr_fields %}
+        out.append({{ field.prefix }})
+        {{ write_xdr(field.type, 'self.' ~ field.name) }}
+        {%- endfor %}
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, {{ class_name }}):
@@ -513,7 +1961,17 @@ class {{ class_name }}:
         return {% for field in entry.fields %}self.{{ field.name.decode() }} == other.{{ field.name.decode() }}{% if not loop.last %} and {% endif %}{% endfor %}
 
     def __hash__(self) -> int:
+        {%- if frozen %}
+        try:
+            return self.{{ hash_attr }}
+        except AttributeError:
+            pass
+        value = hash(({% for field in entry.fields %}self.{{ field.name.decode() }}{% if not loop.last %}, {% endif %}{% endfor %}))
+        object.__setattr__(self, {{ hash_attr | tojson }}, value)
+        return value
+        {%- else %}
         return hash(({% for field in entry.fields %}self.{{ field.name.decode() }}{% if not loop.last %}, {% endif %}{% endfor %}))
+        {%- endif %}
 """
 )
 
@@ -522,13 +1980,65 @@ def render_struct(
     entry: xdr.SCSpecUDTStructV0,
     class_name: str | None = None,
     resolve_udt_name: UdtNameResolver = _default_udt_name,
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+    codecs: "CodecFunctions | None" = None,
 ):
     class_name = class_name or _default_udt_name(entry.name.decode())
 
+    names = [field.name.decode() for field in entry.fields]
+    wire_names = [
+        (getattr(field, "name_r", None) or field.name).decode()
+        for field in entry.fields
+    ]
+    # to_scval writes the fields sorted by name, so that is the order the
+    # positional decoding path expects.
+    wire_order = sorted(wire_names)
+    # The XDR codecs walk the same order: each field is preceded by its key
+    # symbol, and the first key by the map header as well.
+    xdr_fields = []
+    for position, wire in enumerate(wire_order):
+        index = wire_names.index(wire)
+        prefix = _xdr_symbol(wire)
+        if position == 0:
+            prefix = _xdr_header(_XDR_MAP, len(wire_order)) + prefix
+        xdr_fields.append(
+            {
+                "prefix": _bytes_literal(prefix),
+                "skip": len(prefix),
+                "local": f"v{index}",
+                "name": names[index],
+                "type": entry.fields[index].type,
+            }
+        )
+    class_attributes = set(_UDT_CLASS_ATTRIBUTES)
+    lazy_attr = None
+    if options.lazy:
+        class_attributes.update(("__getattr__", "_FIELD_DECODERS"))
+        lazy_attr = _unused_attribute("_scval_values", names)
     return _STRUCT_TEMPLATE.render(
         entry=entry,
         class_name=class_name,
-        **_codec_helpers(resolve_udt_name),
+        wire_symbols=repr(tuple(wire.encode() for wire in wire_order)),
+        wire_positions=[wire_order.index(wire) for wire in wire_names],
+        wire_order=wire_order,
+        lazy_attr=lazy_attr,
+        xdr_fields=xdr_fields,
+        xdr_locals=[f"v{index}" for index in range(len(names))],
+        slots=_slots(
+            options,
+            names + [lazy_attr] if lazy_attr else names,
+            class_attributes,
+            value_type=True,
+        ),
+        reduce_args=[
+            to_pickle(field.type, f"self.{name}", resolve_udt_name, codecs)
+            for field, name in zip(entry.fields, names)
+        ],
+        # mypy checks the __init__ assignments under mypyc, so the fields are
+        # annotated with the types the constructor accepts.
+        annotate_inputs=options.mypyc,
+        **_value_type_helpers(options, names),
+        **_codec_helpers(resolve_udt_name, codecs),
     )
 
 
@@ -538,9 +2048,26 @@ class {{ class_name }}:
     {%- if entry.doc %}
     __doc__ = {{ python_docstring(entry.doc) }}
     {%- endif %}
+    {%- if slots is not none %}
+    __slots__ = ({% for name in slots %}{{ name | tojson }}, {% endfor %})
+    {%- endif %}
 
     def __init__(self, value: Tuple[{% for f in entry.fields %}{{ to_py_type(f.type, True) }}{% if not loop.last %}, {% endif %}{% endfor %}]):
-        self.value = value
+        {{ set_attr('value', 'value') }}
+
+    {%- if frozen %}
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to {name!r}: {{ class_name }} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete {name!r}: {{ class_name }} is frozen")
+    {%- endif %}
+
+    def __reduce__(self):
+        # Pickles as the constructor arguments alone, which is smaller and
+        # faster than the default attribute dict and bypasses __setattr__.
+        return {{ class_name }}, ({% for arg in reduce_args %}{{ arg }}, {% endfor %})
 
     def to_scval(self) -> xdr.SCVal:
         return scval.to_tuple_struct([{% for f in entry.fields %}{{ to_scval(f.type, 'self.value[' ~ f.name.decode() ~ ']') }}{% if not loop.last %}, {% endif %}{% endfor %}]) 
@@ -551,13 +2078,60 @@ class {{ class_name }}:
         values = ({% for f in entry.fields %}{{ from_scval(f.type, 'elements[' ~ f.name.decode() ~ ']') }}, {% endfor %})
         return cls(values)
 
+    @classmethod
+    def from_scval_many(cls, vals: Iterable[xdr.SCVal]) -> List[{{ class_name }}]:
+        from_scval = cls.from_scval
+        return [from_scval(val) for val in vals]
+
+    def to_dict(self) -> list:
+        return [{% for f in entry.fields %}{{ to_json(f.type, 'self.value[' ~ f.name.decode() ~ ']') }}{% if not loop.last %}, {% endif %}{% endfor %}]
+
+    @classmethod
+    def from_dict(cls, data: list):
+        return cls(({% for f in entry.fields %}{{ from_json(f.type, 'data[' ~ f.name.decode() ~ ']') }}, {% endfor %}))
+
+    @classmethod
+    def from_xdr_bytes(cls, data: bytes):
+        return _xdr_decode(cls._read_xdr, data)
+
+    def to_xdr_bytes(self) -> bytes:
+        out: List[bytes] = []
+        self._write_xdr(out)
+        return b"".join(out)
+
+    @classmethod
+    def _read_xdr(cls, data: bytes, pos: int):
+        if not data.startswith({{ xdr_header }}, pos):
+            return _xdr_read_as(cls.from_scval, data, pos)
+        pos += 12
+        {%- for f in entry.fields %}
+        v{{ loop.index0 }}, pos = {{ read_xdr(f.type, 'pos') }}
+        {%- endfor %}
+        return cls(({% for f in entry.fields %}v{{ loop.index0 }}{% if not loop.last or loop.length == 1 %}, {% endif %}{% endfor %})), pos
+
+    def _write_xdr(self, out: List[bytes]) -> None:
+        out.append({{ xdr_header }})
+        {%- for f in entry.fields %}
+        {{ write_xdr(f.type, 'self.value[' ~ f.name.decode() ~ ']') }}
+        {%- endfor %}
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, {{ class_name }}):
             return NotImplemented
         return self.value == other.value
 
     def __hash__(self) -> int:
+        {%- if frozen %}
+        try:
+            return self.{{ hash_attr }}
+        except AttributeError:
+            pass
+        value = hash(self.value)
+        object.__setattr__(self, {{ hash_attr | tojson }}, value)
+        return value
+        {%- else %}
         return hash(self.value)
+        {%- endif %}
 """
 )
 
@@ -566,13 +2140,20 @@ def render_tuple_struct(
     entry: xdr.SCSpecUDTStructV0,
     class_name: str | None = None,
     resolve_udt_name: UdtNameResolver = _default_udt_name,
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+    codecs: "CodecFunctions | None" = None,
 ):
     class_name = class_name or _default_udt_name(entry.name.decode())
+    value_type = _tuple_of([f.type for f in entry.fields])
 
     return _TUPLE_STRUCT_TEMPLATE.render(
         entry=entry,
         class_name=class_name,
-        **_codec_helpers(resolve_udt_name),
+        xdr_header=_bytes_literal(_xdr_header(_XDR_VEC, len(entry.fields))),
+        slots=_slots(options, ["value"], _UDT_CLASS_ATTRIBUTES, value_type=True),
+        reduce_args=[to_pickle(value_type, "self.value", resolve_udt_name, codecs)],
+        **_value_type_helpers(options, ["value"]),
+        **_codec_helpers(resolve_udt_name, codecs),
     )
 
 
@@ -591,11 +2172,50 @@ class {{ class_name }}Kind(Enum):
 
 
 _UNION_TEMPLATE = _template(
-    """
+    """{% macro case_tables(indent, prefix, owner) -%}
+{{ indent }}{{ prefix }}_ENCODERS = {
+        {%- for case in cases %}
+{{ indent }}    {{ case.wire | tojson }}: {{ owner }}_encode_{{ case.name }},
+        {%- endfor %}
+{{ indent }}}
+{{ indent }}{{ prefix }}_DECODERS = {
+        {%- for case in cases %}
+{{ indent }}    {{ case.wire | tojson }}: ({{ class_name }}Kind.{{ case.name }}, {{ owner }}_decode_{{ case.name }}),
+        {%- endfor %}
+{{ indent }}}
+{{ indent }}{{ prefix }}_CASE_FIELDS: Dict[str, str] = {
+        {%- for case in cases if case.attribute is not none %}
+{{ indent }}    {{ case.wire | tojson }}: {{ case.attribute | tojson }},
+        {%- endfor %}
+{{ indent }}}
+{{ indent }}{{ prefix }}_XDR_READERS = {
+        {%- for case in cases %}
+{{ indent }}    {{ case.wire | tojson }}: {{ owner }}_read_xdr_{{ case.name }},
+        {%- endfor %}
+{{ indent }}}
+{{ indent }}{{ prefix }}_XDR_WRITERS = {
+        {%- for case in cases %}
+{{ indent }}    {{ case.wire | tojson }}: {{ owner }}_write_xdr_{{ case.name }},
+        {%- endfor %}
+{{ indent }}}
+{{ indent }}{{ prefix }}_DICT_ENCODERS = {
+        {%- for case in cases %}
+{{ indent }}    {{ case.wire | tojson }}: {{ owner }}_to_dict_{{ case.name }},
+        {%- endfor %}
+{{ indent }}}
+{{ indent }}{{ prefix }}_DICT_DECODERS = {
+        {%- for case in cases %}
+{{ indent }}    {{ case.wire | tojson }}: {{ owner }}_from_dict_{{ case.name }},
+        {%- endfor %}
+{{ indent }}}
+{%- endmacro %}
 class {{ class_name }}:
     {%- if entry.doc %}
     __doc__ = {{ python_docstring(entry.doc) }}
     {%- endif %}
+    {%- if slots is not none %}
+    __slots__ = ({% for name in slots %}{{ name | tojson }}, {% endfor %})
+    {%- endif %}
     def __init__(self,
         kind: {{ class_name }}Kind,
         {%- for case in entry.cases %}
@@ -608,82 +2228,243 @@ class {{ class_name }}:
         {%- endif %}
         {%- endfor %}
     ):
-        self.kind = kind
+        {{ set_attr('kind', 'kind') }}
         {%- for case in entry.cases %}
         {%- if case.kind == xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0 %} 
-        self.{{ camel_to_snake(case.tuple_case.name.decode()) }} = {{ camel_to_snake(case.tuple_case.name.decode()) }}
+        {{ set_attr(camel_to_snake(case.tuple_case.name.decode()), camel_to_snake(case.tuple_case.name.decode())) }}
         {%- endif %}
         {%- endfor %}
+    {%- if frozen %}
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to {name!r}: {{ class_name }} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete {name!r}: {{ class_name }} is frozen")
+    {%- endif %}
+
+    def __reduce__(self):
+        # Pickles as the constructor arguments alone, which is smaller and
+        # faster than the default attribute dict and bypasses __setattr__.
+        return {{ class_name }}, ({% for arg in reduce_args %}{{ arg }}, {% endfor %})
 
     def to_scval(self) -> xdr.SCVal:
-        {%- for case in entry.cases %}
-        {%- if case.kind == xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0 %}
-        if self.kind == {{ class_name }}Kind.{{ case.void_case.name.decode() }}:
-            return scval.to_enum(self.kind.value, None)
+        try:
+            encode = {{ tables_self }}_ENCODERS[self.kind.{{ kind_value }}]
+        except (AttributeError, KeyError):
+            raise ValueError(f"Invalid kind: {self.kind}") from None
+        return encode(self)
+
+    @classmethod
+    def from_scval(cls, val: xdr.SCVal):
+        name, value = scval.from_enum(val)
+        try:
+            kind, decode = {{ tables_cls }}_DECODERS[name]
+        except KeyError:
+            raise ValueError(f"Invalid kind: {name}") from None
+        return decode(cls, kind, value)
+
+    @classmethod
+    def from_scval_many(cls, vals: Iterable[xdr.SCVal]) -> List[{{ class_name }}]:
+        from_enum = scval.from_enum
+        decoders = {{ tables_cls }}_DECODERS
+        items: List[{{ class_name }}] = []
+        append = items.append
+        for val in vals:
+            name, value = from_enum(val)
+            try:
+                kind, decode = decoders[name]
+            except KeyError:
+                raise ValueError(f"Invalid kind: {name}") from None
+            append(decode(cls, kind, value))
+        return items
+
+    def to_dict(self) -> dict:
+        try:
+            encode = {{ tables_self }}_DICT_ENCODERS[self.kind.{{ kind_value }}]
+        except (AttributeError, KeyError):
+            raise ValueError(f"Invalid kind: {self.kind}") from None
+        return encode(self)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        try:
+            decode = {{ tables_cls }}_DICT_DECODERS[data["kind"]]
+        except KeyError:
+            raise ValueError(f"Invalid kind: {data.get('kind')}") from None
+        return decode(cls, data)
+
+    @classmethod
+    def from_xdr_bytes(cls, data: bytes):
+        return _xdr_decode(cls._read_xdr, data)
+
+    def to_xdr_bytes(self) -> bytes:
+        out: List[bytes] = []
+        self._write_xdr(out)
+        return b"".join(out)
+
+    @classmethod
+    def _read_xdr(cls, data: bytes, pos: int):
+        count, pos = _xdr_read_header(data, pos, {{ xdr_vec }})
+        if count == 0:
+            raise ValueError("Invalid kind: empty vector")
+        name, pos = _xdr_read_symbol(data, pos)
+        try:
+            read = {{ tables_cls }}_XDR_READERS[name]
+        except KeyError:
+            raise ValueError(f"Invalid kind: {name}") from None
+        return read(cls, count - 1, data, pos)
+
+    def _write_xdr(self, out: List[bytes]) -> None:
+        try:
+            write = {{ tables_self }}_XDR_WRITERS[self.kind.{{ kind_value }}]
+        except (AttributeError, KeyError):
+            raise ValueError(f"Invalid kind: {self.kind}") from None
+        write(self, out)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, {{ class_name }}):
+            return NotImplemented
+        if self.kind != other.kind:
+            return False
+        field = {{ tables_self }}_CASE_FIELDS.get(self.kind.{{ kind_value }})
+        return field is None or getattr(self, field) == getattr(other, field)
+
+    def __hash__(self) -> int:
+        {%- if frozen %}
+        try:
+            return self.{{ hash_attr }}
+        except AttributeError:
+            pass
+        field = {{ tables_self }}_CASE_FIELDS.get(self.kind.{{ kind_value }})
+        value = hash(self.kind) if field is None else hash((self.kind, getattr(self, field)))
+        object.__setattr__(self, {{ hash_attr | tojson }}, value)
+        return value
         {%- else %}
-        if self.kind == {{ class_name }}Kind.{{ case.tuple_case.name.decode() }}:
-        {%- if len(case.tuple_case.type) == 1 %}
-            assert self.{{ camel_to_snake(case.tuple_case.name.decode()) }} is not None
-            return scval.to_enum(self.kind.value, {{ to_scval(case.tuple_case.type[0], 'self.' ~ camel_to_snake(case.tuple_case.name.decode())) }})
+        field = {{ tables_self }}_CASE_FIELDS.get(self.kind.{{ kind_value }})
+        return hash(self.kind) if field is None else hash((self.kind, getattr(self, field)))
+        {%- endif %}
+
+    # One encoder and decoder per case, looked up by the case's wire name.
+    {%- for case in cases %}
+    {%- if not loop.first %}
+    {% endif %}
+    def _encode_{{ case.name }}(self) -> xdr.SCVal:
+        {%- if case.attribute is none %}
+        return scval.to_enum({{ case.wire | tojson }}, None)
+        {%- elif len(case.types) == 1 %}
+        assert self.{{ case.attribute }} is not None
+        return scval.to_enum({{ case.wire | tojson }}, {{ to_scval(case.types[0], 'self.' ~ case.attribute) }})
         {%- else %}
-            assert isinstance(self.{{ camel_to_snake(case.tuple_case.name.decode()) }}, tuple)
-            return scval.to_enum(self.kind.value, [
-                {%- for t in case.tuple_case.type %}
-                {{ to_scval(t, 'self.' + camel_to_snake(case.tuple_case.name.decode()) + '[' + loop.index0|string + ']') }}{% if not loop.last %},{% endif %}
-                {%- endfor %}
-            ])
+        assert isinstance(self.{{ case.attribute }}, tuple)
+        return scval.to_enum({{ case.wire | tojson }}, [
+            {%- for t in case.types %}
+            {{ to_scval(t, 'self.' ~ case.attribute ~ '[' ~ loop.index0 ~ ']') }}{% if not loop.last %},{% endif %}
+            {%- endfor %}
+        ])
         {%- endif %}
+
+    {% if mypyc %}@staticmethod
+    {% endif %}def _decode_{{ case.name }}(cls, kind, value):
+        {%- if case.attribute is none %}
+        return cls(kind)
+        {%- elif len(case.types) == 1 %}
+        assert value is not None and isinstance(value, xdr.SCVal)
+        return cls(kind, {{ case.attribute }}={{ from_scval(case.types[0], 'value') }})
+        {%- else %}
+        assert value is not None and isinstance(value, list)
+        return cls(kind, {{ case.attribute }}=(
+            {%- for t in case.types %}
+            {{ from_scval(t, 'value[' ~ loop.index0 ~ ']') }}{% if not loop.last %},{% endif %}
+            {%- endfor %}
+        ))
         {%- endif %}
-        {%- endfor %}
-        raise ValueError(f"Invalid kind: {self.kind}")
-    
-    @classmethod
-    def from_scval(cls, val: xdr.SCVal):
-        elements = scval.from_enum(val)
-        kind = {{ class_name }}Kind(elements[0])
-        
-        {%- for case in entry.cases %}
-        {%- if case.kind == xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0 %}
-        if kind == {{ class_name }}Kind.{{ case.void_case.name.decode() }}:
-            return cls(kind)
+    {%- endfor %}
+
+    # The same again for XDR bytes. Readers are handed the number of values
+    # after the case name.
+    {%- for case in cases %}
+    {%- if not loop.first %}
+    {% endif %}
+    {% if mypyc %}@staticmethod
+    {% endif %}def _read_xdr_{{ case.name }}(cls, count, data, pos):
+        if count != {{ len(case.types or []) }}:
+            raise ValueError(f"{{ case.wire }} takes {{ len(case.types or []) }} values, got {count}")
+        {%- if case.attribute is none %}
+        return cls({{ class_name }}Kind.{{ case.name }}), pos
         {%- else %}
-        if kind == {{ class_name }}Kind.{{ case.tuple_case.name.decode() }}:
-        {%- if len(case.tuple_case.type) == 1 %}
-            assert elements[1] is not None and isinstance(elements[1], xdr.SCVal)
-            return cls(kind, {{ camel_to_snake(case.tuple_case.name.decode()) }}={{ from_scval(case.tuple_case.type[0], 'elements[1]') }})
+        {%- for t in case.types %}
+        v{{ loop.index0 }}, pos = {{ read_xdr(t, 'pos') }}
+        {%- endfor %}
+        {%- if len(case.types) == 1 %}
+        return cls({{ class_name }}Kind.{{ case.name }}, {{ case.attribute }}=v0), pos
         {%- else %}
-            assert elements[1] is not None and isinstance(elements[1], list)
-            return cls(kind, {{ camel_to_snake(case.tuple_case.name.decode()) }}=(
-                {%- for i, t in enumerate(case.tuple_case.type) %}
-                {{ from_scval(t, 'elements[1][' + loop.index0|string + ']') }}{% if not loop.last %},{% endif %}
-                {%- endfor %}
-            ))
+        return cls({{ class_name }}Kind.{{ case.name }}, {{ case.attribute }}=({% for t in case.types %}v{{ loop.index0 }}{% if not loop.last %}, {% endif %}{% endfor %})), pos
         {%- endif %}
         {%- endif %}
+
+    def _write_xdr_{{ case.name }}(self, out):
+        {%- if case.attribute is none %}
+        out.append({{ case.xdr_prefix }})
+        {%- elif len(case.types) == 1 %}
+        assert self.{{ case.attribute }} is not None
+        out.append({{ case.xdr_prefix }})
+        {{ write_xdr(case.types[0], 'self.' ~ case.attribute) }}
+        {%- else %}
+        assert isinstance(self.{{ case.attribute }}, tuple)
+        out.append({{ case.xdr_prefix }})
+        {%- for t in case.types %}
+        {{ write_xdr(t, 'self.' ~ case.attribute ~ '[' ~ loop.index0 ~ ']') }}
         {%- endfor %}
-        raise ValueError(f"Invalid kind: {kind}")
-    
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, {{ class_name }}):
-            return NotImplemented
-        if self.kind != other.kind:
-            return False
-        {%- for case in entry.cases %}
-        {%- if case.kind == xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0 %}
-        if self.kind == {{ class_name }}Kind.{{ case.tuple_case.name.decode() }}:
-            return self.{{ camel_to_snake(case.tuple_case.name.decode()) }} == other.{{ camel_to_snake(case.tuple_case.name.decode()) }}
         {%- endif %}
-        {%- endfor %}
-        return True
+    {%- endfor %}
 
-    def __hash__(self) -> int:
-        {%- for case in entry.cases %}
-        {%- if case.kind == xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0 %}
-        if self.kind == {{ class_name }}Kind.{{ case.tuple_case.name.decode() }}:
-            return hash((self.kind, self.{{ camel_to_snake(case.tuple_case.name.decode()) }}))
+    # And for to_dict: {"kind": name}, plus "value" holding the one value or a
+    # list of several.
+    {%- for case in cases %}
+    {%- if not loop.first %}
+    {% endif %}
+    def _to_dict_{{ case.name }}(self) -> dict:
+        {%- if case.attribute is none %}
+        return {"kind": {{ case.wire | tojson }}}
+        {%- elif len(case.types) == 1 %}
+        assert self.{{ case.attribute }} is not None
+        return {"kind": {{ case.wire | tojson }}, "value": {{ to_json(case.types[0], 'self.' ~ case.attribute) }}}
+        {%- else %}
+        assert isinstance(self.{{ case.attribute }}, tuple)
+        return {"kind": {{ case.wire | tojson }}, "value": [
+            {%- for t in case.types %}
+            {{ to_json(t, 'self.' ~ case.attribute ~ '[' ~ loop.index0 ~ ']') }}{% if not loop.last %},{% endif %}
+            {%- endfor %}
+        ]}
         {%- endif %}
-        {%- endfor %}
-        return hash(self.kind)
+
+    {% if mypyc %}@staticmethod
+    {% endif %}def _from_dict_{{ case.name }}(cls, data):
+        {%- if case.attribute is none %}
+        return cls({{ class_name }}Kind.{{ case.name }})
+        {%- elif len(case.types) == 1 %}
+        return cls({{ class_name }}Kind.{{ case.name }}, {{ case.attribute }}={{ from_json(case.types[0], 'data["value"]') }})
+        {%- else %}
+        value = data["value"]
+        return cls({{ class_name }}Kind.{{ case.name }}, {{ case.attribute }}=(
+            {%- for t in case.types %}
+            {{ from_json(t, 'value[' ~ loop.index0 ~ ']') }}{% if not loop.last %},{% endif %}
+            {%- endfor %}
+        ))
+        {%- endif %}
+    {%- endfor %}
+
+    {%- if not mypyc %}
+
+{{ case_tables('    ', '', '') }}
+    {%- endif %}
+{%- if mypyc %}
+
+# Compiled classes cannot refer to their own methods while being defined, so
+# the case tables live at module level.
+{{ case_tables('', '_' ~ class_name, class_name ~ '.') }}
+{%- endif %}
 """
 )
 
@@ -692,14 +2473,92 @@ def render_union(
     entry: xdr.SCSpecUDTUnionV0,
     class_name: str | None = None,
     resolve_udt_name: UdtNameResolver = _default_udt_name,
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+    codecs: "CodecFunctions | None" = None,
 ):
     class_name = class_name or _default_udt_name(entry.name.decode())
 
+    cases = []
+    # Tuple cases store their values in an attribute, which __reduce__
+    # passes after the kind.
+    case_attributes: List[str] = []
+    reduce_args = ["self.kind"]
+    for case in entry.cases:
+        if case.kind == xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0:
+            void_case = case.void_case
+            name = void_case.name.decode()
+            attribute, types = None, None
+            # Keyword renames keep the original name, which goes on the wire.
+            renamed = getattr(void_case, "name_r", None)
+        else:
+            tuple_case = case.tuple_case
+            name = tuple_case.name.decode()
+            attribute = camel_to_snake(name)
+            types = tuple_case.type
+            renamed = getattr(tuple_case, "name_r", None)
+            case_attributes.append(attribute)
+            value_type = types[0] if len(types) == 1 else _tuple_of(types)
+            reduce_args.append(
+                to_pickle(
+                    _optional(value_type),
+                    f"self.{attribute}",
+                    resolve_udt_name,
+                    codecs,
+                )
+            )
+        wire = renamed.decode() if renamed else name
+        # A case is written as a vector of its name and then its values.
+        prefix = _xdr_header(_XDR_VEC, 1 + len(types or [])) + _xdr_symbol(wire)
+        cases.append(
+            {
+                "name": name,
+                "wire": wire,
+                "attribute": attribute,
+                "types": types,
+                "xdr_prefix": _bytes_literal(prefix),
+            }
+        )
+    class_attributes = set(_UDT_CLASS_ATTRIBUTES)
+    class_attributes.update(
+        (
+            "_ENCODERS",
+            "_DECODERS",
+            "_CASE_FIELDS",
+            "_XDR_READERS",
+            "_XDR_WRITERS",
+            "_DICT_ENCODERS",
+            "_DICT_DECODERS",
+        )
+    )
+    for c in cases:
+        class_attributes.update(
+            f"_{method}_{c['name']}"
+            for method in (
+                "encode",
+                "decode",
+                "read_xdr",
+                "write_xdr",
+                "to_dict",
+                "from_dict",
+            )
+        )
     kind_enum = _UNION_KIND_TEMPLATE.render(entry=entry, class_name=class_name)
     union = _UNION_TEMPLATE.render(
         entry=entry,
         class_name=class_name,
-        **_codec_helpers(resolve_udt_name),
+        cases=cases,
+        xdr_vec=_bytes_literal(_XDR_VEC),
+        slots=_slots(
+            options, ["kind"] + case_attributes, class_attributes, value_type=True
+        ),
+        reduce_args=reduce_args,
+        mypyc=options.mypyc,
+        # Where the case tables live: on the class, or at module level.
+        tables_self=f"_{class_name}" if options.mypyc else "self.",
+        tables_cls=f"_{class_name}" if options.mypyc else "cls.",
+        kind_value="value" if options.mypyc else "_value_",
+        **_value_type_helpers(options, ["kind"] + case_attributes),
+        **_codec_helpers(resolve_udt_name, codecs),
     )
     return kind_enum + "\n" + union
 
@@ -750,7 +2609,7 @@ def _coerce_event_scval(value: Union[xdr.SCVal, str, bytes]) -> xdr.SCVal:
     return xdr.SCVal.from_xdr(value)
 
 
-def _event_topics_and_data(
+def _event_topics_and_raw_data(
     event: Union[
         xdr.ContractEvent,
         EventInfo,
@@ -759,28 +2618,38 @@ def _event_topics_and_data(
             Union[xdr.SCVal, str, bytes],
         ],
     ],
-) -> Tuple[List[xdr.SCVal], xdr.SCVal]:
-    """Normalize transaction-meta, RPC, or raw-XDR event input."""
+) -> Tuple[List[xdr.SCVal], Union[xdr.SCVal, str, bytes]]:
+    """Normalize the topics of transaction-meta, RPC, or raw-XDR event input,
+    leaving the data as given for callers that look at the topics alone."""
     if isinstance(event, xdr.ContractEvent):
         if event.body.v0 is None:
             raise ValueError("contract event has no v0 body")
         return list(event.body.v0.topics), event.body.v0.data
     if isinstance(event, EventInfo):
-        return (
-            [_coerce_event_scval(topic) for topic in event.topic],
-            _coerce_event_scval(event.value),
-        )
+        return [_coerce_event_scval(topic) for topic in event.topic], event.value
     if isinstance(event, tuple) and len(event) == 2:
         topics, data = event
-        return (
-            [_coerce_event_scval(topic) for topic in topics],
-            _coerce_event_scval(data),
-        )
+        return [_coerce_event_scval(topic) for topic in topics], data
     raise TypeError(
         "event must be ContractEvent, EventInfo, or a (topics, data) tuple"
     )
 
 
+def _event_topics_and_data(
+    event: Union[
+        xdr.ContractEvent,
+        EventInfo,
+        Tuple[
+            Sequence[Union[xdr.SCVal, str, bytes]],
+            Union[xdr.SCVal, str, bytes],
+        ],
+    ],
+) -> Tuple[List[xdr.SCVal], xdr.SCVal]:
+    """Normalize transaction-meta, RPC, or raw-XDR event input."""
+    topics, data = _event_topics_and_raw_data(event)
+    return topics, _coerce_event_scval(data)
+
+
 def _static_topic_matches(topic: xdr.SCVal, expected: str) -> bool:
     """SEP-48: when matching, parsers should tolerate static topics being of
     the SCVal type SCV_SYMBOL or SCV_STRING."""
@@ -791,6 +2660,66 @@ def _static_topic_matches(topic: xdr.SCVal, expected: str) -> bool:
     return False
 
 
+def _static_topic_key(topic: xdr.SCVal) -> Optional[bytes]:
+    """The bytes of a symbol or string topic, which is how parse_event looks
+    up the events declaring it as their first static topic; None otherwise."""
+    if topic.type == xdr.SCValType.SCV_SYMBOL and topic.sym is not None:
+        return topic.sym.sc_symbol
+    if topic.type == xdr.SCValType.SCV_STRING and topic.str is not None:
+        return topic.str.sc_string
+    return None
+
+
+def _static_topic_keys(names: List[bytes]) -> Dict[Union[str, bytes], bytes]:
+    """Map the XDR bytes and base64 of each name, as a symbol topic and as a
+    string topic, to the name, so raw topics are looked up without decoding."""
+    keys: Dict[Union[str, bytes], bytes] = {}
+    for name in names:
+        for topic in (
+            xdr.SCVal(xdr.SCValType.SCV_SYMBOL, sym=xdr.SCSymbol(name)),
+            xdr.SCVal(xdr.SCValType.SCV_STRING, str=xdr.SCString(name)),
+        ):
+            keys[topic.to_xdr_bytes()] = name
+            keys[topic.to_xdr()] = name
+    return keys
+
+
+def _event_dispatch_key(
+    event: Union[
+        xdr.ContractEvent,
+        EventInfo,
+        Tuple[
+            Sequence[Union[xdr.SCVal, str, bytes]],
+            Union[xdr.SCVal, str, bytes],
+        ],
+    ],
+    keys: Dict[Union[str, bytes], bytes],
+) -> Tuple[Optional[bytes], int]:
+    """The static topic key of the event's first topic and its topic count,
+    read without decoding anything. A raw first topic is looked up in
+    ``keys``: XDR is canonical, so the symbols and strings those were built
+    from have no other encoding, and any other topic has no key."""
+    topics: Sequence[Union[xdr.SCVal, str, bytes]]
+    if isinstance(event, xdr.ContractEvent):
+        if event.body.v0 is None:
+            raise ValueError("contract event has no v0 body")
+        topics = event.body.v0.topics
+    elif isinstance(event, EventInfo):
+        topics = event.topic
+    elif isinstance(event, tuple) and len(event) == 2:
+        topics = event[0]
+    else:
+        raise TypeError(
+            "event must be ContractEvent, EventInfo, or a (topics, data) tuple"
+        )
+    if not topics:
+        return None, 0
+    first = topics[0]
+    if isinstance(first, xdr.SCVal):
+        return _static_topic_key(first), len(topics)
+    return keys.get(first), len(topics)
+
+
 class UnparsedEventError(ValueError):
     """The event's topics matched one or more declared events, but none of the
     candidate classes could parse it.
@@ -807,6 +2736,85 @@ class UnparsedEventError(ValueError):
 '''
 
 
+RUNTIME_MODULE = "stellar_contract_bindings.runtime.v1"
+_RUNTIME_EVENT_NAMES = [
+    "UnparsedEventError",
+    "_coerce_event_scval",
+    "_event_dispatch_key",
+    "_event_topics_and_data",
+    "_event_topics_and_raw_data",
+    "_static_topic_key",
+    "_static_topic_keys",
+    "_static_topic_matches",
+]
+
+
+def render_runtime_import(names: List[str]):
+    return f"from {RUNTIME_MODULE} import {', '.join(names)}"
+
+
+def render_event_support(runtime: str = "inline"):
+    """The event helpers, or just the module logger when they are imported."""
+    if runtime == "shared":
+        return "\n_logger = logging.getLogger(__name__)\n"
+    return render_event_helpers()
+
+
+# The functions each helper defines. Most define the one function they are
+# named after; the address cache defines its converters and their stats.
+_SCVAL_HELPER_FUNCTIONS = {
+    name: re.findall(r"^def (\w+)\(", source, re.MULTILINE)
+    for name, source in _SCVAL_HELPERS.items()
+}
+
+
+def _used_scval_helpers(body: str) -> List[str]:
+    # Helpers call one another, so their own sources are searched as well.
+    used: set[str] = set()
+    pending = [body]
+    while pending:
+        text = pending.pop()
+        for name, source in _SCVAL_HELPERS.items():
+            if name not in used and any(
+                f"{function}(" in text for function in _SCVAL_HELPER_FUNCTIONS[name]
+            ):
+                used.add(name)
+                pending.append(source)
+    return [name for name in _SCVAL_HELPERS if name in used]
+
+
+def _helpers_use_functools(helpers: List[str], runtime: str) -> bool:
+    # Only inline helpers need the import; the shared runtime has its own.
+    return runtime != "shared" and any(
+        "@functools." in _SCVAL_HELPERS[name] for name in helpers
+    )
+
+
+def _uses_arrays(body: str) -> bool:
+    return "array.array(" in body
+
+
+def _uses_intern(body: str, runtime: str) -> bool:
+    # Inline helpers count too; the shared runtime has its own import.
+    helpers = _used_scval_helpers(body) if runtime != "shared" else []
+    return "sys.intern(" in body or any(
+        "sys.intern(" in _SCVAL_HELPERS[name] for name in helpers
+    )
+
+
+def _support_header(body: str, has_events: bool, runtime: str) -> List[str]:
+    # Helpers that live in the body of an inline module are imported instead
+    # when the module uses the shared runtime.
+    helpers = _used_scval_helpers(body)
+    if runtime != "shared":
+        return [render_scval_helpers(helpers)] if helpers else []
+    names = list(_RUNTIME_EVENT_NAMES) if has_events else []
+    names.extend(
+        function for name in helpers for function in _SCVAL_HELPER_FUNCTIONS[name]
+    )
+    return [render_runtime_import(sorted(names))] if names else []
+
+
 def declared_topic_count(entry: xdr.SCSpecEventV0) -> int:
     return len(entry.prefix_topics) + sum(
         1
@@ -893,6 +2901,25 @@ def event_diagnostics(
     return messages
 
 
+def events_sharing_topics(event_specs: List[xdr.SCSpecEventV0]) -> set[int]:
+    """Indexes of the events whose topics another declared event can match.
+
+    ``matches()`` checks the static prefix topics alone, so two events can
+    match the same topics unless their prefixes differ somewhere both declare
+    one. parse_event tries such events in turn and keeps the first whose data
+    parses.
+    """
+    prefixes = [[s.sc_symbol for s in spec.prefix_topics] for spec in event_specs]
+    shared = set()
+    for i, prefix in enumerate(prefixes):
+        for j, other in enumerate(prefixes):
+            common = min(len(prefix), len(other))
+            if i != j and prefix[:common] == other[:common]:
+                shared.add(i)
+                break
+    return shared
+
+
 def resolve_event_param_names(entry: xdr.SCSpecEventV0) -> List[str]:
     """Allocate valid, unique constructor/attribute names for an event."""
     used = {"self", "cls"}
@@ -932,6 +2959,7 @@ def _event_params(
     param_names: List[str],
     prefix_topic_count: int,
     resolve_udt_name: UdtNameResolver,
+    codecs: "CodecFunctions | None" = None,
 ) -> Tuple[List[dict], List[dict], List[str]]:
     """Work out how each declared parameter is typed, parsed and filtered.
 
@@ -939,6 +2967,10 @@ def _event_params(
     topic list (which drives topic_filter), and the map keys that must be
     present for a MAP-format event to parse.
     """
+
+    def decode(td: xdr.SCSpecTypeDef, name: str) -> str:
+        return from_scval(td, name, resolve_udt_name, codecs=codecs)
+
     data_format = entry.data_format
     params: List[dict] = []
     topic_params: List[dict] = []
@@ -947,29 +2979,35 @@ def _event_params(
     data_index = 0
     for p, py_name in zip(entry.params, param_names):
         chain_name = p.name.decode()
-        py_type = to_py_type(p.type, resolve_udt_name=resolve_udt_name)
-        if (
+        py_type = to_py_type(p.type, resolve_udt_name=resolve_udt_name, codecs=codecs)
+        in_data = (
             p.location
-            == xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_TOPIC_LIST
-        ):
-            parse_expr = from_scval(p.type, f"topics[{topic_index}]", resolve_udt_name)
+            != xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_TOPIC_LIST
+        )
+        if not in_data:
+            parse_expr = decode(p.type, f"topics[{topic_index}]")
             topic_index += 1
+            if p.type.type in _ADDRESS_TYPES:
+                filter_expr = f"_address_topic({py_name})"
+            else:
+                scval_expr = to_scval(p.type, py_name, resolve_udt_name, codecs)
+                filter_expr = f"({scval_expr}).to_xdr()"
             topic_params.append(
                 {
                     "py_name": py_name,
                     "input_type": to_py_type(
                         p.type, input_type=True, resolve_udt_name=resolve_udt_name
                     ),
-                    "filter_expr": to_scval(p.type, py_name, resolve_udt_name),
+                    "filter_expr": filter_expr,
                 }
             )
         elif (
             data_format
             == xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_SINGLE_VALUE
         ):
-            parse_expr = from_scval(p.type, "data", resolve_udt_name)
+            parse_expr = decode(p.type, "data")
         elif data_format == xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_VEC:
-            parse_expr = from_scval(p.type, f"_data[{data_index}]", resolve_udt_name)
+            parse_expr = decode(p.type, f"_data[{data_index}]")
             data_index += 1
         elif data_format == xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_MAP:
             # SEP-48 requires the map to carry every declared parameter, but an
@@ -981,11 +3019,11 @@ def _event_params(
             value_expr = f"_data[{chain_name!r}]"
             if p.type.type == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
                 parse_expr = (
-                    f"({from_scval(p.type, value_expr, resolve_udt_name)}) "
+                    f"({decode(p.type, value_expr)}) "
                     f"if {chain_name!r} in _data else None"
                 )
             else:
-                parse_expr = from_scval(p.type, value_expr, resolve_udt_name)
+                parse_expr = decode(p.type, value_expr)
                 required_data_keys.append(chain_name)
         else:
             raise ValueError(f"Unsupported event data format: {data_format}")
@@ -994,18 +3032,45 @@ def _event_params(
                 "py_name": py_name,
                 "py_type": py_type,
                 "parse_expr": parse_expr,
+                "in_data": in_data,
+                "wire": chain_name,
+                "to_json": to_json(p.type, f"self.{py_name}", resolve_udt_name, codecs),
+                "reduce": to_pickle(p.type, f"self.{py_name}", resolve_udt_name, codecs),
+                "from_json": from_json(
+                    p.type, f"data[{chain_name!r}]", resolve_udt_name, codecs
+                ),
             }
         )
     return params, topic_params, required_data_keys
 
 
 _EVENT_TEMPLATE = _template(
-    """
+    """{% macro unpack_data() -%}
+        {%- if has_vec_data %}
+        _data = scval.from_vec(data)
+        if len(_data) < {{ data_param_count }}:
+            raise ValueError("event data vector has fewer values than declared")
+        {%- endif %}
+        {%- if has_map_data %}
+        _data = scval.from_struct(data)
+        {%- if required_data_keys %}
+        _missing = [_k for _k in [{{ required_data_keys | join(', ') }}] if _k not in _data]
+        if _missing:
+            raise ValueError(f"event data map is missing required entries: {_missing}")
+        {%- endif %}
+        {%- endif %}
+{%- endmacro %}
 class {{ class_name }}:
     {%- if event_doc %}
     __doc__ = {{ event_doc }}
     {%- endif %}
     EVENT_NAME = {{ event_name }}
+    # The static prefix topics as base64 XDR symbols, as topic_filter() and
+    # getEvents take them.
+    PREFIX_TOPICS_XDR: ClassVar[Tuple[str, ...]] = ({% for topic in prefix_topics_xdr %}{{ topic }}, {% endfor %})
+    {%- if slots is not none %}
+    __slots__ = ({% for name in slots %}{{ name | tojson }}, {% endfor %})
+    {%- endif %}
 
     {%- for p in params %}
     {{ p.py_name }}: {{ p.py_type }}
@@ -1038,11 +3103,9 @@ class {{ class_name }}:
         from the four-segment filter limit.
         '''
         return [
-            {%- for s in prefix_symbols %}
-            scval.to_symbol({{ s }}).to_xdr(),
-            {%- endfor %}
+            *cls.PREFIX_TOPICS_XDR,
             {%- for p in topic_params %}
-            "*" if {{ p.py_name }} is ... else ({{ p.filter_expr }}).to_xdr(),
+            "*" if {{ p.py_name }} is ... else {{ p.filter_expr }},
             {%- endfor %}
             "**",
         ]
@@ -1057,7 +3120,7 @@ class {{ class_name }}:
         asset string).
         '''
         try:
-            topics, _ = _event_topics_and_data(event)
+            topics, _ = _event_topics_and_raw_data(event)
         except Exception:
             return False
         if len(topics) < {{ total_topics }}:
@@ -1075,29 +3138,83 @@ class {{ class_name }}:
         :raises ValueError: If the event does not match this event's shape.
         '''
         # Decode once and hand matches() the normalized pair; matches() would
-        # otherwise decode the raw event a second time.
+        # otherwise decode the raw topics a second time.
+        {%- if lazy_data_attr %}
+        topics, data = _event_topics_and_raw_data(event)
+        {%- else %}
         topics, data = _event_topics_and_data(event)
+        {%- endif %}
         if not cls.matches((topics, data)):
             raise ValueError('event does not match {{ class_name }}')
+        {%- if lazy_data_attr %}
+        # The data is kept as given, and decoded as its parameters are read.
+        instance = cls.__new__(cls)
+        {%- for p in params if not p.in_data %}
+        instance.{{ p.py_name }} = {{ p.parse_expr }}
+        {%- endfor %}
+        instance.{{ lazy_data_attr }} = data
+        return instance
+        {%- else %}
         {%- if validate_void_data %}
         scval.from_void(data)
         {%- endif %}
-        {%- if has_vec_data %}
-        _data = scval.from_vec(data)
-        if len(_data) < {{ data_param_count }}:
-            raise ValueError("event data vector has fewer values than declared")
-        {%- endif %}
-        {%- if has_map_data %}
-        _data = scval.from_struct(data)
-        {%- if required_data_keys %}
-        _missing = [_k for _k in [{{ required_data_keys | join(', ') }}] if _k not in _data]
-        if _missing:
-            raise ValueError(f"event data map is missing required entries: {_missing}")
+        {{- unpack_data() }}
+        return cls(
+            {%- for p in params %}
+            {{ p.py_name }}={{ p.parse_expr }},
+            {%- endfor %}
+        )
         {%- endif %}
+
+    def __reduce__(self):
+        return {{ class_name }}, ({% for p in params %}{{ p.reduce }}, {% endfor %})
+    {%- if lazy_data_attr %}
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set, which includes the
+        # data parameters parse() has not decoded yet.
+        try:
+            decode = self._DATA_DECODERS[name]
+            data = object.__getattribute__(self, {{ lazy_data_attr | tojson }})
+        except (KeyError, AttributeError):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        {%- if has_vec_data or has_map_data %}
+        # The first read unpacks the data and keeps the unpacked values, so
+        # reading the other parameters only indexes them.
+        if not isinstance(data, {{ 'list' if has_vec_data else 'dict' }}):
+            data = _coerce_event_scval(data)
+            {{- unpack_data() | indent(4) }}
+            data = _data
+            setattr(self, {{ lazy_data_attr | tojson }}, data)
+        {%- else %}
+        data = _coerce_event_scval(data)
+        setattr(self, {{ lazy_data_attr | tojson }}, data)
         {%- endif %}
+        value = decode(data)
+        setattr(self, name, value)
+        return value
+
+    _DATA_DECODERS = {
+        {%- for p in params if p.in_data %}
+        {{ p.py_name | tojson }}: lambda {{ '_data' if has_vec_data or has_map_data else 'data' }}: {{ p.parse_expr }},
+        {%- endfor %}
+    }
+    {%- endif %}
+
+    def to_dict(self) -> dict:
+        return {
+            {%- for p in params %}
+            {{ p.wire | tojson }}: {{ p.to_json }},
+            {%- endfor %}
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> {{ class_name }}:
         return cls(
             {%- for p in params %}
-            {{ p.py_name }}={{ p.parse_expr }},
+            {{ p.py_name }}={{ p.from_json }},
             {%- endfor %}
         )
 
@@ -1119,7 +3236,16 @@ def render_event(
     entry: xdr.SCSpecEventV0,
     class_name: str,
     resolve_udt_name: UdtNameResolver = _default_udt_name,
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+    codecs: "CodecFunctions | None" = None,
+    shares_topics: bool = False,
 ):
+    """Render the class for one event declaration.
+
+    ``shares_topics`` marks an event whose topics another declared event can
+    also match; such an event decodes its data in ``parse`` even with
+    ``lazy_events``, so that a mismatch rejects it there.
+    """
     prefix_symbols = [s.sc_symbol.decode() for s in entry.prefix_topics]
     data_format = entry.data_format
     data_params = [
@@ -1139,7 +3265,7 @@ def render_event(
 
     param_names = resolve_event_param_names(entry)
     params, topic_params, required_data_keys = _event_params(
-        entry, param_names, len(prefix_symbols), resolve_udt_name
+        entry, param_names, len(prefix_symbols), resolve_udt_name, codecs
     )
     has_vec_data = data_format == (
         xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_VEC
@@ -1152,12 +3278,28 @@ def render_event(
         and not data_params
     )
     event_doc = _event_doc(entry, param_names)
+    class_attributes = {
+        "EVENT_NAME",
+        "PREFIX_TOPICS_XDR",
+        "topic_filter",
+        "matches",
+        "parse",
+        "to_dict",
+        "from_dict",
+    }
+    lazy_data_attr = None
+    if options.lazy_events and data_params and not shares_topics:
+        class_attributes.update(("__getattr__", "_DATA_DECODERS"))
+        lazy_data_attr = _unused_attribute("_raw_data", param_names)
 
     return _EVENT_TEMPLATE.render(
         class_name=class_name,
         event_doc=repr(event_doc) if event_doc else None,
         event_name=repr(entry.name.sc_symbol.decode()),
         prefix_symbols=[repr(symbol) for symbol in prefix_symbols],
+        prefix_topics_xdr=[
+            repr(scval.to_symbol(symbol).to_xdr()) for symbol in prefix_symbols
+        ],
         total_topics=declared_topic_count(entry),
         params=params,
         topic_params=topic_params,
@@ -1167,6 +3309,12 @@ def render_event(
         required_data_keys=[repr(key) for key in required_data_keys],
         validate_void_data=validate_void_data,
         data_param_count=len(data_params),
+        lazy_data_attr=lazy_data_attr,
+        slots=_slots(
+            options,
+            param_names + [lazy_data_attr] if lazy_data_attr else param_names,
+            class_attributes,
+        ),
     )
 
 
@@ -1174,7 +3322,21 @@ _EVENT_DISPATCHER_TEMPLATE = _template(
     """
 {{ union_name }} = Union[{{ class_names | join(', ') }}]
 
-_EVENTS = [{{ ordered_names | join(', ') }}]
+_EVENTS: List[type[{{ union_name }}]] = [{{ ordered_names | join(', ') }}]
+
+# The candidates for an event, keyed by its first topic when that is a symbol
+# or string, and its topic count up to the most any event declares. Events
+# declaring no static topic are candidates under every first topic, including
+# None. Each list keeps the order of _EVENTS.
+_MAX_EVENT_TOPICS = {{ max_topics }}
+_EVENT_INDEX: Dict[Tuple[Optional[bytes], int], List[type[{{ union_name }}]]] = {
+    {%- for key, names in index %}
+    {{ key }}: [{{ names | join(', ') }}],
+    {%- endfor %}
+}
+# The first topics _EVENT_INDEX is keyed by, encoded at import so that events
+# given as base64 or XDR bytes are looked up before any of them is decoded.
+_EVENT_TOPIC_KEYS = _static_topic_keys([{{ first_topics | join(', ') }}])
 
 def parse_event(
     event: {{ event_input_type }},
@@ -1182,9 +3344,11 @@ def parse_event(
 ) -> Optional[{{ union_name }}]:
     '''Parse an event emitted by this contract into a typed event object.
 
-    Candidates are tried most-specific first (most declared topics), then in
-    spec order; failures of intermediate candidates are part of that normal
-    disambiguation flow. Returns None if no declared event matches the topics.
+    Only the events declaring the event's first topic, or no static topic, and
+    at most as many topics as it carries are candidates. They are tried
+    most-specific first (most declared topics), then in spec order; failures
+    of intermediate candidates are part of that normal disambiguation flow.
+    Returns None if no declared event matches the topics.
 
     If the topics match at least one declared event but every candidate fails
     to parse, the event format has likely drifted from the spec these bindings
@@ -1193,14 +3357,28 @@ def parse_event(
     is True.
     '''
     failures: List[Tuple[type, Exception]] = []
+    try:
+        _first, _count = _event_dispatch_key(event, _EVENT_TOPIC_KEYS)
+    except Exception:
+        return None
+    _count = min(_count, _MAX_EVENT_TOPICS)
+    _candidates = _EVENT_INDEX.get((_first, _count))
+    if _candidates is None:
+        # An undeclared first topic leaves the events with no static topic.
+        _candidates = _EVENT_INDEX.get((None, _count))
+        if not _candidates:
+            return None
     # Decode the event once here rather than once per candidate: RPC events
     # arrive as base64 XDR, and every candidate would otherwise re-decode all
     # of the topics before rejecting them on the first one.
+    {%- if raw_data %} The data is left to
+    # the candidate that parses it, since lazy events decode it only when read.
+    {%- endif %}
     try:
-        _decoded = _event_topics_and_data(event)
+        _decoded = _event_topics_and_{{ 'raw_data' if raw_data else 'data' }}(event)
     except Exception:
         return None
-    for _event_cls in _EVENTS:
+    for _event_cls in _candidates:
         if _event_cls.matches(_decoded):
             try:
                 return _event_cls.parse(_decoded)
@@ -1222,23 +3400,44 @@ def parse_event(
 
 
 def render_event_dispatcher(
-    entries: List[xdr.SCSpecEventV0], class_names: List[str], union_name: str = "Event"
+    entries: List[xdr.SCSpecEventV0],
+    class_names: List[str],
+    union_name: str = "Event",
+    raw_data: bool = False,
 ):
     # Try the most specific declaration (most declared topics) first, so a
     # shorter declaration sharing the same prefix cannot swallow events of a
     # longer one via the extra-trailing-topics tolerance. Ties keep spec order.
-    ordered_names = [
-        name
-        for _, name in sorted(
-            zip(entries, class_names),
-            key=lambda pair: -declared_topic_count(pair[0]),
-        )
+    ordered = sorted(
+        zip(entries, class_names),
+        key=lambda pair: -declared_topic_count(pair[0]),
+    )
+    max_topics = max((declared_topic_count(entry) for entry in entries), default=0)
+    firsts = [
+        entry.prefix_topics[0].sc_symbol if entry.prefix_topics else None
+        for entry, _ in ordered
     ]
+    index = []
+    first_topics = sorted({first for first in firsts if first is not None})
+    for key in [None] + first_topics:
+        for count in range(max_topics + 1):
+            names = [
+                name
+                for (entry, name), first in zip(ordered, firsts)
+                if first in (None, key) and declared_topic_count(entry) <= count
+            ]
+            if names:
+                literal = "None" if key is None else _bytes_literal(key)
+                index.append((f"({literal}, {count})", names))
     return _EVENT_DISPATCHER_TEMPLATE.render(
         class_names=class_names,
-        ordered_names=ordered_names,
+        ordered_names=[name for _, name in ordered],
+        max_topics=max_topics,
+        index=index,
+        first_topics=[_bytes_literal(first) for first in first_topics],
         union_name=union_name,
         event_input_type=_EVENT_INPUT_TYPE,
+        raw_data=raw_data,
     )
 
 
@@ -1277,6 +3476,7 @@ def render_client(
     entries: List[xdr.SCSpecFunctionV0],
     client_type: str,
     resolve_udt_name: UdtNameResolver = _default_udt_name,
+    codecs: "CodecFunctions | None" = None,
 ):
 
     def function_output(td: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
@@ -1297,16 +3497,25 @@ def render_client(
             return "None"
         elif len(output) == 1:
             return to_py_type(
-                function_output(output[0]), resolve_udt_name=resolve_udt_name
+                function_output(output[0]),
+                resolve_udt_name=resolve_udt_name,
+                codecs=codecs,
             )
         else:
-            return f"Tuple[{', '.join([to_py_type(function_output(t), resolve_udt_name=resolve_udt_name) for t in output])}]"
+            return f"Tuple[{', '.join([to_py_type(function_output(t), resolve_udt_name=resolve_udt_name, codecs=codecs) for t in output])}]"
 
     def parse_result_xdr_fn(output: List[xdr.SCSpecTypeDef]):
+        native = codecs is not None and codecs.mypyc
         if len(output) == 0:
+            if native:
+                void = xdr.SCSpecTypeDef(xdr.SCSpecType.SC_SPEC_TYPE_VOID)
+                return codecs.decoder(void, resolve_udt_name)
             return "lambda _: None"
         elif len(output) == 1:
-            return f'lambda v: {from_scval(function_output(output[0]), "v", resolve_udt_name)}'
+            td = function_output(output[0])
+            if codecs is not None and (native or codecs.handles(td)):
+                return codecs.decoder(td, resolve_udt_name)
+            return f"lambda v: {from_scval(td, 'v', resolve_udt_name)}"
         else:
             raise NotImplementedError(
                 "Tuple return type is not supported, please report this issue"
@@ -1314,7 +3523,7 @@ def render_client(
 
     return _CLIENT_TEMPLATE.render(
         entries=entries,
-        **_codec_helpers(resolve_udt_name),
+        **_codec_helpers(resolve_udt_name, codecs),
         parse_result_type=parse_result_type,
         parse_result_xdr_fn=parse_result_xdr_fn,
         client_type=client_type,
@@ -1371,59 +3580,112 @@ def append_underscore(specs: List[xdr.SCSpecEntry]):
                 _rename_if_keyword(error_enum_case)
 
 
+def render_udt(
+    spec: xdr.SCSpecEntry,
+    class_name: str,
+    resolve_udt_name: UdtNameResolver = _default_udt_name,
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+    codecs: "CodecFunctions | None" = None,
+) -> str:
+    """Render the class (or classes, for a union) for one UDT spec entry."""
+    if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
+        return render_enum(spec.udt_enum_v0, class_name, options)
+    if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0:
+        return render_error_enum(spec.udt_error_enum_v0, class_name)
+    if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
+        if is_tuple_struct(spec.udt_struct_v0):
+            return render_tuple_struct(
+                spec.udt_struct_v0, class_name, resolve_udt_name, options, codecs
+            )
+        return render_struct(
+            spec.udt_struct_v0, class_name, resolve_udt_name, options, codecs
+        )
+    if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+        return render_union(
+            spec.udt_union_v0, class_name, resolve_udt_name, options, codecs
+        )
+    raise ValueError(f"Not a UDT spec entry: {spec.kind}")
+
+
 def generate_binding_with_diagnostics(
-    specs: List[xdr.SCSpecEntry], client_type: str
+    specs: List[xdr.SCSpecEntry],
+    client_type: str,
+    runtime: str = "inline",
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
 ) -> Tuple[str, List[str]]:
     """Generate bindings plus printable notes about duplicate or renamed events.
 
     ``client_type`` is "sync", "async" or "both"; anything else (the tests and
     the corpus checker pass "none") skips client generation entirely.
+
+    ``runtime`` is "inline" to define the event and error helpers in the
+    module itself, keeping it dependent on stellar_sdk alone, or "shared" to
+    import them from ``stellar_contract_bindings.runtime``. ``options`` turns
+    on optional features of the generated code, see :class:`GeneratorOptions`.
     """
     append_underscore(specs)
+    return _generate_module(
+        specs, client_type, resolve_udt_names(specs), runtime, options
+    )
 
+
+def _generate_module(
+    specs: List[xdr.SCSpecEntry],
+    client_type: str,
+    udt_names: dict[str, str],
+    runtime: str = "inline",
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+    imported: frozenset[str] = frozenset(),
+    import_line: str | None = None,
+) -> Tuple[str, List[str]]:
+    # UDTs named in ``imported`` are defined elsewhere and brought in by
+    # ``import_line``; everything else the specs declare is rendered here.
     event_specs: List[xdr.SCSpecEventV0] = [
         spec.event_v0
         for spec in specs
         if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0
     ]
-    udt_names = resolve_udt_names(specs)
     resolve_udt_name = _udt_reference_resolver(udt_names)
+    codecs = _codec_functions(set(udt_names.values()), options)
 
     generated = []
     diagnostics: List[str] = []
 
     for spec in specs:
-        if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
-            name = udt_names[spec.udt_enum_v0.name.decode()]
-            generated.append(render_enum(spec.udt_enum_v0, name))
-        if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0:
-            name = udt_names[spec.udt_error_enum_v0.name.decode()]
-            generated.append(render_error_enum(spec.udt_error_enum_v0, name))
-        if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
-            name = udt_names[spec.udt_struct_v0.name.decode()]
-            if is_tuple_struct(spec.udt_struct_v0):
-                generated.append(
-                    render_tuple_struct(spec.udt_struct_v0, name, resolve_udt_name)
-                )
-            else:
-                generated.append(
-                    render_struct(spec.udt_struct_v0, name, resolve_udt_name)
+        spec_name = _udt_spec_name(spec)
+        if spec_name is not None and spec_name not in imported:
+            generated.append(
+                render_udt(
+                    spec, udt_names[spec_name], resolve_udt_name, options, codecs
                 )
-        if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
-            name = udt_names[spec.udt_union_v0.name.decode()]
-            generated.append(render_union(spec.udt_union_v0, name, resolve_udt_name))
+            )
 
     if event_specs:
         event_class_names, event_union_name = resolve_event_names(
             specs, event_specs, udt_names
         )
         diagnostics = event_diagnostics(event_specs, event_class_names)
-        generated.append(render_event_helpers())
-        for event_spec, event_cls_name in zip(event_specs, event_class_names):
-            generated.append(render_event(event_spec, event_cls_name, resolve_udt_name))
+        generated.append(render_event_support(runtime))
+        shared = events_sharing_topics(event_specs)
+        for index, (event_spec, event_cls_name) in enumerate(
+            zip(event_specs, event_class_names)
+        ):
+            generated.append(
+                render_event(
+                    event_spec,
+                    event_cls_name,
+                    resolve_udt_name,
+                    options,
+                    codecs,
+                    shares_topics=index in shared,
+                )
+            )
         generated.append(
             render_event_dispatcher(
-                event_specs, event_class_names, union_name=event_union_name
+                event_specs,
+                event_class_names,
+                union_name=event_union_name,
+                raw_data=options.lazy_events,
             )
         )
 
@@ -1433,22 +3695,564 @@ def generate_binding_with_diagnostics(
         if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0
         and not spec.function_v0.name.sc_symbol.decode().startswith("__")
     ]
-    generated.append(render_client(function_specs, client_type, resolve_udt_name))
+    generated.append(
+        render_client(function_specs, client_type, resolve_udt_name, codecs)
+    )
 
-    body = "\n".join(generated)
+    body = _with_codec_functions(generated, codecs)
     header = [
         render_info(),
-        render_imports(client_type, has_events=bool(event_specs)),
+        render_imports(
+            client_type,
+            has_events=bool(event_specs),
+            has_arrays=_uses_arrays(body),
+            has_caches=_helpers_use_functools(_used_scval_helpers(body), runtime),
+            has_intern=_uses_intern(body, runtime),
+            has_sequences="Sequence[" in body,
+            has_mappings="Mapping[" in body,
+        ),
     ]
+    if import_line:
+        header.append(import_line)
     # Error enums and SC_SPEC_TYPE_ERROR values are the only users of the
     # error helper, and both are rare; emit it only when the body calls it.
-    if "_from_error_scval(" in body:
-        header.append(render_scval_helpers())
+    header.extend(_support_header(body, bool(event_specs), runtime))
     return "\n".join(header + [body]), diagnostics
 
 
-def generate_binding(specs: List[xdr.SCSpecEntry], client_type: str) -> str:
-    return generate_binding_with_diagnostics(specs, client_type)[0]
+def _with_codec_functions(parts: List[str], codecs: CodecFunctions) -> str:
+    # The classes only call the codec functions at runtime, but defining them
+    # first keeps them together at the top of the module.
+    functions = codecs.render()
+    return "\n".join([functions] + parts if functions else parts)
+
+
+def generate_binding(
+    specs: List[xdr.SCSpecEntry],
+    client_type: str,
+    runtime: str = "inline",
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+) -> str:
+    return generate_binding_with_diagnostics(specs, client_type, runtime, options)[0]
+
+
+def render_package_reference():
+    # Names from sibling modules are reached as attributes of the package, so
+    # that its lazy __getattr__ imports them on first use rather than when this
+    # module is imported. The package is always in sys.modules by now: it is
+    # imported before any of its submodules.
+    return '_pkg = __import__("sys").modules[__package__]'
+
+
+_PACKAGE_INIT_TEMPLATE = _template(
+    """
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+# Exported name -> submodule defining it. Nothing is imported until a name is
+# first looked up; it is then cached as a module attribute, so later lookups
+# never reach __getattr__ again.
+_LAZY = {
+    {%- for name, module in exports %}
+    {{ name | tojson }}: {{ ("." ~ module) | tojson }},
+    {%- endfor %}
+}
+
+__all__ = [
+    {%- for name, _ in exports %}
+    {{ name | tojson }},
+    {%- endfor %}
+]
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if _TYPE_CHECKING:
+    {%- for module, names in modules %}
+    from .{{ module }} import {{ names | join(', ') }}
+    {%- else %}
+    pass
+    {%- endfor %}
+"""
+)
+
+
+def render_package_init(modules: List[Tuple[str, List[str]]]):
+    return _PACKAGE_INIT_TEMPLATE.render(
+        exports=[(name, module) for module, names in modules for name in names],
+        modules=modules,
+    )
+
+
+def _package_module_name(class_name: str, used: set[str]) -> str:
+    name = "_" + camel_to_snake(class_name).lstrip("_")
+    candidate = name
+    suffix = 2
+    while candidate in used:
+        candidate = f"{name}{suffix}"
+        suffix += 1
+    used.add(candidate)
+    return candidate
+
+
+def _package_resolver(udt_names: dict[str, str], local: set[str]) -> UdtNameResolver:
+    resolve = _udt_reference_resolver(udt_names)
+
+    def resolver(spec_name: str) -> str:
+        name = resolve(spec_name)
+        return name if name in local else f"_pkg.{name}"
+
+    return resolver
+
+
+def _package_module(
+    body: str,
+    client_type: str = "none",
+    has_events: bool = False,
+    runtime: str = "inline",
+) -> str:
+    header = [
+        render_info(),
+        render_imports(
+            client_type,
+            has_events=has_events,
+            has_arrays=_uses_arrays(body),
+            has_caches=_helpers_use_functools(_used_scval_helpers(body), runtime),
+            has_intern=_uses_intern(body, runtime),
+            has_sequences="Sequence[" in body,
+            has_mappings="Mapping[" in body,
+        ),
+    ]
+    if "_pkg." in body:
+        header.append(render_package_reference())
+    header.extend(_support_header(body, has_events, runtime))
+    return "\n".join(header + [body])
+
+
+def generate_package_with_diagnostics(
+    specs: List[xdr.SCSpecEntry],
+    client_type: str,
+    runtime: str = "inline",
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+) -> Tuple[dict[str, str], List[str]]:
+    """Generate bindings as a package whose names load on first use.
+
+    Each UDT gets its own submodule (a union shares its module with its Kind
+    enum), events and clients get one each, and ``__init__`` imports none of
+    them up front: a module ``__getattr__`` imports the defining submodule the
+    first time a name is looked up. References between submodules go through
+    the package the same way, so importing ``Client`` does not execute the
+    class body of every type the contract declares.
+
+    Returns the source of each file keyed by its name within the package, plus
+    the same diagnostics as ``generate_binding_with_diagnostics``.
+    """
+    append_underscore(specs)
+
+    event_specs: List[xdr.SCSpecEventV0] = [
+        spec.event_v0
+        for spec in specs
+        if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0
+    ]
+    udt_names = resolve_udt_names(specs)
+
+    # Module names must not shadow an exported name: importing a submodule
+    # binds it as an attribute of the package.
+    used_modules = _declared_type_names(specs, udt_names) | set(
+        _RESERVED_MODULE_NAMES
+    )
+    files: dict[str, str] = {}
+    modules: List[Tuple[str, List[str]]] = []
+    diagnostics: List[str] = []
+
+    for spec in specs:
+        spec_name = _udt_spec_name(spec)
+        if spec_name is None:
+            continue
+        class_name = udt_names[spec_name]
+        names = [class_name]
+        if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+            names.append(f"{class_name}Kind")
+        module = _package_module_name(class_name, used_modules)
+        resolve_udt_name = _package_resolver(udt_names, {class_name})
+        codecs = _codec_functions(set(udt_names.values()), options)
+        udt = render_udt(spec, class_name, resolve_udt_name, options, codecs)
+        files[f"{module}.py"] = _package_module(
+            _with_codec_functions([udt], codecs), runtime=runtime
+        )
+        modules.append((module, names))
+
+    if event_specs:
+        event_class_names, event_union_name = resolve_event_names(
+            specs, event_specs, udt_names
+        )
+        diagnostics = event_diagnostics(event_specs, event_class_names)
+        resolve_udt_name = _package_resolver(udt_names, set())
+        codecs = _codec_functions(set(udt_names.values()), options)
+        events = [render_event_support(runtime)]
+        shared = events_sharing_topics(event_specs)
+        for index, (event_spec, event_cls_name) in enumerate(
+            zip(event_specs, event_class_names)
+        ):
+            events.append(
+                render_event(
+                    event_spec,
+                    event_cls_name,
+                    resolve_udt_name,
+                    options,
+                    codecs,
+                    shares_topics=index in shared,
+                )
+            )
+        events.append(
+            render_event_dispatcher(
+                event_specs,
+                event_class_names,
+                union_name=event_union_name,
+                raw_data=options.lazy_events,
+            )
+        )
+        module = _package_module_name("events", used_modules)
+        files[f"{module}.py"] = _package_module(
+            _with_codec_functions(events, codecs), has_events=True, runtime=runtime
+        )
+        modules.append(
+            (
+                module,
+                event_class_names
+                + [event_union_name, "parse_event", "UnparsedEventError"],
+            )
+        )
+
+    function_specs: List[xdr.SCSpecFunctionV0] = [
+        spec.function_v0
+        for spec in specs
+        if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0
+        and not spec.function_v0.name.sc_symbol.decode().startswith("__")
+    ]
+    resolve_udt_name = _package_resolver(udt_names, set())
+    codecs = _codec_functions(set(udt_names.values()), options)
+    client = render_client(function_specs, client_type, resolve_udt_name, codecs)
+    if client.strip():
+        module = _package_module_name("client", used_modules)
+        files[f"{module}.py"] = _package_module(
+            _with_codec_functions([client], codecs), client_type, runtime=runtime
+        )
+        names = ["NULL_ACCOUNT"]
+        if client_type in ("sync", "both"):
+            names.append("Client")
+        if client_type in ("async", "both"):
+            names.append("ClientAsync")
+        modules.append((module, names))
+
+    files["__init__.py"] = "\n".join([render_info(), render_package_init(modules)])
+    return files, diagnostics
+
+
+def generate_package(
+    specs: List[xdr.SCSpecEntry],
+    client_type: str,
+    runtime: str = "inline",
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+) -> dict[str, str]:
+    return generate_package_with_diagnostics(specs, client_type, runtime, options)[0]
+
+
+SHARED_TYPES_MODULE = "shared_types"
+
+
+def _udt_signature(spec: xdr.SCSpecEntry) -> bytes:
+    """The XDR of a UDT entry with its documentation and crate name cleared.
+
+    Two entries with the same signature put the same values on the wire, so
+    one generated class serves both, as long as the types they reference are
+    shared too.
+    """
+    entry = xdr.SCSpecEntry.from_xdr_bytes(spec.to_xdr_bytes())
+    udt: (
+        xdr.SCSpecUDTStructV0
+        | xdr.SCSpecUDTUnionV0
+        | xdr.SCSpecUDTEnumV0
+        | xdr.SCSpecUDTErrorEnumV0
+        | None
+    )
+    if entry.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
+        udt, parts = entry.udt_struct_v0, entry.udt_struct_v0.fields
+    elif entry.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+        udt = entry.udt_union_v0
+        parts = [
+            case.tuple_case if case.tuple_case is not None else case.void_case
+            for case in udt.cases
+        ]
+    elif entry.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
+        udt, parts = entry.udt_enum_v0, entry.udt_enum_v0.cases
+    else:
+        udt, parts = entry.udt_error_enum_v0, entry.udt_error_enum_v0.cases
+    udt.doc = b""
+    udt.lib = b""
+    for part in parts:
+        part.doc = b""
+    return entry.to_xdr_bytes()
+
+
+def _type_udt_references(td: xdr.SCSpecTypeDef) -> List[str]:
+    t = td.type
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_UDT:
+        return [td.udt.name.decode()]
+    if t == xdr.SCSpecType.SC_SPEC_TYPE_OPTION:
+        inner = [td.option.value_type]
+    elif t == xdr.SCSpecType.SC_SPEC_TYPE_RESULT:
+        inner = [td.result.ok_type, td.result.error_type]
+    elif t == xdr.SCSpecType.SC_SPEC_TYPE_VEC:
+        inner = [td.vec.element_type]
+    elif t == xdr.SCSpecType.SC_SPEC_TYPE_MAP:
+        inner = [td.map.key_type, td.map.value_type]
+    elif t == xdr.SCSpecType.SC_SPEC_TYPE_TUPLE:
+        inner = td.tuple.value_types
+    else:
+        return []
+    return [name for value in inner for name in _type_udt_references(value)]
+
+
+def _udt_references(spec: xdr.SCSpecEntry) -> List[str]:
+    if spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
+        types = [field.type for field in spec.udt_struct_v0.fields]
+    elif spec.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+        types = [
+            value
+            for case in spec.udt_union_v0.cases
+            if case.tuple_case is not None
+            for value in case.tuple_case.type
+        ]
+    else:
+        return []
+    return sorted({name for td in types for name in _type_udt_references(td)})
+
+
+def _shared_udt_groups(
+    udts: dict[str, dict[str, xdr.SCSpecEntry]],
+) -> dict[Tuple[str, str], int]:
+    """Group the UDTs that several contracts declare identically.
+
+    ``udts`` maps each contract to its UDT entries by spec name. The result
+    maps ``(contract, spec name)`` to a group number for every UDT that is
+    shared; UDTs missing from it stay local to their contract.
+
+    Equal signatures are not enough on their own: two ``Position`` structs that
+    both reference an ``Asset`` are only interchangeable if their ``Asset``
+    types are. Groups are therefore split by the groups of the types their
+    members reference until nothing changes, and a group left with a single
+    member is dropped.
+    """
+    by_signature: dict[bytes, List[Tuple[str, str]]] = {}
+    for contract, entries in udts.items():
+        for spec_name, spec in entries.items():
+            by_signature.setdefault(_udt_signature(spec), []).append(
+                (contract, spec_name)
+            )
+    partition = [members for members in by_signature.values() if len(members) > 1]
+
+    while True:
+        group_of = {
+            member: group
+            for group, members in enumerate(partition)
+            for member in members
+        }
+        refined: List[List[Tuple[str, str]]] = []
+        for group, members in enumerate(partition):
+            split: dict[tuple, List[Tuple[str, str]]] = {}
+            for contract, spec_name in members:
+                targets = tuple(
+                    group_of.get((contract, reference))
+                    for reference in _udt_references(udts[contract][spec_name])
+                )
+                # A reference to a local (or undeclared) type pins the
+                # referencing type to its own contract as well.
+                if None not in targets:
+                    split.setdefault(targets, []).append((contract, spec_name))
+            refined.extend(subgroup for subgroup in split.values() if len(subgroup) > 1)
+        if refined == partition:
+            return group_of
+        partition = refined
+
+
+def generate_family_with_diagnostics(
+    spec_sets: Mapping[str, List[xdr.SCSpecEntry]],
+    client_type: str,
+    runtime: str = "inline",
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+) -> Tuple[dict[str, str], List[str]]:
+    """Generate bindings for a family of contracts as one package.
+
+    Contracts deployed together often declare the same types, and binding each
+    one separately gives every module its own copy of those classes, so that a
+    value decoded by one contract's client is not an instance of the class
+    another contract's client expects. Here a UDT declared identically by
+    several contracts, docs aside, is generated once into ``shared_types``;
+    the rest stay in the contract's module. Distinct shared types that claim
+    the same name are told apart by ``resolve_udt_names``, exactly as
+    module-qualified names are, and each contract module imports its shared
+    types under the names its single-module binding would give them.
+
+    ``spec_sets`` maps a module name to the specs of that contract. Returns
+    the source of each file keyed by its name within the package, plus the
+    diagnostics of every contract, each prefixed with its module name.
+    """
+    used_modules = {"__init__", SHARED_TYPES_MODULE}
+    contract_modules: dict[str, str] = {}
+    udts: dict[str, dict[str, xdr.SCSpecEntry]] = {}
+    for contract, specs in spec_sets.items():
+        module = python_identifier(contract)
+        candidate = module
+        suffix = 2
+        while candidate in used_modules:
+            candidate = f"{module}{suffix}"
+            suffix += 1
+        used_modules.add(candidate)
+        contract_modules[contract] = candidate
+
+        append_underscore(specs)
+        entries: dict[str, xdr.SCSpecEntry] = {}
+        for spec in specs:
+            spec_name = _udt_spec_name(spec)
+            if spec_name is not None:
+                # resolve_udt_names keeps the first declaration of a name too.
+                entries.setdefault(spec_name, spec)
+        udts[contract] = entries
+
+    group_of = _shared_udt_groups(udts)
+    # Each shared class is rendered from its first declaration, so the shared
+    # module follows the order of the contracts and of their specs.
+    representatives: dict[int, Tuple[str, str]] = {}
+    for contract, entries in udts.items():
+        for spec_name in entries:
+            group = group_of.get((contract, spec_name))
+            if group is not None:
+                representatives.setdefault(group, (contract, spec_name))
+    groups = list(representatives)
+
+    # Qualifying each shared name by the contract it was taken from lets
+    # resolve_udt_names fall back to that path for names claimed more than once.
+    qualified: dict[int, str] = {}
+    renamed_specs = []
+    for group in groups:
+        contract, spec_name = representatives[group]
+        qualified[group] = f"{contract}::{spec_name}"
+        entry = xdr.SCSpecEntry.from_xdr_bytes(
+            udts[contract][spec_name].to_xdr_bytes()
+        )
+        if entry.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
+            entry.udt_struct_v0.name = qualified[group].encode()
+        elif entry.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+            entry.udt_union_v0.name = qualified[group].encode()
+        elif entry.kind == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
+            entry.udt_enum_v0.name = qualified[group].encode()
+        else:
+            entry.udt_error_enum_v0.name = qualified[group].encode()
+        renamed_specs.append(entry)
+    resolved = resolve_udt_names(renamed_specs)
+    class_of = {group: resolved[qualified[group]] for group in groups}
+
+    def shared_names(contract: str) -> dict[str, str]:
+        return {
+            spec_name: class_of[group_of[(contract, spec_name)]]
+            for spec_name in udts[contract]
+            if (contract, spec_name) in group_of
+        }
+
+    shared_body = []
+    codecs = _codec_functions(set(class_of.values()), options)
+    for group in groups:
+        contract, spec_name = representatives[group]
+        shared_body.append(
+            render_udt(
+                udts[contract][spec_name],
+                class_of[group],
+                _udt_reference_resolver(shared_names(contract)),
+                options,
+                codecs,
+            )
+        )
+    files = {
+        f"{SHARED_TYPES_MODULE}.py": _package_module(
+            _with_codec_functions(shared_body, codecs), runtime=runtime
+        )
+    }
+
+    diagnostics: List[str] = []
+    for contract, specs in spec_sets.items():
+        # A contract module names every type as its single-module binding
+        # would, importing the shared ones under that name.
+        udt_names = resolve_udt_names(specs)
+        imported = shared_names(contract)
+        aliases: List[str] = []
+        for spec_name, shared_name in imported.items():
+            pairs = [(shared_name, udt_names[spec_name])]
+            if (
+                udts[contract][spec_name].kind
+                == xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0
+            ):
+                pairs.append((f"{shared_name}Kind", f"{udt_names[spec_name]}Kind"))
+            aliases.extend(
+                name if name == alias else f"{name} as {alias}"
+                for name, alias in pairs
+            )
+        import_line = (
+            f"from .{SHARED_TYPES_MODULE} import {', '.join(aliases)}"
+            if aliases
+            else None
+        )
+        generated, contract_diagnostics = _generate_module(
+            specs,
+            client_type,
+            udt_names,
+            runtime,
+            options,
+            frozenset(imported),
+            import_line,
+        )
+        module = contract_modules[contract]
+        files[f"{module}.py"] = generated
+        diagnostics.extend(f"{module}: {message}" for message in contract_diagnostics)
+
+    files["__init__.py"] = render_info() + "\n"
+    return files, diagnostics
+
+
+def generate_family(
+    spec_sets: Mapping[str, List[xdr.SCSpecEntry]],
+    client_type: str,
+    runtime: str = "inline",
+    options: GeneratorOptions = _DEFAULT_OPTIONS,
+) -> dict[str, str]:
+    return generate_family_with_diagnostics(
+        spec_sets, client_type, runtime, options
+    )[0]
+
+
+def _read_cache_entry(content: str | None) -> Tuple[dict[str, str], List[str]] | None:
+    # The diagnostics are stored with the files so a hit still shows them. An
+    # entry that does not read back (corrupted, or written in an older shape)
+    # is a miss, and regenerating overwrites it.
+    if content is None:
+        return None
+    try:
+        entry = json.loads(content)
+        return dict(entry["files"]), list(entry["diagnostics"])
+    except (ValueError, KeyError, TypeError):
+        return None
 
 
 @click.command(name="python")
@@ -1469,7 +4273,90 @@ def generate_binding(specs: List[xdr.SCSpecEntry], client_type: str) -> str:
     default="both",
     help="Client type to generate, defaults to both sync and async",
 )
-def command(contract_id: str, rpc_url: str, output: str, client_type: str):
+@click.option(
+    "--layout",
+    type=click.Choice(["module", "package"], case_sensitive=False),
+    default="module",
+    help=(
+        "Write a single bindings.py module, or a bindings/ package whose names "
+        "are imported on first use, defaults to module"
+    ),
+)
+@click.option(
+    "--runtime",
+    type=click.Choice(["inline", "shared"], case_sensitive=False),
+    default="inline",
+    help=(
+        "Define the event and error helpers in the bindings, or import them "
+        "from stellar_contract_bindings at runtime, defaults to inline"
+    ),
+)
+@click.option(
+    "--slots",
+    is_flag=True,
+    default=False,
+    help="Give generated structs, unions and events __slots__ to save memory",
+)
+@click.option(
+    "--frozen",
+    is_flag=True,
+    default=False,
+    help="Generate structs and unions as immutable types with cached hashes",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    default=False,
+    help="Decode the fields of structs from from_scval on first access",
+)
+@click.option(
+    "--arrays",
+    is_flag=True,
+    default=False,
+    help="Decode vectors of 32- and 64-bit integers into array.array",
+)
+@click.option(
+    "--memoryviews",
+    is_flag=True,
+    default=False,
+    help="Decode Bytes and BytesN into memoryview rather than copies",
+)
+@click.option(
+    "--mypyc",
+    is_flag=True,
+    default=False,
+    help="Emit bindings that type-check with mypy and compile with mypyc",
+)
+@click.option(
+    "--intern-symbols",
+    is_flag=True,
+    default=False,
+    help="Intern decoded Symbol values so repeated symbols share one string",
+)
+@click.option(
+    "--lazy-events",
+    is_flag=True,
+    default=False,
+    help="Decode the data of parsed events on first access",
+)
+@cache_dir_option
+def command(
+    contract_id: str,
+    rpc_url: str,
+    output: str,
+    client_type: str,
+    layout: str,
+    runtime: str,
+    slots: bool,
+    frozen: bool,
+    lazy: bool,
+    arrays: bool,
+    memoryviews: bool,
+    mypyc: bool,
+    intern_symbols: bool,
+    lazy_events: bool,
+    cache_dir: str,
+):
     """Generate Python bindings for a Soroban contract"""
     if not StrKey.is_valid_contract(contract_id):
         click.echo(f"Invalid contract ID: {contract_id}", err=True)
@@ -1479,31 +4366,82 @@ def command(contract_id: str, rpc_url: str, output: str, client_type: str):
     if output is None:
         output = os.getcwd()
     try:
-        specs = get_specs_by_contract_id(contract_id, rpc_url)
-    except Exception as e:
-        click.echo(f"Get contract specs failed: {e}", err=True)
+        options = GeneratorOptions(
+            slots=slots,
+            frozen=frozen,
+            lazy=lazy,
+            arrays=arrays,
+            memoryviews=memoryviews,
+            mypyc=mypyc,
+            intern_symbols=intern_symbols,
+            lazy_events=lazy_events,
+        )
+    except ValueError as e:
+        click.echo(f"Invalid options: {e}", err=True)
         raise click.Abort()
-
-    click.echo("Generating Python bindings")
-    generated, diagnostics = generate_binding_with_diagnostics(
-        specs, client_type=client_type
-    )
-    for diagnostic in diagnostics:
-        click.echo(diagnostic, err=True)
     try:
-        generated = black.format_str(generated, mode=black.Mode())
-    except Exception as e:
-        click.echo(
-            f"formatting failed, there may be issues with the generated binding, please report to us: {e}",
-            err=True,
+        cached = lookup_contract_binding(
+            cache_dir,
+            contract_id,
+            rpc_url,
+            "python",
+            client_type=client_type,
+            layout=layout,
+            runtime=runtime,
+            # The cached files are formatted, so black's version is in the key.
+            black=black.__version__,
+            **options.as_dict(),
         )
+        hit = _read_cache_entry(cached.content)
+        if hit is None:
+            specs = get_specs_by_contract_id(contract_id, rpc_url)
+    except Exception as e:
+        click.echo(f"Get contract specs failed: {e}", err=True)
         raise click.Abort()
 
-    if not os.path.exists(output):
-        os.makedirs(output)
-    output_path = os.path.join(output, "bindings.py")
-    with open(output_path, "w") as f:
-        f.write(generated)
+    # Generated files keyed by their "/"-separated path relative to output.
+    files: dict[str, str]
+    diagnostics: List[str]
+    if hit is not None:
+        click.echo("Using cached Python bindings")
+        files, diagnostics = hit
+        for diagnostic in diagnostics:
+            click.echo(diagnostic, err=True)
+    else:
+        click.echo("Generating Python bindings")
+        if layout == "package":
+            package, diagnostics = generate_package_with_diagnostics(
+                specs, client_type=client_type, runtime=runtime, options=options
+            )
+            files = {f"bindings/{name}": source for name, source in package.items()}
+        else:
+            generated, diagnostics = generate_binding_with_diagnostics(
+                specs, client_type=client_type, runtime=runtime, options=options
+            )
+            files = {"bindings.py": generated}
+        for diagnostic in diagnostics:
+            click.echo(diagnostic, err=True)
+        try:
+            files = {
+                name: black.format_str(source, mode=black.Mode())
+                for name, source in files.items()
+            }
+        except Exception as e:
+            click.echo(
+                f"formatting failed, there may be issues with the generated binding, please report to us: {e}",
+                err=True,
+            )
+            raise click.Abort()
+        cached.store(json.dumps({"files": files, "diagnostics": diagnostics}))
+
+    for name, source in files.items():
+        file_path = os.path.join(output, *name.split("/"))
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(source)
+    output_path = os.path.join(
+        output, "bindings" if layout == "package" else "bindings.py"
+    )
     click.echo(f"Generated Python bindings to {output_path}")
 
 
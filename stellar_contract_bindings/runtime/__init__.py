@@ -0,0 +1,15 @@
+"""Runtime support shared by generated Python bindings.
+
+Bindings generated with ``--runtime shared`` import their helpers from a
+versioned submodule here rather than each carrying a copy, so the helpers are
+loaded once per process however many bindings are imported, and an exception
+such as ``UnparsedEventError`` is the same class in all of them.
+
+A versioned module only grows once released: later releases may add names to
+``v1``, which newer bindings import, but never remove, rename or change the
+signature or behaviour of a name already there. Bindings generated against an
+older ``v1`` therefore keep working with every later release of this package,
+while bindings using a newly added name need at least the release that added
+it. A change that would break existing bindings goes into a new ``v2`` module
+alongside.
+"""
@@ -0,0 +1,474 @@
+"""Version 1 of the runtime support for generated Python bindings.
+
+These are the helpers ``render_event_helpers`` and ``render_scval_helpers``
+inline into every binding, tuned for the event-indexing and decoding hot paths:
+exact type checks ahead of ``isinstance``, static topics compared as bytes
+without going through the ``scval`` converters, base64 topics decoded once
+per distinct string rather than once per event, events that no declared event
+can match rejected on their raw first topic before anything is decoded,
+addresses converted through LRU caches shared by every binding in the process,
+and the ``_xdr_*`` codecs behind ``from_xdr_bytes``/``to_xdr_bytes``, which
+read and write SCVal bytes without building ``xdr.SCVal`` objects.
+"""
+
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from stellar_sdk import Address, scval, xdr
+from stellar_sdk.soroban_rpc import EventInfo
+
+__all__ = [
+    "UnparsedEventError",
+    "_address_from_json",
+    "_address_from_raw",
+    "_address_from_scval",
+    "_address_from_strkey",
+    "_address_to_scval",
+    "_address_topic",
+    "_coerce_event_scval",
+    "_event_dispatch_key",
+    "_event_topics_and_data",
+    "_event_topics_and_raw_data",
+    "_from_error_scval",
+    "_json_address",
+    "_json_string",
+    "_static_topic_key",
+    "_static_topic_keys",
+    "_static_topic_matches",
+    "_struct_values",
+    "_xdr_decode",
+    "_xdr_mismatch",
+    "_xdr_read_address",
+    "_xdr_read_as",
+    "_xdr_read_bool",
+    "_xdr_read_header",
+    "_xdr_read_int",
+    "_xdr_read_interned_symbol",
+    "_xdr_read_opaque",
+    "_xdr_read_symbol",
+    "_xdr_read_view",
+    "_xdr_write_bool",
+    "_xdr_write_header",
+    "_xdr_write_int",
+    "_xdr_write_opaque",
+    "address_cache_stats",
+]
+
+_SCVal = xdr.SCVal
+_SCV_ADDRESS = xdr.SCValType.SCV_ADDRESS
+_SCV_ERROR = xdr.SCValType.SCV_ERROR
+_SCV_MAP = xdr.SCValType.SCV_MAP
+_SCV_STRING = xdr.SCValType.SCV_STRING
+_SCV_SYMBOL = xdr.SCValType.SCV_SYMBOL
+_SC_ADDRESS_TYPE_ACCOUNT = xdr.SCAddressType.SC_ADDRESS_TYPE_ACCOUNT
+_SC_ADDRESS_TYPE_CONTRACT = xdr.SCAddressType.SC_ADDRESS_TYPE_CONTRACT
+_Unpacker = xdr.base.Unpacker
+
+_XDR_FALSE = b"\x00\x00\x00\x00\x00\x00\x00\x00"
+_XDR_TRUE = b"\x00\x00\x00\x00\x00\x00\x00\x01"
+_XDR_PRESENT = b"\x00\x00\x00\x01"
+_XDR_SYMBOL = b"\x00\x00\x00\x0f"
+_XDR_ACCOUNT = b"\x00\x00\x00\x12\x00\x00\x00\x00\x00\x00\x00\x00"
+_XDR_CONTRACT = b"\x00\x00\x00\x12\x00\x00\x00\x01"
+
+
+# Bindings convert the same few addresses over and over, and parsing a strkey
+# or encoding one from its raw key is the slow part, so both directions go
+# through bounded LRU caches, shared by every binding in the process. Cached
+# values are shared between callers, which only read them.
+@lru_cache(maxsize=4096)
+def _address_from_strkey(value: str) -> xdr.SCAddress:
+    return Address(value).to_xdr_sc_address()
+
+
+@lru_cache(maxsize=4096)
+def _address_from_raw(contract: bool, key: bytes) -> Address:
+    if contract:
+        return Address.from_raw_contract(key)
+    return Address.from_raw_account(key)
+
+
+def _address_to_scval(value: Union[Address, str]) -> xdr.SCVal:
+    if isinstance(value, str):
+        address = _address_from_strkey(value)
+    else:
+        address = value.to_xdr_sc_address()
+    return _SCVal(_SCV_ADDRESS, address=address)
+
+
+# Topic filters name the same accounts for every subscription rebuilt.
+@lru_cache(maxsize=4096)
+def _address_topic(value: Union[Address, str]) -> str:
+    return _address_to_scval(value).to_xdr()
+
+
+# from_dict reads back the strkeys to_dict wrote, or the Address itself.
+@lru_cache(maxsize=4096)
+def _address_from_json(value: Union[Address, str]) -> Address:
+    return Address(value) if isinstance(value, str) else value
+
+
+def _address_from_scval(value: xdr.SCVal) -> Address:
+    address = value.address
+    if value.type == _SCV_ADDRESS and address is not None:
+        account, contract = address.account_id, address.contract_id
+        if address.type == _SC_ADDRESS_TYPE_ACCOUNT and account is not None:
+            key = account.account_id.ed25519
+            if key is not None:
+                return _address_from_raw(False, key.uint256)
+        if address.type == _SC_ADDRESS_TYPE_CONTRACT and contract is not None:
+            return _address_from_raw(True, contract.contract_id.hash)
+    # Other kinds of address are not cached, and scval rejects other values.
+    return scval.from_address(value)
+
+
+def address_cache_stats() -> Dict[str, Dict[str, Optional[float]]]:
+    """Hits, misses and hit ratio of the address caches used by the codecs.
+
+    ``encode`` counts strkey strings passed where an address is expected;
+    ``decode`` counts account and contract addresses decoded into Address;
+    ``topic`` counts addresses encoded into event topic filters; ``json``
+    counts addresses rebuilt by ``from_dict``. The caches are shared by every
+    binding using this runtime.
+    """
+    stats: Dict[str, Dict[str, Optional[float]]] = {}
+    for name, cache in (
+        ("encode", _address_from_strkey),
+        ("decode", _address_from_raw),
+        ("topic", _address_topic),
+        ("json", _address_from_json),
+    ):
+        info = cache.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_ratio": info.hits / lookups if lookups else 0.0,
+        }
+    return stats
+
+
+def _coerce_event_scval(value: Union[xdr.SCVal, str, bytes]) -> xdr.SCVal:
+    value_type = type(value)
+    if value_type is _SCVal:
+        return value  # type: ignore[return-value]
+    if value_type is bytes:
+        return _SCVal.from_xdr_bytes(value)  # type: ignore[arg-type]
+    if value_type is str:
+        return _SCVal.from_xdr(value)  # type: ignore[arg-type]
+    # Subclasses take the slow path.
+    if isinstance(value, _SCVal):
+        return value
+    if isinstance(value, bytes):
+        return _SCVal.from_xdr_bytes(value)
+    return _SCVal.from_xdr(value)
+
+
+# An event stream repeats a handful of topics (the event names, a few hot
+# addresses) across millions of events. The decoded values are shared between
+# callers, which only read them.
+@lru_cache(maxsize=4096)
+def _decode_topic(value: str) -> xdr.SCVal:
+    return _SCVal.from_xdr(value)
+
+
+def _coerce_event_topic(value: Union[xdr.SCVal, str, bytes]) -> xdr.SCVal:
+    if type(value) is str:
+        return _decode_topic(value)
+    return _coerce_event_scval(value)
+
+
+def _event_topics_and_raw_data(
+    event: Union[
+        xdr.ContractEvent,
+        EventInfo,
+        Tuple[
+            Sequence[Union[xdr.SCVal, str, bytes]],
+            Union[xdr.SCVal, str, bytes],
+        ],
+    ],
+) -> Tuple[List[xdr.SCVal], Union[xdr.SCVal, str, bytes]]:
+    """Normalize the topics of transaction-meta, RPC, or raw-XDR event input,
+    leaving the data as given for callers that look at the topics alone."""
+    if isinstance(event, xdr.ContractEvent):
+        if event.body.v0 is None:
+            raise ValueError("contract event has no v0 body")
+        return list(event.body.v0.topics), event.body.v0.data
+    if isinstance(event, EventInfo):
+        return [_coerce_event_topic(topic) for topic in event.topic], event.value
+    if isinstance(event, tuple) and len(event) == 2:
+        topics, data = event
+        return [_coerce_event_topic(topic) for topic in topics], data
+    raise TypeError("event must be ContractEvent, EventInfo, or a (topics, data) tuple")
+
+
+def _event_topics_and_data(
+    event: Union[
+        xdr.ContractEvent,
+        EventInfo,
+        Tuple[
+            Sequence[Union[xdr.SCVal, str, bytes]],
+            Union[xdr.SCVal, str, bytes],
+        ],
+    ],
+) -> Tuple[List[xdr.SCVal], xdr.SCVal]:
+    """Normalize transaction-meta, RPC, or raw-XDR event input."""
+    topics, data = _event_topics_and_raw_data(event)
+    return topics, _coerce_event_scval(data)
+
+
+def _static_topic_matches(topic: xdr.SCVal, expected: str) -> bool:
+    """SEP-48: when matching, parsers should tolerate static topics being of
+    the SCVal type SCV_SYMBOL or SCV_STRING."""
+    topic_type = topic.type
+    if topic_type == _SCV_SYMBOL and topic.sym is not None:
+        return topic.sym.sc_symbol == expected.encode()
+    if topic_type == _SCV_STRING and topic.str is not None:
+        return topic.str.sc_string == expected.encode()
+    return False
+
+
+def _static_topic_key(topic: xdr.SCVal) -> Optional[bytes]:
+    """The bytes of a symbol or string topic, which is how parse_event looks
+    up the events declaring it as their first static topic; None otherwise."""
+    topic_type = topic.type
+    if topic_type == _SCV_SYMBOL and topic.sym is not None:
+        return topic.sym.sc_symbol
+    if topic_type == _SCV_STRING and topic.str is not None:
+        return topic.str.sc_string
+    return None
+
+
+def _static_topic_keys(names: List[bytes]) -> Dict[Union[str, bytes], bytes]:
+    """Map the XDR bytes and base64 of each name, as a symbol topic and as a
+    string topic, to the name, so raw topics are looked up without decoding."""
+    keys: Dict[Union[str, bytes], bytes] = {}
+    for name in names:
+        for topic in (
+            _SCVal(_SCV_SYMBOL, sym=xdr.SCSymbol(name)),
+            _SCVal(_SCV_STRING, str=xdr.SCString(name)),
+        ):
+            keys[topic.to_xdr_bytes()] = name
+            keys[topic.to_xdr()] = name
+    return keys
+
+
+def _event_dispatch_key(
+    event: Union[
+        xdr.ContractEvent,
+        EventInfo,
+        Tuple[
+            Sequence[Union[xdr.SCVal, str, bytes]],
+            Union[xdr.SCVal, str, bytes],
+        ],
+    ],
+    keys: Dict[Union[str, bytes], bytes],
+) -> Tuple[Optional[bytes], int]:
+    """The static topic key of the event's first topic and its topic count,
+    read without decoding anything. A raw first topic is looked up in
+    ``keys``: XDR is canonical, so the symbols and strings those were built
+    from have no other encoding, and any other topic has no key."""
+    topics: Sequence[Union[xdr.SCVal, str, bytes]]
+    if type(event) is EventInfo:
+        topics = event.topic
+    elif isinstance(event, xdr.ContractEvent):
+        if event.body.v0 is None:
+            raise ValueError("contract event has no v0 body")
+        topics = event.body.v0.topics
+    elif isinstance(event, EventInfo):
+        topics = event.topic
+    elif isinstance(event, tuple) and len(event) == 2:
+        topics = event[0]
+    else:
+        raise TypeError(
+            "event must be ContractEvent, EventInfo, or a (topics, data) tuple"
+        )
+    if not topics:
+        return None, 0
+    first = topics[0]
+    if type(first) is str or type(first) is bytes:
+        return keys.get(first), len(topics)
+    if isinstance(first, _SCVal):
+        return _static_topic_key(first), len(topics)
+    return keys.get(first), len(topics)
+
+
+def _from_error_scval(value: xdr.SCVal) -> xdr.SCError:
+    if value.type != _SCV_ERROR or value.error is None:
+        raise ValueError(f"expected SCV_ERROR, got {value.type}")
+    return value.error
+
+
+def _json_string(value: Union[str, bytes]) -> str:
+    # Decoded strings are bytes and need not be UTF-8; the escapes keep any
+    # other bytes, and from_dict encodes them back the same way.
+    if isinstance(value, str):
+        return value
+    return bytes(value).decode("utf-8", "surrogateescape")
+
+
+def _json_address(value: Union[Address, str]) -> str:
+    return value if isinstance(value, str) else value.address
+
+
+def _struct_values(
+    value: xdr.SCVal, symbols: Tuple[bytes, ...]
+) -> Optional[List[xdr.SCVal]]:
+    """Return the values of a struct map whose keys are exactly ``symbols``,
+    in order, or None when the map has any other layout."""
+    if not isinstance(value, _SCVal) or value.type != _SCV_MAP or value.map is None:
+        return None
+    entries = value.map.sc_map
+    if len(entries) != len(symbols):
+        return None
+    values = []
+    for entry, symbol in zip(entries, symbols):
+        key = entry.key.sym
+        if key is None or key.sc_symbol != symbol:
+            return None
+        values.append(entry.val)
+    return values
+
+
+def _xdr_decode(read, data: bytes):
+    """Read one value with ``read`` and require it to span all of ``data``."""
+    value, pos = read(data, 0)
+    if pos != len(data):
+        raise ValueError(f"Unexpected trailing {len(data) - pos} bytes in XDR data")
+    return value
+
+
+def _xdr_mismatch(tag: bytes, pos: int) -> ValueError:
+    expected = xdr.SCValType(int.from_bytes(tag, "big")).name
+    return ValueError(f"expected {expected} at byte {pos}")
+
+
+def _xdr_read_as(decode, data: bytes, pos: int):
+    """Unpack the xdr.SCVal at ``pos`` and decode it; the general path."""
+    unpacker = _Unpacker(data)
+    unpacker.set_position(pos)
+    value = _SCVal.unpack(unpacker)
+    return decode(value), unpacker.get_position()
+
+
+def _xdr_read_int(
+    data: bytes, pos: int, tag: bytes, size: int, signed: bool
+) -> Tuple[int, int]:
+    start = pos + 4
+    end = start + size
+    if not data.startswith(tag, pos) or len(data) < end:
+        raise _xdr_mismatch(tag, pos)
+    return int.from_bytes(data[start:end], "big", signed=signed), end
+
+
+def _xdr_read_opaque(data: bytes, pos: int, tag: bytes) -> Tuple[bytes, int]:
+    start = pos + 8
+    if not data.startswith(tag, pos) or len(data) < start:
+        raise _xdr_mismatch(tag, pos)
+    length = int.from_bytes(data[pos + 4 : start], "big")
+    end = start + length
+    if len(data) < end:
+        raise _xdr_mismatch(tag, pos)
+    # Opaque data is zero-padded to a multiple of four bytes.
+    return data[start:end], end + (-length % 4)
+
+
+def _xdr_read_view(data: bytes, pos: int, tag: bytes) -> Tuple[memoryview, int]:
+    # As _xdr_read_opaque, but the value is a view of data rather than a copy.
+    start = pos + 8
+    if not data.startswith(tag, pos) or len(data) < start:
+        raise _xdr_mismatch(tag, pos)
+    length = int.from_bytes(data[pos + 4 : start], "big")
+    end = start + length
+    if len(data) < end:
+        raise _xdr_mismatch(tag, pos)
+    return memoryview(data)[start:end], end + (-length % 4)
+
+
+def _xdr_read_symbol(data: bytes, pos: int) -> Tuple[str, int]:
+    value, pos = _xdr_read_opaque(data, pos, _XDR_SYMBOL)
+    return value.decode(), pos
+
+
+def _xdr_read_interned_symbol(data: bytes, pos: int) -> Tuple[str, int]:
+    value, pos = _xdr_read_symbol(data, pos)
+    return sys.intern(value), pos
+
+
+def _xdr_read_bool(data: bytes, pos: int) -> Tuple[bool, int]:
+    if data.startswith(_XDR_TRUE, pos):
+        return True, pos + 8
+    if data.startswith(_XDR_FALSE, pos):
+        return False, pos + 8
+    raise _xdr_mismatch(_XDR_FALSE[:4], pos)
+
+
+def _xdr_read_header(data: bytes, pos: int, tag: bytes) -> Tuple[int, int]:
+    """Return the length of the vector or map at ``pos`` and where its
+    elements start. SCVal makes both optional, so the flag after the tag must
+    be set."""
+    end = pos + 12
+    if (
+        not data.startswith(tag, pos)
+        or not data.startswith(_XDR_PRESENT, pos + 4)
+        or len(data) < end
+    ):
+        raise _xdr_mismatch(tag, pos)
+    return int.from_bytes(data[pos + 8 : end], "big"), end
+
+
+def _xdr_read_address(data: bytes, pos: int) -> Tuple[Address, int]:
+    # Account and contract addresses are read in place, the other kinds
+    # through xdr.SCVal.
+    if data.startswith(_XDR_ACCOUNT, pos):
+        end = pos + 44
+        if len(data) >= end:
+            return _address_from_raw(False, data[pos + 12 : end]), end
+    elif data.startswith(_XDR_CONTRACT, pos):
+        end = pos + 40
+        if len(data) >= end:
+            return _address_from_raw(True, data[pos + 8 : end]), end
+    return _xdr_read_as(_address_from_scval, data, pos)
+
+
+def _xdr_write_int(
+    out: List[bytes], value: int, tag: bytes, size: int, signed: bool
+) -> None:
+    try:
+        out.append(tag + value.to_bytes(size, "big", signed=signed))
+    except OverflowError:
+        expected = xdr.SCValType(int.from_bytes(tag, "big")).name
+        raise ValueError(f"{value} is out of range for {expected}") from None
+
+
+def _xdr_write_opaque(out: List[bytes], value: Union[str, bytes], tag: bytes) -> None:
+    if isinstance(value, str):
+        value = value.encode()
+    length = len(value)
+    out.append(tag + length.to_bytes(4, "big") + value + b"\x00" * (-length % 4))
+
+
+def _xdr_write_bool(out: List[bytes], value: bool) -> None:
+    out.append(_XDR_TRUE if value else _XDR_FALSE)
+
+
+def _xdr_write_header(out: List[bytes], tag: bytes, count: int) -> None:
+    out.append(tag + _XDR_PRESENT + count.to_bytes(4, "big"))
+
+
+class UnparsedEventError(ValueError):
+    """The event's topics matched one or more declared events, but none of the
+    candidate classes could parse it.
+
+    This usually means the on-chain event format has drifted from the contract
+    spec these bindings were generated from (e.g. a contract upgrade or a
+    protocol change). ``failures`` holds each candidate class and the exception
+    its ``parse()`` raised.
+    """
+
+    def __init__(self, message: str, failures: List[Tuple[type, Exception]]):
+        super().__init__(message)
+        self.failures = failures
@@ -8,6 +8,7 @@ from stellar_sdk import __version__ as stellar_sdk_version, StrKey
 from stellar_sdk import xdr
 
 from stellar_contract_bindings import __version__ as stellar_contract_bindings_version
+from stellar_contract_bindings.cache import cache_dir_option, lookup_contract_binding
 from stellar_contract_bindings.utils import get_specs_by_contract_id
 
 
@@ -1124,7 +1125,8 @@ def generate_binding(specs: List[xdr.SCSpecEntry], class_name: str = "ContractCl
     default="ContractClient",
     help="Name for the generated client class",
 )
-def command(contract_id: str, rpc_url: str, output: str, class_name: str):
+@cache_dir_option
+def command(contract_id: str, rpc_url: str, output: str, class_name: str, cache_dir: str):
     """Generate Swift bindings for a Soroban contract"""
     if not StrKey.is_valid_contract(contract_id):
         click.echo(f"Invalid contract ID: {contract_id}", err=True)
@@ -1135,13 +1137,22 @@ def command(contract_id: str, rpc_url: str, output: str, class_name: str):
         output = os.getcwd()
     
     try:
-        specs = get_specs_by_contract_id(contract_id, rpc_url)
+        cached = lookup_contract_binding(
+            cache_dir, contract_id, rpc_url, "swift", class_name=class_name
+        )
+        if cached.content is None:
+            specs = get_specs_by_contract_id(contract_id, rpc_url)
     except Exception as e:
         click.echo(f"Get contract specs failed: {e}", err=True)
         raise click.Abort()
 
-    click.echo("Generating Swift bindings")
-    generated = generate_binding(specs, class_name=class_name)
+    if cached.content is not None:
+        click.echo("Using cached Swift bindings")
+        generated = cached.content
+    else:
+        click.echo("Generating Swift bindings")
+        generated = generate_binding(specs, class_name=class_name)
+        cached.store(generated)
     
     # Check if output is a file or directory
     if output.endswith('.swift'):
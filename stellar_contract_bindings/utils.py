@@ -1,3 +1,5 @@
+import hashlib
+
 from stellar_sdk import SorobanServer
 from stellar_sdk import xdr, Address
 from stellar_sdk.sep.contract_spec import ContractSpec
@@ -44,14 +46,9 @@ def get_specs_by_wasm_hash(wasm_hash: bytes, rpc_url: str) -> list[xdr.SCSpecEnt
         return get_specs_by_wasm_bytes(meta_data)
 
 
-def get_specs_by_contract_id(contract_id: str, rpc_url: str) -> list[xdr.SCSpecEntry]:
-    """Get the wasm hash by contract id.
-
-    :param contract_id: The contract id.
-    :param rpc_url: The Soroban RPC URL.
-    :return: The wasm hash.
-    :raises ValueError: If contract not found.
-    """
+def _get_contract_executable(
+    contract_id: str, rpc_url: str
+) -> xdr.ContractExecutable:
     with SorobanServer(rpc_url) as server:
         key = xdr.LedgerKey(
             xdr.LedgerEntryType.CONTRACT_DATA,
@@ -65,19 +62,48 @@ def get_specs_by_contract_id(contract_id: str, rpc_url: str) -> list[xdr.SCSpecE
         if not resp.entries:
             raise ValueError(f"Contract not found, contract id: {contract_id}")
         data = xdr.LedgerEntryData.from_xdr(resp.entries[0].xdr)
-        if (
-                data.contract_data.val.instance.executable.type
-                == xdr.ContractExecutableType.CONTRACT_EXECUTABLE_STELLAR_ASSET
-        ):
-            return get_token_sc_spec_entry()
-        elif (
-                data.contract_data.val.instance.executable.type
-                == xdr.ContractExecutableType.CONTRACT_EXECUTABLE_WASM
-        ):
-            return get_specs_by_wasm_hash(
-                data.contract_data.val.instance.executable.wasm_hash.hash, rpc_url
-            )
-        else:
-            raise ValueError(
-                f"Unknown executable type, type: {data.contract_data.val.instance.executable.type}"
-            )
+        return data.contract_data.val.instance.executable
+
+
+def get_specs_by_contract_id(contract_id: str, rpc_url: str) -> list[xdr.SCSpecEntry]:
+    """Get the wasm hash by contract id.
+
+    :param contract_id: The contract id.
+    :param rpc_url: The Soroban RPC URL.
+    :return: The wasm hash.
+    :raises ValueError: If contract not found.
+    """
+    executable = _get_contract_executable(contract_id, rpc_url)
+    if executable.type == xdr.ContractExecutableType.CONTRACT_EXECUTABLE_STELLAR_ASSET:
+        return get_token_sc_spec_entry()
+    elif executable.type == xdr.ContractExecutableType.CONTRACT_EXECUTABLE_WASM:
+        return get_specs_by_wasm_hash(executable.wasm_hash.hash, rpc_url)
+    else:
+        raise ValueError(f"Unknown executable type, type: {executable.type}")
+
+
+def get_code_hash_by_contract_id(contract_id: str, rpc_url: str) -> bytes:
+    """Get the hash identifying the code behind a contract.
+
+    This is the wasm hash for Wasm contracts. Stellar Asset Contracts have no
+    wasm, so their spec is the one embedded in this package and the hash is
+    the SHA-256 of that spec's XDR.
+
+    Only the contract instance is fetched, not the wasm itself, which makes
+    this the cheap way to tell whether previously generated bindings are
+    still current.
+
+    :param contract_id: The contract id.
+    :param rpc_url: The Soroban RPC URL.
+    :return: The code hash.
+    :raises ValueError: If contract not found.
+    """
+    executable = _get_contract_executable(contract_id, rpc_url)
+    if executable.type == xdr.ContractExecutableType.CONTRACT_EXECUTABLE_STELLAR_ASSET:
+        return hashlib.sha256(
+            b"".join(entry.to_xdr_bytes() for entry in get_token_sc_spec_entry())
+        ).digest()
+    elif executable.type == xdr.ContractExecutableType.CONTRACT_EXECUTABLE_WASM:
+        return executable.wasm_hash.hash
+    else:
+        raise ValueError(f"Unknown executable type, type: {executable.type}")
@@ -0,0 +1,109 @@
+"""Tests for generating bindings for many spec sets at once."""
+
+import black
+import pytest
+from stellar_sdk import xdr
+
+from stellar_contract_bindings.batch import generate_many
+from stellar_contract_bindings.java import generate_binding as generate_java_binding
+from stellar_contract_bindings.python import generate_binding
+
+
+def _function(name: bytes) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0,
+        function_v0=xdr.SCSpecFunctionV0(
+            doc=b"",
+            name=xdr.SCSymbol(name),
+            inputs=[],
+            outputs=[xdr.SCSpecTypeDef(xdr.SCSpecType.SC_SPEC_TYPE_U32)],
+        ),
+    )
+
+
+def _invalid_event() -> xdr.SCSpecEntry:
+    """A SINGLE_VALUE event with two data params, which the generator rejects."""
+    entry = xdr.SCSpecEntry(xdr.SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0)
+    entry.event_v0 = xdr.SCSpecEventV0(
+        doc=b"",
+        lib=b"",
+        name=xdr.SCSymbol(sc_symbol=b"bad"),
+        prefix_topics=[],
+        params=[
+            xdr.SCSpecEventParamV0(
+                doc=b"",
+                name=name,
+                type=xdr.SCSpecTypeDef(xdr.SCSpecType.SC_SPEC_TYPE_U32),
+                location=xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_DATA,
+            )
+            for name in (b"a", b"b")
+        ],
+        data_format=xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_SINGLE_VALUE,
+    )
+    return entry
+
+
+SPEC_SETS = {
+    "first": [_function(b"first")],
+    "second": [_function(b"second")],
+    "broken": [_invalid_event()],
+    "third": [_function(b"third")],
+}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+class TestGenerateMany:
+    def test_each_spec_set_yields_one_result(self, max_workers):
+        results = {
+            r.key: r
+            for r in generate_many(SPEC_SETS, "python", max_workers, client_type="sync")
+        }
+        assert set(results) == set(SPEC_SETS)
+
+    def test_results_match_single_generation(self, max_workers):
+        results = {
+            r.key: r
+            for r in generate_many(SPEC_SETS, "python", max_workers, client_type="sync")
+        }
+        for key in ("first", "second", "third"):
+            assert results[key].ok
+            expected = black.format_str(
+                generate_binding(SPEC_SETS[key], client_type="sync"),
+                mode=black.Mode(),
+            )
+            assert results[key].binding == expected
+
+    def test_a_failing_item_does_not_abort_the_batch(self, max_workers):
+        results = {r.key: r for r in generate_many(SPEC_SETS, "python", max_workers)}
+        assert not results["broken"].ok
+        assert isinstance(results["broken"].error, ValueError)
+        assert results["broken"].binding is None
+        assert all(results[key].ok for key in ("first", "second", "third"))
+
+    def test_iterable_input_is_keyed_by_position(self, max_workers):
+        spec_sets = [SPEC_SETS["first"], SPEC_SETS["second"]]
+        results = generate_many(spec_sets, "java", max_workers, package="com.example")
+        by_key = {r.key: r.binding for r in results}
+        assert by_key == {
+            0: generate_java_binding([_function(b"first")], "com.example"),
+            1: generate_java_binding([_function(b"second")], "com.example"),
+        }
+
+    def test_input_specs_are_not_mutated(self, max_workers):
+        specs = [_function(b"import")]
+        list(generate_many([specs], "python", max_workers))
+        assert specs[0].function_v0.name.sc_symbol == b"import"
+
+
+class TestGenerateManyValidation:
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown backend"):
+            generate_many([], "cobol")
+
+    def test_unknown_option(self):
+        with pytest.raises(ValueError, match="class_name"):
+            generate_many([], "python", class_name="X")
+
+    def test_missing_required_option(self):
+        with pytest.raises(ValueError, match="package"):
+            generate_many([], "kmp")
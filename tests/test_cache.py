@@ -0,0 +1,227 @@
+"""Tests for the on-disk bindings cache and its CLI wiring."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from stellar_sdk import xdr
+
+from stellar_contract_bindings import cache as cache_module
+from stellar_contract_bindings import java, python
+from stellar_contract_bindings.cache import BindingCache, binding_cache_key
+
+CONTRACT_ID = "CBUZJXHZ6PBS2YR3SEJZ3CIGMQBYP6367D3KQAR2NB3U2I5AOWLC4DU2"
+CODE_HASH = bytes(range(32))
+
+
+def _function(name: bytes) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0,
+        function_v0=xdr.SCSpecFunctionV0(
+            doc=b"", name=xdr.SCSymbol(name), inputs=[], outputs=[]
+        ),
+    )
+
+
+def _event(name: bytes, prefix_topic: bytes) -> xdr.SCSpecEntry:
+    entry = xdr.SCSpecEntry(xdr.SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0)
+    entry.event_v0 = xdr.SCSpecEventV0(
+        doc=b"",
+        lib=b"",
+        name=xdr.SCSymbol(sc_symbol=name),
+        prefix_topics=[xdr.SCSymbol(sc_symbol=prefix_topic)],
+        params=[],
+        data_format=xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_SINGLE_VALUE,
+    )
+    return entry
+
+
+class TestBindingCacheKey:
+    def test_same_inputs_give_the_same_key(self):
+        assert binding_cache_key(
+            CODE_HASH, "python", client_type="both"
+        ) == binding_cache_key(CODE_HASH, "python", client_type="both")
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            (bytes(32), "python", {"client_type": "both"}),
+            (CODE_HASH, "java", {"client_type": "both"}),
+            (CODE_HASH, "python", {"client_type": "sync"}),
+            (CODE_HASH, "python", {}),
+        ],
+    )
+    def test_each_input_is_part_of_the_key(self, other):
+        code_hash, backend, options = other
+        assert binding_cache_key(CODE_HASH, "python", client_type="both") != (
+            binding_cache_key(code_hash, backend, **options)
+        )
+
+    def test_versions_are_part_of_the_key(self, monkeypatch):
+        before = binding_cache_key(CODE_HASH, "python")
+        monkeypatch.setattr(cache_module, "stellar_sdk_version", "0.0.0")
+        assert binding_cache_key(CODE_HASH, "python") != before
+
+    def test_source_is_part_of_the_key(self, monkeypatch):
+        # A development checkout changes the templates without bumping the
+        # version, so the key covers the source itself.
+        before = binding_cache_key(CODE_HASH, "python")
+        monkeypatch.setattr(cache_module, "_source_fingerprint", lambda: "edited")
+        assert binding_cache_key(CODE_HASH, "python") != before
+
+
+class TestBindingCache:
+    def test_miss_then_hit(self, tmp_path):
+        cache = BindingCache(str(tmp_path))
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, "content")
+        assert cache.get("ab" * 32) == "content"
+
+    def test_get_or_generate_generates_once(self, tmp_path):
+        cache = BindingCache(str(tmp_path))
+        calls = []
+
+        def generate():
+            calls.append(1)
+            return "generated"
+
+        for _ in range(2):
+            assert (
+                cache.get_or_generate(CODE_HASH, "python", generate, client_type="both")
+                == "generated"
+            )
+        assert len(calls) == 1
+
+    def test_failed_generation_is_not_stored(self, tmp_path):
+        cache = BindingCache(str(tmp_path))
+
+        def generate():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_generate(CODE_HASH, "python", generate)
+        assert cache.get(binding_cache_key(CODE_HASH, "python")) is None
+        assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+
+class TestCommandCache:
+    def _patch(self, monkeypatch, module, specs=None):
+        fetches = []
+
+        def get_specs(contract_id, rpc_url):
+            fetches.append(contract_id)
+            return specs or [_function(b"hello")]
+
+        monkeypatch.setattr(module, "get_specs_by_contract_id", get_specs)
+        monkeypatch.setattr(
+            cache_module,
+            "get_code_hash_by_contract_id",
+            lambda contract_id, rpc_url: CODE_HASH,
+        )
+        return fetches
+
+    @pytest.mark.parametrize(
+        "module, args, output_file",
+        [
+            (python, [], "bindings.py"),
+            (java, ["--package", "com.example"], "Client.java"),
+        ],
+    )
+    def test_second_run_is_served_from_the_cache(
+        self, monkeypatch, tmp_path, module, args, output_file
+    ):
+        fetches = self._patch(monkeypatch, module)
+        runner = CliRunner()
+        outputs = []
+        for run in range(2):
+            out = tmp_path / f"out{run}"
+            result = runner.invoke(
+                module.command,
+                ["--contract-id", CONTRACT_ID, "--output", str(out)]
+                + args
+                + ["--cache-dir", str(tmp_path / "cache")],
+            )
+            assert result.exit_code == 0, result.output
+            outputs.append((out / output_file).read_text())
+        assert len(fetches) == 1
+        assert "Using cached" in result.output
+        assert outputs[0] == outputs[1]
+
+    def test_diagnostics_are_shown_on_a_hit(self, monkeypatch, tmp_path):
+        specs = [_event(b"changed", b"first"), _event(b"changed", b"second")]
+        fetches = self._patch(monkeypatch, python, specs)
+        runner = CliRunner()
+        for run in range(2):
+            result = runner.invoke(
+                python.command,
+                ["--contract-id", CONTRACT_ID, "--output", str(tmp_path / "out")]
+                + ["--cache-dir", str(tmp_path / "cache")],
+            )
+            assert result.exit_code == 0, result.output
+            assert "'changed' -> ChangedEvent_ (declaration 2 of 2" in result.output
+        assert len(fetches) == 1
+        assert "Using cached" in result.output
+
+    @pytest.mark.parametrize("content", ["not json", '{"bindings.py": "x = 1"}'])
+    def test_unreadable_entries_are_regenerated(self, monkeypatch, tmp_path, content):
+        # A corrupted entry, or one written in an older shape, is a miss.
+        fetches = self._patch(monkeypatch, python)
+        runner = CliRunner()
+        args = ["--contract-id", CONTRACT_ID, "--output", str(tmp_path / "out")]
+        args += ["--cache-dir", str(tmp_path / "cache")]
+        assert runner.invoke(python.command, args).exit_code == 0
+        (entry,) = [p for p in (tmp_path / "cache").rglob("*") if p.is_file()]
+        entry.write_text(content)
+        result = runner.invoke(python.command, args)
+        assert result.exit_code == 0, result.output
+        assert "Using cached" not in result.output
+        assert "def hello(" in (tmp_path / "out" / "bindings.py").read_text()
+        assert len(fetches) == 2
+        assert entry.read_text() != content
+        assert "Using cached" in runner.invoke(python.command, args).output
+
+    def test_black_version_is_part_of_the_key(self, monkeypatch, tmp_path):
+        fetches = self._patch(monkeypatch, python)
+        runner = CliRunner()
+        args = ["--contract-id", CONTRACT_ID, "--output", str(tmp_path / "out")]
+        args += ["--cache-dir", str(tmp_path / "cache")]
+        assert runner.invoke(python.command, args).exit_code == 0
+        monkeypatch.setattr(python.black, "__version__", "0.0.0")
+        assert runner.invoke(python.command, args).exit_code == 0
+        assert len(fetches) == 2
+
+    def test_changed_options_miss_the_cache(self, monkeypatch, tmp_path):
+        fetches = self._patch(monkeypatch, python)
+        runner = CliRunner()
+        for client_type in ("sync", "async"):
+            result = runner.invoke(
+                python.command,
+                [
+                    "--contract-id",
+                    CONTRACT_ID,
+                    "--output",
+                    str(tmp_path / client_type),
+                    "--client-type",
+                    client_type,
+                ],
+                env={cache_module.CACHE_DIR_ENV: str(tmp_path / "cache")},
+            )
+            assert result.exit_code == 0, result.output
+        assert len(fetches) == 2
+        assert "class ClientAsync" in (tmp_path / "async" / "bindings.py").read_text()
+
+    def test_without_a_cache_dir_nothing_is_written(self, monkeypatch, tmp_path):
+        self._patch(monkeypatch, python)
+        monkeypatch.setattr(
+            cache_module,
+            "get_code_hash_by_contract_id",
+            lambda contract_id, rpc_url: pytest.fail("no cache lookup expected"),
+        )
+        runner = CliRunner()
+        result = runner.invoke(
+            python.command,
+            ["--contract-id", CONTRACT_ID, "--output", str(tmp_path / "out")],
+            env={cache_module.CACHE_DIR_ENV: ""},
+        )
+        assert result.exit_code == 0, result.output
+        assert [p.name for p in Path(tmp_path).iterdir()] == ["out"]
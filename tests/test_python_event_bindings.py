@@ -1,4 +1,5 @@
 import ast
+import json
 import logging
 from pathlib import Path
 
@@ -17,6 +18,8 @@ from stellar_contract_bindings.python import (
     generate_binding_with_diagnostics,
     render_event_helpers,
     render_imports,
+    render_package_init,
+    render_package_reference,
     render_scval_helpers,
 )
 
@@ -270,6 +273,18 @@ class TestSingleValueFormat:
             "**",
         ]
 
+    def test_topic_filter_reuses_encoded_topics(self):
+        approve = self.ns["ApproveEvent"]
+        assert approve.PREFIX_TOPICS_XDR == (scval.to_symbol("approve").to_xdr(),)
+        before = self.ns["address_cache_stats"]()["topic"]
+        rows = [approve.topic_filter(from_=FROM_ADDRESS) for _ in range(3)]
+        rows.append(approve.topic_filter(from_=Address(FROM_ADDRESS)))
+        after = self.ns["address_cache_stats"]()["topic"]
+        assert after["hits"] - before["hits"] == 2
+        assert all(row == rows[0] for row in rows)
+        # Each call builds a new row, so callers may extend it.
+        assert rows[0] is not rows[1]
+
     def test_parse_raw_scvals(self):
         parsed = self.ns["parse_event"](
             (
@@ -364,6 +379,26 @@ class TestMapFormat:
         assert parsed.to == Address(TO_ADDRESS)
         assert parsed.amount == 42
 
+    def test_dict_round_trip_uses_wire_names(self):
+        event = _contract_event(
+            [
+                scval.to_symbol("transfer"),
+                scval.to_address(FROM_ADDRESS),
+                scval.to_address(TO_ADDRESS),
+            ],
+            scval.to_struct({"amount": scval.to_int128(42)}),
+        )
+        parsed = self.ns["TransferEvent"].parse(event)
+        data = json.loads(json.dumps(parsed.to_dict()))
+        assert data == {"from": FROM_ADDRESS, "to": TO_ADDRESS, "amount": 42}
+        assert self.ns["TransferEvent"].from_dict(data) == parsed
+
+    def test_reduces_to_constructor_arguments(self):
+        event = self.ns["TransferEvent"](Address(FROM_ADDRESS), Address(TO_ADDRESS), 42)
+        cls, args = event.__reduce__()
+        assert cls is self.ns["TransferEvent"]
+        assert cls(*args) == event
+
     def test_missing_required_map_entry_is_rejected(self):
         # ``amount`` is declared without an option wrapper, so an event that
         # omits it does not satisfy the declaration and must not parse into a
@@ -712,6 +747,22 @@ class TestParseEventDispatcher:
             self.ns["_coerce_event_scval"] = coerce
         assert len(decoded) == 3  # 2 topics + 1 data value, each decoded once
 
+    def test_events_no_declaration_matches_are_not_decoded(self):
+        # The first topic is looked up in its base64 form, so events of other
+        # contracts are rejected before their topics or data are decoded.
+        decoded = []
+        coerce = self.ns["_coerce_event_scval"]
+        self.ns["_coerce_event_scval"] = lambda value: decoded.append(value)
+        try:
+            for first in [scval.to_symbol("mint"), scval.to_uint32(1)]:
+                info = _event_info([first.to_xdr()], "not base64 XDR")
+                assert self.ns["parse_event"](info) is None
+            info = _event_info([scval.to_string("approve").to_xdr()], "AAAA")
+            assert self.ns["parse_event"](info) is None
+        finally:
+            self.ns["_coerce_event_scval"] = coerce
+        assert not decoded
+
     def test_dispatch_event_info(self):
         event_info = _event_info(
             [
@@ -822,6 +873,87 @@ class TestSpecificityOrdering:
         assert isinstance(parsed, self.ns["FooShortEvent"])
 
 
+class TestTopicIndex:
+    """parse_event only tries the events that can match the first topic and the
+    topic count."""
+
+    def setup_method(self):
+        address = _type(xdr.SCSpecType.SC_SPEC_TYPE_ADDRESS)
+        amount = _data_param(b"amount", _type(xdr.SCSpecType.SC_SPEC_TYPE_I128))
+        single = xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_SINGLE_VALUE
+        specs = [
+            _event(
+                b"approve",
+                [b"approve"],
+                [_topic_param(b"from", address), amount],
+                single,
+            ),
+            _event(
+                b"transfer",
+                [b"transfer"],
+                [_topic_param(b"from", address), _topic_param(b"to", address), amount],
+                single,
+            ),
+            _event(
+                b"numbered",
+                [],
+                [_topic_param(b"n", _type(xdr.SCSpecType.SC_SPEC_TYPE_U32)), amount],
+                single,
+            ),
+        ]
+        self.ns = _load_bindings(specs)
+
+    def test_index_keeps_most_specific_first(self):
+        approve, transfer, numbered = (
+            self.ns["ApproveEvent"],
+            self.ns["TransferEvent"],
+            self.ns["NumberedEvent"],
+        )
+        assert self.ns["_MAX_EVENT_TOPICS"] == 3
+        assert self.ns["_EVENT_INDEX"] == {
+            (None, 1): [numbered],
+            (None, 2): [numbered],
+            (None, 3): [numbered],
+            (b"approve", 1): [numbered],
+            (b"approve", 2): [approve, numbered],
+            (b"approve", 3): [approve, numbered],
+            (b"transfer", 1): [numbered],
+            (b"transfer", 2): [numbered],
+            (b"transfer", 3): [transfer, numbered],
+        }
+
+    def test_other_events_are_not_tried(self):
+        tried = []
+        transfer = self.ns["TransferEvent"]
+        matches = transfer.matches
+
+        def recording_matches(cls, event):
+            tried.append(event)
+            return matches(event)
+
+        transfer.matches = classmethod(recording_matches)
+        event = _contract_event(
+            [scval.to_symbol("approve"), scval.to_address(FROM_ADDRESS)],
+            scval.to_int128(5),
+        )
+        assert isinstance(self.ns["parse_event"](event), self.ns["ApproveEvent"])
+        assert not tried
+
+    def test_string_topics_and_extra_trailing_topics(self):
+        address = scval.to_address(FROM_ADDRESS)
+        topics = [scval.to_string("transfer"), address, address, scval.to_string("x")]
+        parsed = self.ns["parse_event"](_contract_event(topics, scval.to_int128(5)))
+        assert isinstance(parsed, self.ns["TransferEvent"])
+
+    def test_events_without_static_topics_match_any_first_topic(self):
+        event = _contract_event([scval.to_uint32(7)], scval.to_int128(5))
+        parsed = self.ns["parse_event"](event)
+        assert isinstance(parsed, self.ns["NumberedEvent"]) and parsed.n == 7
+        event = _contract_event([scval.to_symbol("unknown")], scval.to_int128(5))
+        assert self.ns["parse_event"](event) is None
+        assert self.ns["parse_event"](_contract_event([], scval.to_void())) is None
+
+
 class TestClassNameCollisions:
     def test_event_named_event_does_not_overwrite_union_alias(self):
         specs = [
@@ -1041,17 +1173,37 @@ class TestReservedModuleNames:
         source = black.format_str(
             "\n".join(
                 [
-                    render_imports("both", has_events=True),
+                    render_imports(
+                        "both",
+                        has_events=True,
+                        has_arrays=True,
+                        has_caches=True,
+                        has_intern=True,
+                        has_sequences=True,
+                        has_mappings=True,
+                    ),
                     render_scval_helpers(),
                     render_event_helpers(),
+                    render_package_reference(),
+                    render_package_init([]),
                 ]
             ),
             mode=black.Mode(),
         )
         emitted = _top_level_bindings(ast.parse(source))
         emitted.discard("annotations")  # __future__ import, not a real binding
+        # A UDT can never take a dunder name: python_identifier suffixes them.
+        emitted -= {name for name in emitted if name.startswith("__")}
         # Emitted elsewhere, from templates that need a spec to render.
-        emitted |= {"Client", "ClientAsync", "_EVENTS", "parse_event"}
+        emitted |= {
+            "Client",
+            "ClientAsync",
+            "_EVENTS",
+            "_EVENT_INDEX",
+            "_EVENT_TOPIC_KEYS",
+            "_MAX_EVENT_TOPICS",
+            "parse_event",
+        }
         assert emitted == set(_GENERATED_MODULE_NAMES)
 
     def test_generated_module_binds_each_name_once(self):
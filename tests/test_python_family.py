@@ -0,0 +1,230 @@
+"""Tests for generating one package for a family of contracts."""
+
+import ast
+import importlib
+import sys
+
+import black
+import pytest
+from stellar_sdk import xdr
+
+from stellar_contract_bindings.python import generate_binding, generate_family
+
+U32 = xdr.SCSpecTypeDef(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+I128 = xdr.SCSpecTypeDef(xdr.SCSpecType.SC_SPEC_TYPE_I128)
+
+
+def _udt_type(name: bytes) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_UDT, udt=xdr.SCSpecTypeUDT(name=name)
+    )
+
+
+def _struct(name: bytes, fields: list, doc: bytes = b"") -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+        udt_struct_v0=xdr.SCSpecUDTStructV0(
+            doc=doc,
+            lib=b"",
+            name=name,
+            fields=[
+                xdr.SCSpecUDTStructFieldV0(doc=b"", name=n, type=t) for n, t in fields
+            ],
+        ),
+    )
+
+
+def _union(name: bytes) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0,
+        udt_union_v0=xdr.SCSpecUDTUnionV0(
+            doc=b"",
+            lib=b"",
+            name=name,
+            cases=[
+                xdr.SCSpecUDTUnionCaseV0(
+                    xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0,
+                    void_case=xdr.SCSpecUDTUnionCaseVoidV0(doc=b"", name=b"Admin"),
+                ),
+                xdr.SCSpecUDTUnionCaseV0(
+                    xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0,
+                    tuple_case=xdr.SCSpecUDTUnionCaseTupleV0(
+                        doc=b"", name=b"Balance", type=[_udt_type(b"Asset")]
+                    ),
+                ),
+            ],
+        ),
+    )
+
+
+def _function(name: bytes, output: xdr.SCSpecTypeDef) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0,
+        function_v0=xdr.SCSpecFunctionV0(
+            doc=b"", name=xdr.SCSymbol(name), inputs=[], outputs=[output]
+        ),
+    )
+
+
+def _asset(amount_type=U32, doc: bytes = b"") -> xdr.SCSpecEntry:
+    return _struct(b"Asset", [(b"amount", amount_type)], doc)
+
+
+def _position() -> xdr.SCSpecEntry:
+    return _struct(b"Position", [(b"asset", _udt_type(b"Asset"))])
+
+
+def _classes(source: str) -> set:
+    return {
+        node.name for node in ast.parse(source).body if isinstance(node, ast.ClassDef)
+    }
+
+
+def _shared_imports(source: str) -> dict:
+    return {
+        alias.asname or alias.name: alias.name
+        for node in ast.parse(source).body
+        if isinstance(node, ast.ImportFrom) and node.module == "shared_types"
+        for alias in node.names
+    }
+
+
+class TestSharing:
+    def test_identical_types_are_generated_once(self):
+        files = generate_family(
+            {
+                "pool": [
+                    _asset(),
+                    _position(),
+                    _function(b"p", _udt_type(b"Position")),
+                ],
+                "router": [_asset(), _position()],
+            },
+            "sync",
+        )
+        assert set(files) == {"__init__.py", "shared_types.py", "pool.py", "router.py"}
+        assert _classes(files["shared_types.py"]) == {"Asset", "Position"}
+        for module in ("pool.py", "router.py"):
+            assert "Asset" not in _classes(files[module])
+            assert _shared_imports(files[module]) == {
+                "Asset": "Asset",
+                "Position": "Position",
+            }
+
+    def test_docs_do_not_prevent_sharing(self):
+        files = generate_family(
+            {"a": [_asset(doc=b"An asset.")], "b": [_asset(doc=b"Some asset.")]},
+            "none",
+        )
+        assert _classes(files["shared_types.py"]) == {"Asset"}
+        assert '"""An asset."""' in files["shared_types.py"]
+
+    def test_types_declared_once_stay_local(self):
+        files = generate_family({"a": [_asset(), _position()], "b": [_asset()]}, "none")
+        assert _classes(files["shared_types.py"]) == {"Asset"}
+        assert _classes(files["a.py"]) == {"Position"}
+
+    def test_conflicting_names_are_resolved(self):
+        files = generate_family(
+            {
+                "a": [_asset(U32)],
+                "b": [_asset(U32)],
+                "c": [_asset(I128)],
+                "d": [_asset(I128)],
+            },
+            "none",
+        )
+        assert _classes(files["shared_types.py"]) == {"a_Asset", "c_Asset"}
+        # Each contract module still calls its own type Asset.
+        assert _shared_imports(files["b.py"]) == {"Asset": "a_Asset"}
+        assert _shared_imports(files["d.py"]) == {"Asset": "c_Asset"}
+
+    def test_references_must_be_shared_too(self):
+        # Both Position structs are identical, but the Assets they hold differ.
+        files = generate_family(
+            {"a": [_asset(U32), _position()], "b": [_asset(I128), _position()]},
+            "none",
+        )
+        assert _classes(files["shared_types.py"]) == set()
+        assert _classes(files["a.py"]) == {"Asset", "Position"}
+        assert _classes(files["b.py"]) == {"Asset", "Position"}
+
+    def test_shared_union_imports_its_kind(self):
+        files = generate_family(
+            {"a": [_asset(), _union(b"Key")], "b": [_asset(), _union(b"Key")]},
+            "none",
+        )
+        assert _classes(files["shared_types.py"]) == {"Asset", "Key", "KeyKind"}
+        assert set(_shared_imports(files["a.py"])) == {"Asset", "Key", "KeyKind"}
+
+    def test_codec_functions_follow_each_shared_class(self):
+        vec = xdr.SCSpecTypeDef(
+            xdr.SCSpecType.SC_SPEC_TYPE_VEC,
+            vec=xdr.SCSpecTypeVec(element_type=_udt_type(b"Asset")),
+        )
+        holder = _struct(b"Holder", [(b"assets", vec)])
+        files = generate_family(
+            {
+                "a": [_asset(U32), holder],
+                "b": [_asset(U32), holder],
+                "c": [_asset(I128), holder],
+                "d": [_asset(I128), holder],
+            },
+            "none",
+        )
+        shared = files["shared_types.py"]
+        assert "def _dec_vec_asset(val: xdr.SCVal) -> List[a_Asset]:" in shared
+        assert "def _dec_vec_asset2(val: xdr.SCVal) -> List[c_Asset]:" in shared
+
+    def test_module_names_do_not_collide(self):
+        files = generate_family(
+            {"shared_types": [_asset()], "import": [_asset()]}, "none"
+        )
+        assert set(files) == {
+            "__init__.py",
+            "shared_types.py",
+            "shared_types2.py",
+            "import_.py",
+        }
+
+    def test_unshared_contract_matches_its_single_module_binding(self):
+        files = generate_family(
+            {"a": [_asset(U32)], "b": [_asset(I128), _function(b"f", U32)]}, "both"
+        )
+        assert files["b.py"] == generate_binding(
+            [_asset(I128), _function(b"f", U32)], "both"
+        )
+
+
+@pytest.fixture
+def family(tmp_path, request):
+    name = f"family_{request.node.name}"
+    root = tmp_path / name
+    root.mkdir()
+    spec_sets = {
+        "pool": [_asset(), _position()],
+        "router": [_asset(), _position(), _union(b"Key")],
+    }
+    for file_name, source in generate_family(spec_sets, "both").items():
+        (root / file_name).write_text(black.format_str(source, mode=black.Mode()))
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield name
+    finally:
+        sys.path.remove(str(tmp_path))
+        for module in [m for m in sys.modules if m.split(".")[0] == name]:
+            del sys.modules[module]
+
+
+class TestGeneratedPackage:
+    def test_values_are_interchangeable_between_contracts(self, family):
+        pool = importlib.import_module(f"{family}.pool")
+        router = importlib.import_module(f"{family}.router")
+        assert pool.Position is router.Position
+        position = pool.Position(pool.Asset(5))
+        assert router.Position.from_scval(position.to_scval()) == position
+
+    def test_local_types_reference_shared_ones(self, family):
+        router = importlib.import_module(f"{family}.router")
+        key = router.Key(router.KeyKind.Balance, balance=router.Asset(1))
+        assert router.Key.from_scval(key.to_scval()) == key
@@ -1,19 +1,25 @@
 """Tests for the Python binding generator (non-event specs)."""
 
 import ast
+import copy
 import inspect
+import json
+import pickle
+import sys
 
 import black
 import pytest
-from stellar_sdk import scval, xdr
+from stellar_sdk import Address, scval, xdr
 
 from stellar_contract_bindings.python import (
     _ADDRESS_TYPES,
     _PY_TYPES,
     _SCVAL_CODECS,
+    from_json,
     from_scval,
     generate_binding,
     python_docstring,
+    to_json,
     to_py_type,
     to_scval,
 )
@@ -97,6 +103,64 @@ class TestUnionKeywordCaseNames:
         assert kw.from_scval(encoded) == kw(kind.class_, class_=7)
 
 
+def _wide_union(width: int) -> xdr.SCSpecEntry:
+    u32 = _type(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+    cases = []
+    for index in range(width):
+        name = f"Case{index}".encode()
+        if index % 3 == 0:
+            cases.append(_void_case(name))
+        elif index % 3 == 1:
+            cases.append(_tuple_case(name, u32))
+        else:
+            cases.append(_tuple_case(name, u32, u32))
+    return _union(b"Wide", cases)
+
+
+class TestUnionDispatch:
+    """Union codecs look their case up in per-class tables, not if-chains."""
+
+    def setup_method(self):
+        self.ns = _load_bindings([_wide_union(40)])
+        wide, kind = self.ns["Wide"], self.ns["WideKind"]
+        self.values = []
+        for index, member in enumerate(kind):
+            if index % 3 == 0:
+                self.values.append(wide(member))
+            elif index % 3 == 1:
+                self.values.append(wide(member, **{f"case{index}": index}))
+            else:
+                self.values.append(wide(member, **{f"case{index}": (index, 1)}))
+
+    def test_every_case_round_trips(self):
+        wide = self.ns["Wide"]
+        for value in self.values:
+            assert wide.from_scval(value.to_scval()) == value
+
+    def test_tables_cover_every_case(self):
+        wide, kind = self.ns["Wide"], self.ns["WideKind"]
+        wire_names = [member.value for member in kind]
+        assert list(wide._ENCODERS) == wire_names
+        assert list(wide._DECODERS) == wire_names
+        assert "Case0" not in wide._CASE_FIELDS
+        assert wide._CASE_FIELDS["Case1"] == "case1"
+
+    def test_equality_and_hash_follow_the_active_case(self):
+        wide, kind = self.ns["Wide"], self.ns["WideKind"]
+        assert len(set(self.values)) == len(self.values)
+        assert wide(kind.Case1, case1=1) != wide(kind.Case1, case1=2)
+        # Attributes of inactive cases take no part in comparison.
+        assert wide(kind.Case0, case1=5) == wide(kind.Case0)
+        assert hash(wide(kind.Case0, case1=5)) == hash(wide(kind.Case0))
+
+    def test_unknown_kinds_raise_value_error(self):
+        wide = self.ns["Wide"]
+        with pytest.raises(ValueError, match="Invalid kind"):
+            wide.from_scval(scval.to_enum("Missing", None))
+        with pytest.raises(ValueError, match="Invalid kind"):
+            wide("Case0").to_scval()
+
+
 # Spec docs are attacker-controlled: they arrive in the contract's spec from
 # the chain. Interpolating them into a docstring literal let a contract close
 # the literal and have the rest of its "doc" run as code on import.
@@ -343,3 +407,514 @@ class TestTypeMappingTables:
         }
         assert special & set(_SCVAL_CODECS) == set()
         assert set(_ADDRESS_TYPES) & set(_PY_TYPES) == set()
+
+
+class TestStructDecoding:
+    """Structs decode by position when the map has the layout to_scval writes."""
+
+    def setup_method(self):
+        # Declared out of order, with a keyword that is renamed in Python.
+        self.ns = _load_bindings([_struct(b"Row", b"", [b"zeta", b"class", b"alpha"])])
+        self.row = self.ns["Row"]
+
+    def _map(self, *names: str) -> xdr.SCVal:
+        return scval.to_map(
+            {scval.to_symbol(n): scval.to_uint32(i) for i, n in enumerate(names)}
+        )
+
+    def test_round_trip(self):
+        value = self.row(1, 2, 3)
+        assert self.row.from_scval(value.to_scval()) == value
+
+    def test_sorted_map_decodes_by_position(self, monkeypatch):
+        def unexpected(val):
+            raise AssertionError("took the dict path")
+
+        monkeypatch.setattr(scval, "from_struct", unexpected)
+        value = self.row.from_scval(self._map("alpha", "class", "zeta"))
+        assert (value.zeta, value.class_, value.alpha) == (2, 1, 0)
+
+    def test_other_layouts_fall_back_to_the_dict_path(self):
+        value = self.row.from_scval(self._map("zeta", "alpha", "class"))
+        assert (value.zeta, value.class_, value.alpha) == (0, 2, 1)
+        extra = self.row.from_scval(self._map("alpha", "class", "extra", "zeta"))
+        assert (extra.zeta, extra.class_, extra.alpha) == (3, 1, 0)
+        with pytest.raises(KeyError):
+            self.row.from_scval(self._map("alpha", "class"))
+
+
+def _tuple_type(*types: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_TUPLE,
+        tuple=xdr.SCSpecTypeTuple(value_types=list(types)),
+    )
+
+
+def _option_type(value_type: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_OPTION,
+        option=xdr.SCSpecTypeOption(value_type=value_type),
+    )
+
+
+def _vec_type(element_type: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_VEC,
+        vec=xdr.SCSpecTypeVec(element_type=element_type),
+    )
+
+
+class TestCompositeDecoding:
+    """Composite decoders evaluate each value, and decode each tuple, once."""
+
+    U32 = _type(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+
+    def _decode(self, td: xdr.SCSpecTypeDef, value: xdr.SCVal):
+        source = to_scval(td, "decoded")
+        expr = from_scval(td, "values[0]")
+        decoded = eval(expr, {"scval": scval, "xdr": xdr, "values": [value]})
+        # Round trip through the generated encoder as well.
+        assert eval(source, {"scval": scval, "xdr": xdr, "decoded": decoded}) == value
+        return decoded
+
+    def test_nested_tuples_decode_each_level_once(self, monkeypatch):
+        td = _tuple_type(self.U32, _tuple_type(self.U32, self.U32), self.U32)
+        value = scval.to_tuple_struct(
+            [
+                scval.to_uint32(1),
+                scval.to_tuple_struct([scval.to_uint32(2), scval.to_uint32(3)]),
+                scval.to_uint32(4),
+            ]
+        )
+        calls = []
+        original = scval.from_tuple_struct
+
+        def counting(val):
+            calls.append(val)
+            return original(val)
+
+        monkeypatch.setattr(scval, "from_tuple_struct", counting)
+        assert self._decode(td, value) == (1, (2, 3), 4)
+        assert len(calls) == 2
+
+    def test_single_element_tuple_is_a_tuple(self):
+        value = scval.to_tuple_struct([scval.to_uint32(5)])
+        assert self._decode(_tuple_type(self.U32), value) == (5,)
+
+    def test_options_inside_vectors_and_tuples(self):
+        td = _vec_type(_option_type(_tuple_type(self.U32, _option_type(self.U32))))
+        value = scval.to_vec(
+            [
+                scval.to_void(),
+                scval.to_tuple_struct([scval.to_uint32(1), scval.to_void()]),
+                scval.to_tuple_struct([scval.to_uint32(2), scval.to_uint32(3)]),
+            ]
+        )
+        assert self._decode(td, value) == [None, (1, None), (2, 3)]
+
+    def test_result_binds_its_value_once(self):
+        td = xdr.SCSpecTypeDef(
+            xdr.SCSpecType.SC_SPEC_TYPE_RESULT,
+            result=xdr.SCSpecTypeResult(
+                ok_type=self.U32, error_type=_type(xdr.SCSpecType.SC_SPEC_TYPE_ERROR)
+            ),
+        )
+        expr = from_scval(td, 'elements["x"]')
+        assert expr.count('elements["x"]') == 1
+        ast.parse(expr, mode="eval")
+
+
+def _map_type(key: xdr.SCSpecTypeDef, value: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_MAP,
+        map=xdr.SCSpecTypeMap(key_type=key, value_type=value),
+    )
+
+
+class TestCodecFunctions:
+    """Composite types are coded by one module-level function per shape."""
+
+    U32 = _type(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+
+    def _specs(self) -> list:
+        vec = _vec_type(self.U32)
+        nested = _map_type(
+            _type(xdr.SCSpecType.SC_SPEC_TYPE_SYMBOL),
+            _option_type(_tuple_type(self.U32, vec)),
+        )
+        holder = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Holder",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(doc=b"", name=b"items", type=vec),
+                    xdr.SCSpecUDTStructFieldV0(doc=b"", name=b"nested", type=nested),
+                ],
+            ),
+        )
+        function = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0,
+            function_v0=xdr.SCSpecFunctionV0(
+                doc=b"",
+                name=xdr.SCSymbol(b"items"),
+                inputs=[xdr.SCSpecFunctionInputV0(doc=b"", name=b"items", type=vec)],
+                outputs=[vec],
+            ),
+        )
+        return [holder, _union(b"Bag", [_tuple_case(b"Items", vec)]), function]
+
+    def test_each_shape_is_defined_once(self):
+        source = generate_binding(self._specs(), "both")
+        for name in ("_enc_vec_u32", "_dec_vec_u32", "_dec_option_tuple_u32_vec_u32"):
+            assert source.count(f"def {name}(") == 1
+        # The comprehensions live in the functions, not at each use.
+        assert source.count("for e in") == 2
+        assert "parse_result_xdr_fn=_dec_vec_u32," in source
+
+    def test_values_round_trip(self):
+        ns = _load_bindings(self._specs())
+        holder = ns["Holder"]([1, 2], {"a": (3, [4]), "b": None})
+        assert ns["Holder"].from_scval(holder.to_scval()) == holder
+        bag = ns["Bag"](ns["BagKind"].Items, items=[5])
+        assert ns["Bag"].from_scval(bag.to_scval()) == bag
+        assert ns["_dec_vec_u32"](ns["_enc_vec_u32"]([6, 7])) == [6, 7]
+
+    def test_direct_expressions_are_unchanged(self):
+        assert from_scval(_vec_type(self.U32), "v") == (
+            "[scval.from_uint32(e) for e in scval.from_vec(v)]"
+        )
+
+
+class TestXdrBytes:
+    """from_xdr_bytes and to_xdr_bytes agree with the SCVal codecs byte for byte."""
+
+    ADDRESS = "GBMBVAHBE6D4AJXJJVTBQTVU4G7SN4FEIJOL5YTOHZ4WCUMKQ52ANL2B"
+    CONTRACT = "CDOAW6D7NXAPOCO7TFAWZNJHK62E3IYRGNRVX3VOXNKNVOXCLLPJXQCF"
+
+    def setup_method(self):
+        t = xdr.SCSpecType
+        field_types = {
+            b"to": _type(t.SC_SPEC_TYPE_ADDRESS),
+            b"amounts": _vec_type(_type(t.SC_SPEC_TYPE_I128)),
+            b"memo": _option_type(_type(t.SC_SPEC_TYPE_STRING)),
+            b"limits": _map_type(
+                _type(t.SC_SPEC_TYPE_SYMBOL), _type(t.SC_SPEC_TYPE_U64)
+            ),
+            b"pair": _tuple_type(
+                _type(t.SC_SPEC_TYPE_BOOL), _type(t.SC_SPEC_TYPE_BYTES)
+            ),
+            b"big": _type(t.SC_SPEC_TYPE_I256),
+            b"extra": _type(t.SC_SPEC_TYPE_VAL),
+            b"kind": xdr.SCSpecTypeDef(
+                t.SC_SPEC_TYPE_UDT, udt=xdr.SCSpecTypeUDT(name=b"Kind")
+            ),
+        }
+        transfer = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Transfer",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(doc=b"", name=name, type=td)
+                    for name, td in field_types.items()
+                ],
+            ),
+        )
+        u32 = _type(t.SC_SPEC_TYPE_U32)
+        shape = _union(
+            b"Shape",
+            [
+                _void_case(b"Empty"),
+                _tuple_case(b"Pair", u32, u32),
+                _tuple_case(b"Named", _type(t.SC_SPEC_TYPE_SYMBOL)),
+            ],
+        )
+        self.ns = _load_bindings(
+            [
+                _enum(b"Kind", b""),
+                _error_enum(b"Failure", b""),
+                _struct(b"Row", b"", [b"zeta", b"class", b"alpha"]),
+                _struct(b"Coords", b"", [b"0", b"1"]),
+                transfer,
+                shape,
+            ]
+        )
+
+    def _values(self) -> list:
+        ns = self.ns
+        shape, kind = ns["Shape"], ns["ShapeKind"]
+        return [
+            ns["Kind"].A,
+            ns["Failure"].A,
+            ns["Row"](1, 2, 3),
+            ns["Coords"]((4, 5)),
+            shape(kind.Empty),
+            shape(kind.Pair, pair=(6, 7)),
+            shape(kind.Named, named="eight"),
+            ns["Transfer"](
+                self.ADDRESS,
+                [1, -(2**100)],
+                b"memo",
+                {"daily": 9, "weekly": 10},
+                (True, b"\x01\x02\x03\x04\x05"),
+                -(2**200),
+                scval.to_uint32(11),
+                ns["Kind"].A,
+            ),
+            ns["Transfer"](
+                self.CONTRACT,
+                [],
+                None,
+                {},
+                (False, b""),
+                0,
+                scval.to_void(),
+                ns["Kind"].A,
+            ),
+        ]
+
+    def test_bytes_match_to_scval(self):
+        for value in self._values():
+            assert value.to_xdr_bytes() == value.to_scval().to_xdr_bytes()
+
+    def test_round_trip_matches_from_scval(self):
+        for value in self._values():
+            data = value.to_scval().to_xdr_bytes()
+            decoded = type(value).from_xdr_bytes(data)
+            assert decoded == type(value).from_scval(value.to_scval())
+            if hasattr(value, "to"):
+                assert decoded.to.address == Address(value.to).address
+
+    def test_other_struct_layouts_fall_back_to_from_scval(self):
+        unsorted = scval.to_map({})
+        unsorted.map.sc_map = [
+            xdr.SCMapEntry(key=scval.to_symbol(name), val=scval.to_uint32(i))
+            for i, name in enumerate(["zeta", "alpha", "class"])
+        ]
+        value = self.ns["Row"].from_xdr_bytes(unsorted.to_xdr_bytes())
+        assert (value.zeta, value.class_, value.alpha) == (0, 2, 1)
+
+    def test_malformed_input_raises_value_error(self):
+        row = self.ns["Row"]
+        data = row(1, 2, 3).to_xdr_bytes()
+        with pytest.raises(ValueError, match="trailing"):
+            row.from_xdr_bytes(data + bytes(4))
+        with pytest.raises(ValueError, match="SCV_U32"):
+            row.from_xdr_bytes(data[:-2])
+        with pytest.raises(ValueError, match="Invalid kind"):
+            self.ns["Shape"].from_xdr_bytes(scval.to_enum("Round", None).to_xdr_bytes())
+        with pytest.raises(ValueError, match="takes 2 values"):
+            self.ns["Shape"].from_xdr_bytes(
+                scval.to_enum("Pair", scval.to_uint32(1)).to_xdr_bytes()
+            )
+        with pytest.raises(ValueError, match="out of range"):
+            row(-1, 2, 3).to_xdr_bytes()
+
+
+class TestJsonDicts:
+    """to_dict output survives json and rebuilds the value with from_dict."""
+
+    ADDRESS = TestXdrBytes.ADDRESS
+    CONTRACT = TestXdrBytes.CONTRACT
+    setup_method = TestXdrBytes.setup_method
+    _values = TestXdrBytes._values
+
+    def test_round_trip_through_json(self):
+        for value in self._values():
+            cls = type(value)
+            data = json.loads(json.dumps(value.to_dict()))
+            assert data == value.to_dict()
+            assert cls.from_dict(data) == cls.from_scval(value.to_scval())
+
+    def test_documented_mapping(self):
+        transfer = self._values()[7]
+        assert transfer.to_dict() == {
+            "to": self.ADDRESS,
+            "amounts": [1, -(2**100)],
+            "memo": "memo",
+            "limits": [["daily", 9], ["weekly", 10]],
+            "pair": [True, "0102030405"],
+            "big": -(2**200),
+            "extra": scval.to_uint32(11).to_xdr(),
+            "kind": 1,
+        }
+        shape, kind = self.ns["Shape"], self.ns["ShapeKind"]
+        assert shape(kind.Empty).to_dict() == {"kind": "Empty"}
+        assert shape(kind.Named, named="x").to_dict() == {"kind": "Named", "value": "x"}
+        assert shape(kind.Pair, pair=(6, 7)).to_dict() == {
+            "kind": "Pair",
+            "value": [6, 7],
+        }
+        assert self.ns["Coords"]((4, 5)).to_dict() == [4, 5]
+        assert self.ns["Row"](1, 2, 3).to_dict() == {"zeta": 1, "class": 2, "alpha": 3}
+
+    def test_strings_that_are_not_utf8_survive(self):
+        transfer = self._values()[7]
+        transfer.memo = b"\xff\x00"
+        decoded = type(transfer).from_dict(json.loads(json.dumps(transfer.to_dict())))
+        assert decoded.memo == b"\xff\x00"
+
+    def test_unknown_kinds_raise_value_error(self):
+        with pytest.raises(ValueError, match="Invalid kind: Round"):
+            self.ns["Shape"].from_dict({"kind": "Round"})
+
+    def test_addresses_are_built_directly(self):
+        transfer = self._values()[7]
+        cls = type(transfer)
+        data = transfer.to_dict()
+        assert cls.from_dict(data).to is cls.from_dict(data).to
+        data["to"] = Address(self.ADDRESS)
+        assert cls.from_dict(data).to == Address(self.ADDRESS)
+        address = _type(xdr.SCSpecType.SC_SPEC_TYPE_ADDRESS)
+        assert from_json(address, "x") == "_address_from_json(x)"
+
+    def test_nested_options_check_for_none_once(self):
+        nested = _option_type(_option_type(_type(xdr.SCSpecType.SC_SPEC_TYPE_BYTES)))
+        assert to_json(nested, "x") == "(None if x is None else x.hex())"
+        assert from_json(nested, "x") == "(None if x is None else bytes.fromhex(x))"
+
+    def test_methods_are_straight_line(self):
+        source = generate_binding([_struct(b"Row", b"", [b"a", b"b"])], "none")
+        assert '"a": self.a,' in source
+        assert 'data["b"],' in source
+
+
+class TestPickle:
+    """Generated values pickle as their class and constructor arguments."""
+
+    ADDRESS = TestXdrBytes.ADDRESS
+    CONTRACT = TestXdrBytes.CONTRACT
+    setup_method = TestXdrBytes.setup_method
+    _values = TestXdrBytes._values
+
+    @pytest.fixture(autouse=True)
+    def _published(self, monkeypatch):
+        # pickle finds classes by module, so publish the generated ones.
+        module = type(pickle)("pickled_bindings")
+        for name, value in self.ns.items():
+            if isinstance(value, type):
+                monkeypatch.setattr(value, "__module__", module.__name__)
+                setattr(module, name, value)
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    def test_round_trip(self):
+        for value in self._values():
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+                restored = pickle.loads(pickle.dumps(value, protocol))
+                assert type(restored) is type(value)
+                assert restored == value
+        decoded = self.ns["Transfer"].from_scval(self._values()[7].to_scval())
+        assert pickle.loads(pickle.dumps(decoded)) == decoded
+
+    def test_payload_holds_no_attribute_names(self):
+        payload = pickle.dumps(self._values()[7])
+        assert b"amounts" not in payload
+        assert b"copyreg" not in payload
+
+    def test_copies(self):
+        shape, kind = self.ns["Shape"], self.ns["ShapeKind"]
+        value = shape(kind.Pair, pair=(6, 7))
+        assert copy.copy(value) == value
+        assert copy.deepcopy(value) == value
+
+
+class TestFromScvalMany:
+    def setup_method(self):
+        u32 = _type(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+        row = xdr.SCSpecTypeDef(
+            xdr.SCSpecType.SC_SPEC_TYPE_UDT, udt=xdr.SCSpecTypeUDT(name=b"Row")
+        )
+        rows = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0,
+            function_v0=xdr.SCSpecFunctionV0(
+                doc=b"",
+                name=xdr.SCSymbol(b"rows"),
+                inputs=[],
+                outputs=[_vec_type(row)],
+            ),
+        )
+        types = [
+            _enum(b"Kind", b""),
+            _error_enum(b"Failure", b""),
+            _struct(b"Row", b"", [b"zeta", b"class", b"alpha"]),
+            _struct(b"Coords", b"", [b"0", b"1"]),
+            _union(b"Shape", [_void_case(b"Empty"), _tuple_case(b"Pair", u32, u32)]),
+        ]
+        self.source = generate_binding(types + [rows], "sync")
+        self.ns = _load_bindings(types)
+
+    def test_matches_from_scval(self):
+        ns = self.ns
+        shape, kind = ns["Shape"], ns["ShapeKind"]
+        unsorted = scval.to_map({})
+        unsorted.map.sc_map = [
+            xdr.SCMapEntry(key=scval.to_symbol(name), val=scval.to_uint32(i))
+            for i, name in enumerate(["zeta", "alpha", "class"])
+        ]
+        batches = {
+            "Kind": [ns["Kind"].A.to_scval()] * 2,
+            "Failure": [ns["Failure"].A.to_scval()],
+            "Row": [ns["Row"](1, 2, 3).to_scval(), unsorted],
+            "Coords": [ns["Coords"]((4, 5)).to_scval()],
+            "Shape": [
+                shape(kind.Empty).to_scval(),
+                shape(kind.Pair, pair=(6, 7)).to_scval(),
+            ],
+        }
+        for name, vals in batches.items():
+            cls = ns[name]
+            assert cls.from_scval_many(iter(vals)) == [cls.from_scval(v) for v in vals]
+            assert cls.from_scval_many([]) == []
+
+    def test_invalid_values_raise_like_from_scval(self):
+        with pytest.raises(ValueError, match="is not a valid Kind"):
+            self.ns["Kind"].from_scval_many([scval.to_uint32(1), scval.to_uint32(9)])
+        with pytest.raises(ValueError, match="Invalid kind: Round"):
+            self.ns["Shape"].from_scval_many([scval.to_enum("Round", None)])
+
+    def test_vectors_of_generated_types_decode_in_one_call(self):
+        assert "Row.from_scval_many(scval.from_vec(val))" in self.source
+        assert "Row.from_scval(e)" not in self.source
+
+
+class TestAddressCache:
+    ADDRESS = "GBMBVAHBE6D4AJXJJVTBQTVU4G7SN4FEIJOL5YTOHZ4WCUMKQ52ANL2B"
+
+    def _specs(self) -> list:
+        owner = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Owner",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(
+                        doc=b"",
+                        name=b"who",
+                        type=_type(xdr.SCSpecType.SC_SPEC_TYPE_ADDRESS),
+                    )
+                ],
+            ),
+        )
+        return [owner]
+
+    def test_each_module_counts_its_own_conversions(self):
+        source = generate_binding(self._specs(), "none")
+        assert "import functools\n" in source
+        ns, other = _load_bindings(self._specs()), _load_bindings(self._specs())
+        owner = ns["Owner"]
+        for _ in range(4):
+            decoded = owner.from_scval(owner(self.ADDRESS).to_scval())
+            assert decoded.who.address == self.ADDRESS
+        stats = ns["address_cache_stats"]()
+        assert stats["encode"]["hits"] == stats["decode"]["hits"] == 3
+        assert stats["encode"]["hit_ratio"] == 0.75
+        assert other["address_cache_stats"]()["encode"]["hits"] == 0
+
+    def test_modules_without_addresses_skip_the_cache(self):
+        source = generate_binding([_struct(b"Row", b"", [b"a"])], "none")
+        assert "functools" not in source
+        assert "address_cache_stats" not in source
@@ -0,0 +1,811 @@
+"""Tests for the opt-in features of generated Python bindings."""
+
+import binascii
+import copy
+import os
+import pickle
+import subprocess
+import sys
+
+import black
+import pytest
+from stellar_sdk import scval, xdr
+
+from stellar_contract_bindings.batch import generate_many
+from stellar_contract_bindings.python import GeneratorOptions, generate_binding
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDRESS = "GBMBVAHBE6D4AJXJJVTBQTVU4G7SN4FEIJOL5YTOHZ4WCUMKQ52ANL2B"
+
+
+def _type(t: xdr.SCSpecType) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(t)
+
+
+U32 = _type(xdr.SCSpecType.SC_SPEC_TYPE_U32)
+
+
+def _struct(name: bytes, field_names: list) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+        udt_struct_v0=xdr.SCSpecUDTStructV0(
+            doc=b"",
+            lib=b"",
+            name=name,
+            fields=[
+                xdr.SCSpecUDTStructFieldV0(doc=b"", name=n, type=U32)
+                for n in field_names
+            ],
+        ),
+    )
+
+
+def _union(name: bytes) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0,
+        udt_union_v0=xdr.SCSpecUDTUnionV0(
+            doc=b"",
+            lib=b"",
+            name=name,
+            cases=[
+                xdr.SCSpecUDTUnionCaseV0(
+                    xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0,
+                    void_case=xdr.SCSpecUDTUnionCaseVoidV0(doc=b"", name=b"Empty"),
+                ),
+                xdr.SCSpecUDTUnionCaseV0(
+                    xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0,
+                    tuple_case=xdr.SCSpecUDTUnionCaseTupleV0(
+                        doc=b"", name=b"Pair", type=[U32, U32]
+                    ),
+                ),
+            ],
+        ),
+    )
+
+
+def _event(name: bytes, param_names: list) -> xdr.SCSpecEntry:
+    entry = xdr.SCSpecEntry(xdr.SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0)
+    entry.event_v0 = xdr.SCSpecEventV0(
+        doc=b"",
+        lib=b"",
+        name=xdr.SCSymbol(sc_symbol=name),
+        prefix_topics=[xdr.SCSymbol(sc_symbol=name)],
+        params=[
+            xdr.SCSpecEventParamV0(
+                doc=b"",
+                name=param_name,
+                type=U32,
+                location=xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_TOPIC_LIST,
+            )
+            for param_name in param_names
+        ],
+        data_format=xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_VEC,
+    )
+    return entry
+
+
+def _specs() -> list:
+    return [
+        _struct(b"Point", [b"x", b"y"]),
+        _struct(b"Pair", [b"0", b"1"]),
+        _union(b"Shape"),
+        _event(b"moved", [b"x"]),
+    ]
+
+
+def _load(specs: list, **options) -> dict:
+    code = generate_binding(specs, "none", options=GeneratorOptions(**options))
+    namespace: dict = {}
+    exec(compile(black.format_str(code, mode=black.Mode()), "b.py", "exec"), namespace)
+    return namespace
+
+
+class TestGeneratorOptions:
+    def test_defaults_are_off(self):
+        assert not any(GeneratorOptions().as_dict().values())
+
+    def test_default_output_is_unchanged(self):
+        assert generate_binding(_specs(), "none") == generate_binding(
+            _specs(), "none", options=GeneratorOptions()
+        )
+
+
+class TestSlots:
+    def test_no_slots_by_default(self):
+        assert "__slots__" not in generate_binding(_specs(), "none")
+
+    def test_instances_have_no_dict(self):
+        ns = _load(_specs(), slots=True)
+        instances = [
+            ns["Point"](1, 2),
+            ns["Pair"]((1, 2)),
+            ns["Shape"](ns["ShapeKind"].Pair, pair=(1, 2)),
+            ns["MovedEvent"](x=1),
+        ]
+        for instance in instances:
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.extra = 1
+
+    def test_round_trips_are_unaffected(self):
+        ns = _load(_specs(), slots=True)
+        point = ns["Point"](1, 2)
+        assert ns["Point"].from_scval(point.to_scval()) == point
+        pair = ns["Pair"]((3, 4))
+        assert ns["Pair"].from_scval(pair.to_scval()) == pair
+        shape = ns["Shape"](ns["ShapeKind"].Pair, pair=(5, 6))
+        assert ns["Shape"].from_scval(shape.to_scval()) == shape
+        empty = ns["Shape"](ns["ShapeKind"].Empty)
+        assert ns["Shape"].from_scval(empty.to_scval()) == empty
+        event = ([scval.to_symbol("moved"), scval.to_uint32(7)], scval.to_vec([]))
+        assert ns["parse_event"](event) == ns["MovedEvent"](x=7)
+
+    def test_names_that_clash_with_class_attributes_keep_a_dict(self):
+        specs = [
+            _struct(b"Codec", [b"to_scval"]),
+            _event(b"parsed", [b"parse"]),
+            _event(b"named", [b"EVENT_NAME"]),
+        ]
+        ns = _load(specs, slots=True)
+        assert hasattr(ns["Codec"](1), "__dict__")
+        assert hasattr(ns["ParsedEvent"](parse=1), "__dict__")
+        assert hasattr(ns["NamedEvent"](EVENT_NAME=1), "__dict__")
+
+    def test_batch_accepts_the_option(self):
+        (result,) = generate_many([_specs()], "python", max_workers=1, slots=True)
+        assert "__slots__" in result.binding
+
+
+class TestFrozen:
+    def test_value_types_reject_assignment(self):
+        ns = _load(_specs(), frozen=True)
+        for instance in [
+            ns["Point"](1, 2),
+            ns["Pair"]((1, 2)),
+            ns["Shape"](ns["ShapeKind"].Pair, pair=(1, 2)),
+        ]:
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError, match="frozen"):
+                instance.kind = None
+            with pytest.raises(AttributeError, match="frozen"):
+                del instance.kind
+
+    def test_events_are_left_mutable(self):
+        ns = _load(_specs(), frozen=True)
+        event = ns["MovedEvent"](x=1)
+        event.x = 2
+        assert event.x == 2
+
+    def test_hash_is_computed_once(self):
+        ns = _load(_specs(), frozen=True)
+        point = ns["Point"](1, 2)
+        assert hash(point) == hash(ns["Point"](1, 2))
+        # Swap a field behind the guard: a cached hash does not notice.
+        object.__setattr__(point, "x", 5)
+        assert hash(point) == hash(ns["Point"](1, 2))
+
+    def test_nested_values_work_as_keys(self):
+        specs = [
+            _struct(b"Point", [b"x", b"y"]),
+            xdr.SCSpecEntry(
+                xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+                udt_struct_v0=xdr.SCSpecUDTStructV0(
+                    doc=b"",
+                    lib=b"",
+                    name=b"Segment",
+                    fields=[
+                        xdr.SCSpecUDTStructFieldV0(
+                            doc=b"",
+                            name=name,
+                            type=xdr.SCSpecTypeDef(
+                                xdr.SCSpecType.SC_SPEC_TYPE_UDT,
+                                udt=xdr.SCSpecTypeUDT(name=b"Point"),
+                            ),
+                        )
+                        for name in (b"start", b"end")
+                    ],
+                ),
+            ),
+        ]
+        ns = _load(specs, frozen=True)
+        point, segment = ns["Point"], ns["Segment"]
+        seen = {segment(point(0, 0), point(1, 1)): "first"}
+        decoded = segment.from_scval(segment(point(0, 0), point(1, 1)).to_scval())
+        assert seen[decoded] == "first"
+
+    def test_copy_and_pickle(self):
+        ns = _load(_specs(), frozen=True)
+        shape = ns["Shape"](ns["ShapeKind"].Pair, pair=(1, 2))
+        assert copy.copy(shape) == shape
+        assert copy.deepcopy(shape) == shape
+        # pickle finds classes by module, so publish the generated ones.
+        module = type(pickle)("frozen_bindings")
+        module.__dict__.update(ns)
+        for name in ("Shape", "ShapeKind", "Point"):
+            ns[name].__module__ = module.__name__
+        sys.modules[module.__name__] = module
+        try:
+            point = ns["Point"](1, 2)
+            assert pickle.loads(pickle.dumps(point)) == point
+            assert pickle.loads(pickle.dumps(shape)) == shape
+        finally:
+            del sys.modules[module.__name__]
+
+    def test_hash_attribute_does_not_shadow_a_field(self):
+        ns = _load([_struct(b"Hashed", [b"_hash"])], frozen=True)
+        value = ns["Hashed"](7)
+        hash(value)
+        assert value._hash == 7
+        assert "_hash_" in ns["Hashed"].__slots__
+
+
+class TestLazy:
+    def _nested_specs(self) -> list:
+        point = xdr.SCSpecTypeDef(
+            xdr.SCSpecType.SC_SPEC_TYPE_UDT, udt=xdr.SCSpecTypeUDT(name=b"Point")
+        )
+        segment = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Segment",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(doc=b"", name=name, type=point)
+                    for name in (b"start", b"end")
+                ],
+            ),
+        )
+        return [_struct(b"Point", [b"x", b"y"]), segment]
+
+    def test_fields_are_decoded_on_first_access(self, monkeypatch):
+        ns = _load(self._nested_specs(), lazy=True)
+        point, segment = ns["Point"], ns["Segment"]
+        encoded = segment(point(1, 2), point(3, 4)).to_scval()
+        decoded = segment.from_scval(encoded)
+        assert "start" not in vars(decoded) and "end" not in vars(decoded)
+        calls = []
+        original = scval.from_uint32
+        monkeypatch.setattr(
+            scval, "from_uint32", lambda val: calls.append(val) or original(val)
+        )
+        assert decoded.end.y == 4
+        # Reading end.y decodes end and its y, and nothing of start.
+        assert len(calls) == 1
+        assert "start" not in vars(decoded)
+        assert decoded.end is decoded.end
+
+    def test_instances_compare_hash_and_encode_like_eager_ones(self):
+        for options in ({}, {"slots": True}, {"frozen": True}):
+            ns = _load(self._nested_specs(), lazy=True, **options)
+            point, segment = ns["Point"], ns["Segment"]
+            value = segment(point(1, 2), point(3, 4))
+            for operation in (
+                lambda v: v,
+                hash,
+                lambda v: v.to_scval().to_xdr_bytes(),
+                lambda v: v.to_xdr_bytes(),
+            ):
+                decoded = segment.from_scval(value.to_scval())
+                assert operation(decoded) == operation(value)
+
+    def test_missing_fields_still_fail_on_decode(self):
+        ns = _load([_struct(b"Point", [b"x", b"y"])], lazy=True)
+        with pytest.raises(KeyError):
+            ns["Point"].from_scval(scval.to_struct({"x": scval.to_uint32(1)}))
+        with pytest.raises(AttributeError, match="'Point' object has no attribute 'z'"):
+            ns["Point"].from_scval(ns["Point"](1, 2).to_scval()).z
+
+    def test_only_named_structs_are_lazy(self):
+        # Pair is a tuple struct and Shape a union; both still decode eagerly.
+        code = generate_binding(_specs(), "none", options=GeneratorOptions(lazy=True))
+        assert code.count("def __getattr__(") == 1
+
+
+def _vec(element: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_VEC, vec=xdr.SCSpecTypeVec(element_type=element)
+    )
+
+
+def _option(value: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_OPTION,
+        option=xdr.SCSpecTypeOption(value_type=value),
+    )
+
+
+class TestArrays:
+    TYPECODES = {
+        b"u32": (xdr.SCSpecType.SC_SPEC_TYPE_U32, "I", [0, 2**32 - 1]),
+        b"i32": (xdr.SCSpecType.SC_SPEC_TYPE_I32, "i", [-(2**31), 2**31 - 1]),
+        b"u64": (xdr.SCSpecType.SC_SPEC_TYPE_U64, "Q", [0, 2**64 - 1]),
+        b"i64": (xdr.SCSpecType.SC_SPEC_TYPE_I64, "q", [-(2**63), 2**63 - 1]),
+        b"time": (xdr.SCSpecType.SC_SPEC_TYPE_TIMEPOINT, "Q", [1, 2]),
+        b"wait": (xdr.SCSpecType.SC_SPEC_TYPE_DURATION, "Q", [3]),
+        b"wide": (xdr.SCSpecType.SC_SPEC_TYPE_I128, None, [-(2**100)]),
+    }
+
+    def _specs(self) -> list:
+        feed = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Feed",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(
+                        doc=b"", name=name, type=_vec(_type(spec_type))
+                    )
+                    for name, (spec_type, _, _) in self.TYPECODES.items()
+                ],
+            ),
+        )
+        return [feed]
+
+    def test_integer_vectors_decode_to_arrays(self):
+        feed = _load(self._specs(), arrays=True)["Feed"]
+        value = feed(*(values for _, _, values in self.TYPECODES.values()))
+        for decoded in (
+            feed.from_scval(value.to_scval()),
+            feed.from_xdr_bytes(value.to_xdr_bytes()),
+        ):
+            for name, (_, typecode, values) in self.TYPECODES.items():
+                field = getattr(decoded, name.decode())
+                if typecode is None:
+                    assert field == values
+                else:
+                    assert (field.typecode, field.tolist()) == (typecode, values)
+            assert decoded.to_xdr_bytes() == value.to_xdr_bytes()
+
+    def test_module_imports_array_only_when_used(self):
+        assert "import array" not in generate_binding(self._specs(), "none")
+        code = generate_binding(
+            self._specs(), "none", options=GeneratorOptions(arrays=True)
+        )
+        assert "import array\n" in code
+        assert "u32: array.array[int]" in code
+        code = generate_binding(
+            [_struct(b"Point", [b"x"])], "none", options=GeneratorOptions(arrays=True)
+        )
+        assert "import array" not in code
+
+
+class TestMemoryviews:
+    def _specs(self) -> list:
+        bytes_n = xdr.SCSpecTypeDef(
+            xdr.SCSpecType.SC_SPEC_TYPE_BYTES_N,
+            bytes_n=xdr.SCSpecTypeBytesN(n=xdr.Uint32(4)),
+        )
+        fields = {
+            b"proof": _type(xdr.SCSpecType.SC_SPEC_TYPE_BYTES),
+            b"key": bytes_n,
+            b"chunks": _vec(_type(xdr.SCSpecType.SC_SPEC_TYPE_BYTES)),
+            b"label": _type(xdr.SCSpecType.SC_SPEC_TYPE_STRING),
+        }
+        blob = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Blob",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(doc=b"", name=name, type=td)
+                    for name, td in fields.items()
+                ],
+            ),
+        )
+        return [blob]
+
+    def test_from_xdr_bytes_returns_views_of_the_buffer(self):
+        blob = _load(self._specs(), memoryviews=True)["Blob"]
+        value = blob(b"\x01" * 1000, b"abcd", [b"x", b"yz"], b"label")
+        data = value.to_xdr_bytes()
+        decoded = blob.from_xdr_bytes(data)
+        assert isinstance(decoded.proof, memoryview)
+        assert decoded.proof.obj is data
+        assert isinstance(decoded.chunks[1], memoryview)
+        # Strings are not Bytes and still decode to a copy.
+        assert type(decoded.label) is bytes
+        assert decoded == value
+        assert hash(decoded.proof) == hash(value.proof)
+        assert decoded.to_xdr_bytes() == data
+
+    def test_from_scval_wraps_the_sdk_bytes(self):
+        blob = _load(self._specs(), memoryviews=True)["Blob"]
+        value = blob(b"\x01" * 5, b"abcd", [], b"")
+        decoded = blob.from_scval(value.to_scval())
+        assert isinstance(decoded.key, memoryview)
+        assert decoded == value
+        assert decoded.to_scval() == value.to_scval()
+
+    def test_decoded_values_pickle(self, monkeypatch):
+        raw = _type(xdr.SCSpecType.SC_SPEC_TYPE_BYTES)
+        proof = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0,
+            udt_union_v0=xdr.SCSpecUDTUnionV0(
+                doc=b"",
+                lib=b"",
+                name=b"Proof",
+                cases=[
+                    xdr.SCSpecUDTUnionCaseV0(
+                        xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0,
+                        tuple_case=xdr.SCSpecUDTUnionCaseTupleV0(
+                            doc=b"", name=b"Signed", type=[raw, U32]
+                        ),
+                    ),
+                ],
+            ),
+        )
+        pair = _struct(b"Pair", [b"0", b"1"])
+        pair.udt_struct_v0.fields[1].type = raw
+        event = _event(b"posted", [b"id"])
+        event.event_v0.params[0].type = raw
+        ns = _load(self._specs() + [proof, pair, event], memoryviews=True)
+        # pickle finds classes by module, so publish the generated ones.
+        module = type(pickle)("view_bindings")
+        for name in ("Blob", "Proof", "ProofKind", "Pair", "PostedEvent"):
+            monkeypatch.setattr(ns[name], "__module__", module.__name__)
+            setattr(module, name, ns[name])
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        values = [
+            ns["Blob"](b"\x01" * 100, b"abcd", [b"x", b"yz"], b"label"),
+            ns["Proof"](ns["ProofKind"].Signed, signed=(b"sig", 7)),
+            ns["Pair"]((1, b"two")),
+        ]
+        for value in values:
+            decoded = type(value).from_xdr_bytes(value.to_xdr_bytes())
+            restored = pickle.loads(pickle.dumps(decoded))
+            assert restored == value
+            assert restored.to_xdr_bytes() == value.to_xdr_bytes()
+        topics = [scval.to_symbol("posted"), scval.to_bytes(b"id")]
+        posted = ns["parse_event"]((topics, scval.to_vec([])))
+        assert isinstance(posted.id, memoryview)
+        assert pickle.loads(pickle.dumps(posted)) == posted
+
+    def test_annotations_follow_the_option(self):
+        code = generate_binding(
+            self._specs(), "none", options=GeneratorOptions(memoryviews=True)
+        )
+        assert "    proof: memoryview\n" in code
+        assert "proof: Union[bytes, memoryview]" in code
+        assert "memoryview" not in generate_binding(self._specs(), "none")
+
+
+def _function(name: bytes, output) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0,
+        function_v0=xdr.SCSpecFunctionV0(
+            doc=b"",
+            name=xdr.SCSymbol(sc_symbol=name),
+            inputs=[xdr.SCSpecFunctionInputV0(doc=b"", name=b"x", type=U32)],
+            outputs=[] if output is None else [output],
+        ),
+    )
+
+
+class TestMypyc:
+    def _specs(self) -> list:
+        shape = xdr.SCSpecTypeDef(
+            xdr.SCSpecType.SC_SPEC_TYPE_UDT, udt=xdr.SCSpecTypeUDT(name=b"Shape")
+        )
+        address = _type(xdr.SCSpecType.SC_SPEC_TYPE_ADDRESS)
+        balances = xdr.SCSpecTypeDef(
+            xdr.SCSpecType.SC_SPEC_TYPE_MAP,
+            map=xdr.SCSpecTypeMap(
+                key_type=address, value_type=_type(xdr.SCSpecType.SC_SPEC_TYPE_I128)
+            ),
+        )
+        fields = {
+            b"owner": address,
+            b"balances": balances,
+            b"holders": _vec(address),
+            b"admin": _option(address),
+            b"limits": _option(_vec(U32)),
+            b"history": _vec(balances),
+        }
+        ledger = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Ledger",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(doc=b"", name=name, type=td)
+                    for name, td in fields.items()
+                ],
+            ),
+        )
+        return _specs() + [
+            ledger,
+            _function(b"reset", None),
+            _function(b"count", U32),
+            _function(b"shape", shape),
+            _function(b"balances", balances),
+            _function(b"holders", _vec(address)),
+        ]
+
+    def test_union_tables_move_to_module_level(self):
+        code = generate_binding(
+            self._specs(), "sync", options=GeneratorOptions(mypyc=True)
+        )
+        assert "\n_Shape_ENCODERS = {" in code
+        assert "    _ENCODERS = {" not in code
+        assert "    _ENCODERS = {" in generate_binding(self._specs(), "sync")
+
+    def test_client_passes_named_decoders(self):
+        code = generate_binding(
+            self._specs(), "sync", options=GeneratorOptions(mypyc=True)
+        )
+        assert "lambda" not in code
+        assert "lambda" in generate_binding(self._specs(), "sync")
+
+    def test_round_trips_are_unaffected(self):
+        ns = _load(self._specs(), mypyc=True)
+        shape = ns["Shape"](ns["ShapeKind"].Pair, pair=(5, 6))
+        empty = ns["Shape"](ns["ShapeKind"].Empty)
+        for value in (shape, empty):
+            assert ns["Shape"].from_scval(value.to_scval()) == value
+            assert ns["Shape"].from_xdr_bytes(value.to_xdr_bytes()) == value
+            assert ns["Shape"].from_dict(value.to_dict()) == value
+        event = ([scval.to_symbol("moved"), scval.to_uint32(7)], scval.to_vec([]))
+        assert ns["parse_event"](event) == ns["MovedEvent"](x=7)
+
+    def test_rejects_options_mypy_cannot_check(self):
+        with pytest.raises(ValueError, match="frozen, arrays"):
+            GeneratorOptions(mypyc=True, frozen=True, arrays=True)
+        GeneratorOptions(mypyc=True, slots=True)
+
+    @pytest.mark.parametrize("runtime", ["inline", "shared"])
+    def test_output_type_checks(self, tmp_path, runtime):
+        api = pytest.importorskip("mypy.api")
+        code = generate_binding(
+            self._specs(), "both", runtime=runtime, options=GeneratorOptions(mypyc=True)
+        )
+        path = tmp_path / "bindings.py"
+        path.write_text(black.format_str(code, mode=black.Mode()))
+        stdout, _, status = api.run([str(path), "--cache-dir", str(tmp_path / "cache")])
+        assert status == 0, stdout
+
+    @pytest.mark.parametrize("runtime", ["inline", "shared"])
+    def test_output_compiles(self, tmp_path, runtime):
+        # mypyc rejects some code mypy accepts, such as class constants read
+        # through the class, so the promise is only kept by compiling.
+        pytest.importorskip("mypyc.build")
+        code = generate_binding(
+            self._specs(), "both", runtime=runtime, options=GeneratorOptions(mypyc=True)
+        )
+        (tmp_path / "bindings.py").write_text(black.format_str(code, mode=black.Mode()))
+        env = dict(os.environ, MYPYPATH=ROOT)
+        result = subprocess.run(
+            [sys.executable, "-m", "mypyc", "bindings.py"],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout[-4000:] + result.stderr[-4000:]
+        # Only the extension is left to import, and the event code runs in it.
+        (tmp_path / "bindings.py").unlink()
+        check = (
+            "import bindings\n"
+            "from stellar_sdk import scval\n"
+            "assert not bindings.__file__.endswith('.py'), bindings.__file__\n"
+            "event = ([scval.to_symbol('moved'), scval.to_uint32(7)], scval.to_vec([]))\n"
+            "assert bindings.parse_event(event) == bindings.MovedEvent(x=7)\n"
+            "row = bindings.MovedEvent.topic_filter(x=7)\n"
+            "assert row[:2] == [scval.to_symbol('moved').to_xdr(), "
+            "scval.to_uint32(7).to_xdr()], row\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", check],
+            cwd=tmp_path,
+            env=dict(os.environ, PYTHONPATH=ROOT),
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+
+class TestInternSymbols:
+    def _specs(self) -> list:
+        symbol = _type(xdr.SCSpecType.SC_SPEC_TYPE_SYMBOL)
+        fields = {
+            b"code": symbol,
+            b"tags": _vec(symbol),
+            b"limits": xdr.SCSpecTypeDef(
+                xdr.SCSpecType.SC_SPEC_TYPE_MAP,
+                map=xdr.SCSpecTypeMap(key_type=symbol, value_type=U32),
+            ),
+        }
+        asset = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Asset",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(doc=b"", name=name, type=td)
+                    for name, td in fields.items()
+                ],
+            ),
+        )
+        return [asset]
+
+    def test_decoded_symbols_are_shared(self):
+        asset = _load(self._specs(), intern_symbols=True)["Asset"]
+        value = asset("usdc_circle", ["stable_coin"], {"daily_limit": 1})
+        scv, data = value.to_scval(), value.to_xdr_bytes()
+        decoded = [asset.from_scval(scv), asset.from_xdr_bytes(data)] * 2
+        decoded += [asset.from_scval(scval.to_struct(scval.from_struct(scv)))]
+        for other in decoded[1:]:
+            assert other == decoded[0]
+            assert other.code is decoded[0].code
+            assert other.tags[0] is decoded[0].tags[0]
+            assert next(iter(other.limits)) is next(iter(decoded[0].limits))
+
+    def test_default_decodes_fresh_strings(self):
+        asset = _load(self._specs())["Asset"]
+        data = asset("usdc_circle", [], {}).to_xdr_bytes()
+        assert asset.from_xdr_bytes(data).code is not asset.from_xdr_bytes(data).code
+
+    def test_module_imports_sys_only_when_used(self):
+        assert "import sys" not in generate_binding(self._specs(), "none")
+        options = GeneratorOptions(intern_symbols=True)
+        assert "import sys\n" in generate_binding(
+            self._specs(), "none", options=options
+        )
+        code = generate_binding(
+            self._specs(), "none", runtime="shared", options=options
+        )
+        assert "sys.intern(" in code and "_xdr_read_interned_symbol," in code
+        assert "import sys" in code
+        code = generate_binding([_struct(b"Point", [b"x"])], "none", options=options)
+        assert "import sys" not in code
+
+
+class TestLazyEvents:
+    def _event(self, name: bytes, prefix: bytes, data_format) -> xdr.SCSpecEntry:
+        location = xdr.SCSpecEventParamLocationV0
+        entry = _event(name, [b"owner"])
+        entry.event_v0.prefix_topics = [xdr.SCSymbol(sc_symbol=prefix)]
+        entry.event_v0.params += [
+            xdr.SCSpecEventParamV0(
+                doc=b"",
+                name=param_name,
+                type=U32,
+                location=location.SC_SPEC_EVENT_PARAM_LOCATION_DATA,
+            )
+            for param_name in (b"amount", b"fee")
+        ]
+        entry.event_v0.data_format = data_format
+        return entry
+
+    def _specs(self) -> list:
+        formats = xdr.SCSpecEventDataFormat
+        return [
+            self._event(b"paid", b"paid", formats.SC_SPEC_EVENT_DATA_FORMAT_MAP),
+            self._event(b"sent", b"sent", formats.SC_SPEC_EVENT_DATA_FORMAT_VEC),
+        ]
+
+    def _paid(self, data: dict) -> tuple:
+        topics = [scval.to_symbol("paid"), scval.to_uint32(1)]
+        return topics, scval.to_map(
+            {scval.to_symbol(k): scval.to_uint32(v) for k, v in data.items()}
+        )
+
+    def test_data_is_decoded_on_first_access(self, monkeypatch):
+        ns = _load(self._specs(), lazy_events=True)
+        event = ns["parse_event"](self._paid({"amount": 5, "fee": 2}))
+        assert event.owner == 1
+        assert "amount" not in vars(event) and "fee" not in vars(event)
+        calls = []
+        original = scval.from_uint32
+        monkeypatch.setattr(
+            scval, "from_uint32", lambda val: calls.append(val) or original(val)
+        )
+        assert event.fee == 2
+        assert len(calls) == 1 and "amount" not in vars(event)
+        assert event.fee is event.fee and len(calls) == 1
+
+    def test_data_is_unpacked_once(self, monkeypatch):
+        ns = _load(self._specs(), lazy_events=True)
+        sent = (
+            [scval.to_symbol("sent"), scval.to_uint32(1)],
+            scval.to_vec([scval.to_uint32(5), scval.to_uint32(2)]),
+        )
+        for event, unpack in (
+            (self._paid({"amount": 5, "fee": 2}), "from_struct"),
+            (sent, "from_vec"),
+        ):
+            calls = []
+            original = getattr(scval, unpack)
+            monkeypatch.setattr(
+                scval, unpack, lambda val, f=original: calls.append(val) or f(val)
+            )
+            parsed = ns["parse_event"](event)
+            assert (parsed.amount, parsed.fee) == (5, 2)
+            assert len(calls) == 1
+
+    def test_events_compare_and_encode_like_eager_ones(self):
+        sent = (
+            [scval.to_symbol("sent"), scval.to_uint32(1)],
+            scval.to_vec([scval.to_uint32(5), scval.to_uint32(2)]),
+        )
+        eager = _load(self._specs())
+        for options in ({}, {"slots": True}):
+            ns = _load(self._specs(), lazy_events=True, **options)
+            for event in (self._paid({"amount": 5, "fee": 2}), sent):
+                expected = eager["parse_event"](event)
+                for operation in (repr, hash, lambda e: e.to_dict()):
+                    parsed = ns["parse_event"](event)
+                    assert operation(parsed) == operation(expected)
+                parsed = ns["parse_event"](event)
+                assert copy.copy(parsed) == type(parsed).from_dict(expected.to_dict())
+
+    def test_malformed_data_fails_on_access(self):
+        ns = _load(self._specs(), lazy_events=True)
+        event = ns["parse_event"](self._paid({"fee": 2}))
+        assert event.owner == 1
+        for name in ("amount", "fee"):
+            with pytest.raises(ValueError, match="missing required entries"):
+                getattr(event, name)
+        with pytest.raises(AttributeError, match="no attribute 'other'"):
+            event.other
+        # Data that is not even XDR is only decoded, and rejected, when read.
+        topics = [scval.to_symbol("sent").to_xdr(), scval.to_uint32(1).to_xdr()]
+        event = ns["parse_event"]((topics, "not xdr"))
+        assert event.owner == 1
+        with pytest.raises(ValueError):
+            event.amount
+
+    @pytest.mark.parametrize(
+        "name, data, error",
+        [
+            ("paid", {"fee": 2}, ValueError),
+            ("sent", scval.to_vec([scval.to_uint32(5)]), ValueError),
+            ("sent", scval.to_symbol("oops"), ValueError),
+            ("sent", "not xdr", binascii.Error),
+        ],
+    )
+    def test_malformed_data_error_type_and_timing(self, name, data, error):
+        ns = _load(self._specs(), lazy_events=True)
+        if isinstance(data, dict):
+            topics, data = self._paid(data)
+        else:
+            topics = [scval.to_symbol(name), scval.to_uint32(1)]
+        # parse_event neither raises nor logs: the data is not decoded yet.
+        event = ns["parse_event"]((topics, data), raise_on_unparsed=True)
+        assert event.owner == 1
+        operations = [
+            lambda e: e.amount,
+            lambda e: e.fee,
+            repr,
+            lambda e: e == e,
+            hash,
+            lambda e: e.to_dict(),
+        ]
+        for operation in operations:
+            # Each read raises again; nothing half-decoded is kept.
+            for _ in range(2):
+                with pytest.raises(error) as raised:
+                    operation(event)
+                assert isinstance(raised.value, ValueError)
+
+    def test_events_sharing_topics_stay_eager(self):
+        formats = xdr.SCSpecEventDataFormat
+        specs = self._specs() + [
+            self._event(b"paid_v2", b"paid", formats.SC_SPEC_EVENT_DATA_FORMAT_VEC)
+        ]
+        ns = _load(specs, lazy_events=True)
+        assert "_DATA_DECODERS" in vars(ns["SentEvent"])
+        assert "_DATA_DECODERS" not in vars(ns["PaidEvent"])
+        assert "_DATA_DECODERS" not in vars(ns["PaidV2Event"])
+        # Vec data rejects PaidEvent in parse, so parse_event moves on.
+        data = scval.to_vec([scval.to_uint32(5), scval.to_uint32(2)])
+        topics = [scval.to_symbol("paid"), scval.to_uint32(1)]
+        assert isinstance(ns["parse_event"]((topics, data)), ns["PaidV2Event"])
+
+    def test_cannot_be_combined_with_mypyc(self):
+        with pytest.raises(ValueError, match="lazy_events"):
+            GeneratorOptions(mypyc=True, lazy_events=True)
@@ -0,0 +1,259 @@
+"""Tests for the lazily-loaded package layout of the Python bindings."""
+
+import ast
+import importlib
+import sys
+from pathlib import Path
+
+import black
+import pytest
+from click.testing import CliRunner
+from stellar_sdk import scval, xdr
+
+from stellar_contract_bindings.python import (
+    command,
+    generate_binding,
+    generate_package,
+)
+
+CONTRACT_ID = "CBUZJXHZ6PBS2YR3SEJZ3CIGMQBYP6367D3KQAR2NB3U2I5AOWLC4DU2"
+
+
+def _type(t: xdr.SCSpecType) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(t)
+
+
+def _udt_type(name: bytes) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_UDT, udt=xdr.SCSpecTypeUDT(name=name)
+    )
+
+
+def _vec_type(element_type: xdr.SCSpecTypeDef) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(
+        xdr.SCSpecType.SC_SPEC_TYPE_VEC, vec=xdr.SCSpecTypeVec(element_type)
+    )
+
+
+def _struct(name: bytes, fields: list) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+        udt_struct_v0=xdr.SCSpecUDTStructV0(
+            doc=b"",
+            lib=b"",
+            name=name,
+            fields=[
+                xdr.SCSpecUDTStructFieldV0(doc=b"", name=n, type=t) for n, t in fields
+            ],
+        ),
+    )
+
+
+def _union(name: bytes, cases: list) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0,
+        udt_union_v0=xdr.SCSpecUDTUnionV0(doc=b"", lib=b"", name=name, cases=cases),
+    )
+
+
+def _error_enum(name: bytes) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0,
+        udt_error_enum_v0=xdr.SCSpecUDTErrorEnumV0(
+            doc=b"",
+            lib=b"",
+            name=name,
+            cases=[
+                xdr.SCSpecUDTErrorEnumCaseV0(doc=b"", name=b"Bad", value=xdr.Uint32(1))
+            ],
+        ),
+    )
+
+
+def _function(name: bytes, output: xdr.SCSpecTypeDef) -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0,
+        function_v0=xdr.SCSpecFunctionV0(
+            doc=b"", name=xdr.SCSymbol(name), inputs=[], outputs=[output]
+        ),
+    )
+
+
+def _event(name: bytes, data_type: xdr.SCSpecTypeDef) -> xdr.SCSpecEntry:
+    entry = xdr.SCSpecEntry(xdr.SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0)
+    entry.event_v0 = xdr.SCSpecEventV0(
+        doc=b"",
+        lib=b"",
+        name=xdr.SCSymbol(sc_symbol=name),
+        prefix_topics=[xdr.SCSymbol(sc_symbol=name)],
+        params=[
+            xdr.SCSpecEventParamV0(
+                doc=b"",
+                name=b"value",
+                type=data_type,
+                location=xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_DATA,
+            )
+        ],
+        data_format=xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_SINGLE_VALUE,
+    )
+    return entry
+
+
+def _specs() -> list:
+    return [
+        _struct(b"Point", [(b"x", _type(xdr.SCSpecType.SC_SPEC_TYPE_U32))]),
+        _struct(b"Line", [(b"points", _vec_type(_udt_type(b"Point")))]),
+        # Recursive: a Tree holds a Vec of its own type.
+        _union(
+            b"Tree",
+            [
+                xdr.SCSpecUDTUnionCaseV0(
+                    xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0,
+                    void_case=xdr.SCSpecUDTUnionCaseVoidV0(doc=b"", name=b"Leaf"),
+                ),
+                xdr.SCSpecUDTUnionCaseV0(
+                    xdr.SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0,
+                    tuple_case=xdr.SCSpecUDTUnionCaseTupleV0(
+                        doc=b"", name=b"Node", type=[_vec_type(_udt_type(b"Tree"))]
+                    ),
+                ),
+            ],
+        ),
+        _error_enum(b"Error"),
+        _event(b"moved", _udt_type(b"Line")),
+        _function(b"line", _udt_type(b"Line")),
+    ]
+
+
+@pytest.fixture
+def package(tmp_path, request):
+    """Write the generated package to disk and import it under a unique name."""
+    name = f"pkg_{request.node.name.replace('[', '_').replace(']', '_')}"
+    root = tmp_path / name
+    root.mkdir()
+    for file_name, source in generate_package(_specs(), "both").items():
+        (root / file_name).write_text(black.format_str(source, mode=black.Mode()))
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield name, importlib.import_module(name)
+    finally:
+        sys.path.remove(str(tmp_path))
+        for module in [m for m in sys.modules if m.split(".")[0] == name]:
+            del sys.modules[module]
+
+
+def _loaded(name: str) -> set:
+    return {m.split(".", 1)[1] for m in sys.modules if m.startswith(name + ".")}
+
+
+class TestPackageLayout:
+    def test_one_module_per_udt_plus_events_and_client(self):
+        files = generate_package(_specs(), "both")
+        assert set(files) == {
+            "__init__.py",
+            "_point.py",
+            "_line.py",
+            "_tree.py",
+            "_error.py",
+            "_events.py",
+            "_client.py",
+        }
+
+    def test_every_file_parses(self):
+        for source in generate_package(_specs(), "both").values():
+            ast.parse(source)
+
+    def test_no_client_module_without_a_client(self):
+        assert "_client.py" not in generate_package(_specs(), "none")
+
+    def test_module_names_do_not_shadow_exports(self):
+        specs = [_struct(b"_client", [(b"x", _type(xdr.SCSpecType.SC_SPEC_TYPE_U32))])]
+        specs.append(_function(b"f", _udt_type(b"_client")))
+        files = generate_package(specs, "both")
+        modules = {name[: -len(".py")] for name in files} - {"__init__"}
+        assert "_client" not in modules
+        assert len(modules) == 2
+
+
+class TestLazyLoading:
+    def test_importing_the_package_loads_nothing(self, package):
+        name, _ = package
+        assert _loaded(name) == set()
+
+    def test_importing_the_client_loads_only_the_client(self, package):
+        name, module = package
+        from_import = {}
+        exec(f"from {name} import Client", from_import)
+        assert from_import["Client"].__name__ == "Client"
+        assert _loaded(name) == {"_client"}
+
+    def test_types_load_on_first_use(self, package):
+        name, module = package
+        line = module.Line([module.Point(1), module.Point(2)])
+        assert module.Line.from_scval(line.to_scval()) == line
+        assert _loaded(name) == {"_line", "_point"}
+
+    def test_recursive_union_round_trips(self, package):
+        _, module = package
+        tree = module.Tree(
+            module.TreeKind.Node, node=[module.Tree(module.TreeKind.Leaf)]
+        )
+        assert module.Tree.from_scval(tree.to_scval()) == tree
+
+    def test_error_enum_round_trips(self, package):
+        _, module = package
+        assert module.Error.from_scval(module.Error.Bad.to_scval()) is module.Error.Bad
+
+    def test_events_parse_through_the_package(self, package):
+        _, module = package
+        line = module.Line([module.Point(3)])
+        event = ([scval.to_symbol("moved")], line.to_scval())
+        assert module.parse_event(event) == module.MovedEvent(value=line)
+
+    def test_unknown_names_raise_attribute_error(self, package):
+        _, module = package
+        with pytest.raises(AttributeError):
+            module.Missing
+        assert "Line" in dir(module)
+        assert set(module.__all__) >= {"Line", "Client", "ClientAsync", "parse_event"}
+
+
+class TestMatchesSingleModule:
+    def test_same_classes_as_the_single_module(self):
+        single = ast.parse(generate_binding(_specs(), "both"))
+        single_classes = {
+            node.name for node in single.body if isinstance(node, ast.ClassDef)
+        }
+        package_classes = {
+            node.name
+            for source in generate_package(_specs(), "both").values()
+            for node in ast.parse(source).body
+            if isinstance(node, ast.ClassDef)
+        }
+        assert package_classes == single_classes
+
+
+class TestCommand:
+    def test_package_layout_writes_a_package(self, monkeypatch):
+        monkeypatch.setattr(
+            "stellar_contract_bindings.python.get_specs_by_contract_id",
+            lambda contract_id, rpc_url: _specs(),
+        )
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(
+                command,
+                [
+                    "--contract-id",
+                    CONTRACT_ID,
+                    "--layout",
+                    "package",
+                    "--output",
+                    "out",
+                ],
+            )
+            assert result.exit_code == 0, result.output
+            package_dir = Path("out") / "bindings"
+            assert (package_dir / "__init__.py").exists()
+            assert (package_dir / "_client.py").exists()
+            assert not (Path("out") / "bindings.py").exists()
@@ -0,0 +1,279 @@
+"""Tests for the shared runtime imported by generated Python bindings."""
+
+import ast
+
+import black
+import pytest
+from stellar_sdk import Address, scval, xdr
+
+from stellar_contract_bindings.python import (
+    _GENERATED_MODULE_NAMES,
+    generate_binding,
+    generate_package,
+)
+from stellar_contract_bindings.runtime import v1
+
+FROM_ADDRESS = "GBMBVAHBE6D4AJXJJVTBQTVU4G7SN4FEIJOL5YTOHZ4WCUMKQ52ANL2B"
+
+
+def _type(t: xdr.SCSpecType) -> xdr.SCSpecTypeDef:
+    return xdr.SCSpecTypeDef(t)
+
+
+def _error_enum() -> xdr.SCSpecEntry:
+    return xdr.SCSpecEntry(
+        xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0,
+        udt_error_enum_v0=xdr.SCSpecUDTErrorEnumV0(
+            doc=b"",
+            lib=b"",
+            name=b"Error",
+            cases=[
+                xdr.SCSpecUDTErrorEnumCaseV0(doc=b"", name=b"Bad", value=xdr.Uint32(1))
+            ],
+        ),
+    )
+
+
+def _transfer_event() -> xdr.SCSpecEntry:
+    entry = xdr.SCSpecEntry(xdr.SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0)
+    entry.event_v0 = xdr.SCSpecEventV0(
+        doc=b"",
+        lib=b"",
+        name=xdr.SCSymbol(sc_symbol=b"transfer"),
+        prefix_topics=[xdr.SCSymbol(sc_symbol=b"transfer")],
+        params=[
+            xdr.SCSpecEventParamV0(
+                doc=b"",
+                name=b"from",
+                type=_type(xdr.SCSpecType.SC_SPEC_TYPE_ADDRESS),
+                location=xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_TOPIC_LIST,
+            ),
+            xdr.SCSpecEventParamV0(
+                doc=b"",
+                name=b"amount",
+                type=_type(xdr.SCSpecType.SC_SPEC_TYPE_I128),
+                location=xdr.SCSpecEventParamLocationV0.SC_SPEC_EVENT_PARAM_LOCATION_DATA,
+            ),
+        ],
+        data_format=xdr.SCSpecEventDataFormat.SC_SPEC_EVENT_DATA_FORMAT_SINGLE_VALUE,
+    )
+    return entry
+
+
+def _specs() -> list:
+    return [_error_enum(), _transfer_event()]
+
+
+def _load(source: str) -> dict:
+    namespace: dict = {}
+    exec(
+        compile(black.format_str(source, mode=black.Mode()), "b.py", "exec"), namespace
+    )
+    return namespace
+
+
+def _defined_functions(source: str) -> set:
+    return {
+        node.name
+        for node in ast.parse(source).body
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef))
+    }
+
+
+class TestRuntimeHelpers:
+    def test_coerce_accepts_scval_bytes_and_base64(self):
+        value = scval.to_uint32(7)
+        assert v1._coerce_event_scval(value) is value
+        assert v1._coerce_event_scval(value.to_xdr_bytes()) == value
+        assert v1._coerce_event_scval(value.to_xdr()) == value
+
+    def test_static_topics_match_symbols_and_strings(self):
+        assert v1._static_topic_matches(scval.to_symbol("transfer"), "transfer")
+        assert v1._static_topic_matches(scval.to_string("transfer"), "transfer")
+        assert not v1._static_topic_matches(scval.to_symbol("mint"), "transfer")
+        assert not v1._static_topic_matches(scval.to_uint32(1), "transfer")
+
+    def test_static_topic_key(self):
+        assert v1._static_topic_key(scval.to_symbol("transfer")) == b"transfer"
+        assert v1._static_topic_key(scval.to_string("transfer")) == b"transfer"
+        assert v1._static_topic_key(scval.to_uint32(1)) is None
+
+    def test_event_dispatch_key_reads_raw_topics(self):
+        keys = v1._static_topic_keys([b"transfer"])
+        topics = [scval.to_string("transfer"), scval.to_uint32(1)]
+        for first in (topics[0], topics[0].to_xdr(), topics[0].to_xdr_bytes()):
+            event = ([first, topics[1].to_xdr()], "not decoded")
+            assert v1._event_dispatch_key(event, keys) == (b"transfer", 2)
+        symbol = scval.to_symbol("transfer").to_xdr()
+        assert v1._event_dispatch_key(([symbol], b""), keys) == (b"transfer", 1)
+        assert v1._event_dispatch_key(([topics[1].to_xdr()], b""), keys) == (None, 1)
+        assert v1._event_dispatch_key(([], b""), keys) == (None, 0)
+
+    def test_error_helper(self):
+        error = xdr.SCError(xdr.SCErrorType.SCE_CONTRACT, contract_code=xdr.Uint32(1))
+        assert (
+            v1._from_error_scval(xdr.SCVal(xdr.SCValType.SCV_ERROR, error=error))
+            == error
+        )
+        with pytest.raises(ValueError):
+            v1._from_error_scval(scval.to_uint32(1))
+
+    def test_struct_values_need_the_exact_layout(self):
+        value = scval.to_struct({"a": scval.to_uint32(1), "b": scval.to_uint32(2)})
+        assert v1._struct_values(value, (b"a", b"b")) == [
+            scval.to_uint32(1),
+            scval.to_uint32(2),
+        ]
+        assert v1._struct_values(value, (b"b", b"a")) is None
+        assert v1._struct_values(value, (b"a",)) is None
+        assert v1._struct_values(scval.to_vec([]), ()) is None
+
+    def test_xdr_readers_walk_sdk_output(self):
+        address = scval.to_address(FROM_ADDRESS)
+        value = scval.to_vec(
+            [
+                scval.to_int128(-5),
+                scval.to_symbol("abcde"),
+                scval.to_bool(True),
+                address,
+            ]
+        )
+        data = value.to_xdr_bytes()
+        count, pos = v1._xdr_read_header(data, 0, data[:4])
+        amount, pos = v1._xdr_read_int(data, pos, b"\x00\x00\x00\x0a", 16, True)
+        symbol, pos = v1._xdr_read_symbol(data, pos)
+        flag, pos = v1._xdr_read_bool(data, pos)
+        account, pos = v1._xdr_read_address(data, pos)
+        assert (count, amount, symbol, flag) == (4, -5, "abcde", True)
+        assert account.address == FROM_ADDRESS
+        assert pos == len(data)
+        with pytest.raises(ValueError, match="SCV_MAP"):
+            v1._xdr_read_header(data, 0, b"\x00\x00\x00\x11")
+
+    def test_xdr_view_reader_shares_the_buffer(self):
+        data = scval.to_bytes(b"abcde").to_xdr_bytes()
+        tag = data[:4]
+        view, pos = v1._xdr_read_view(data, 0, tag)
+        assert (view.obj, bytes(view), pos) == (data, b"abcde", len(data))
+        assert v1._xdr_read_opaque(data, 0, tag) == (b"abcde", pos)
+        with pytest.raises(ValueError, match="SCV_BYTES"):
+            v1._xdr_read_view(data[:-4], 0, tag)
+
+    def test_xdr_writers_match_the_sdk(self):
+        out: list = []
+        v1._xdr_write_header(out, b"\x00\x00\x00\x10", 3)
+        v1._xdr_write_int(out, -5, b"\x00\x00\x00\x0a", 16, True)
+        v1._xdr_write_opaque(out, "abcde", b"\x00\x00\x00\x0f")
+        v1._xdr_write_bool(out, False)
+        expected = scval.to_vec(
+            [scval.to_int128(-5), scval.to_symbol("abcde"), scval.to_bool(False)]
+        )
+        assert b"".join(out) == expected.to_xdr_bytes()
+
+    def test_address_helpers_cache_both_directions(self):
+        before = v1.address_cache_stats()
+        for _ in range(3):
+            value = v1._address_to_scval(FROM_ADDRESS)
+            assert value == scval.to_address(FROM_ADDRESS)
+            assert v1._address_from_scval(value).address == FROM_ADDRESS
+        after = v1.address_cache_stats()
+        for direction in ("encode", "decode"):
+            assert after[direction]["hits"] - before[direction]["hits"] >= 2
+            assert 0 < after[direction]["hit_ratio"] <= 1
+        data = scval.to_address(FROM_ADDRESS).to_xdr_bytes()
+        assert v1._xdr_read_address(data, 0)[0] is v1._address_from_scval(value)
+        with pytest.raises(ValueError, match="SCV_ADDRESS"):
+            v1._address_from_scval(scval.to_uint32(1))
+        topic = scval.to_address(FROM_ADDRESS).to_xdr()
+        assert v1._address_topic(FROM_ADDRESS) == topic
+        assert v1._address_topic(FROM_ADDRESS) is v1._address_topic(FROM_ADDRESS)
+        address = v1._address_from_json(FROM_ADDRESS)
+        assert address == Address(FROM_ADDRESS)
+        assert v1._address_from_json(FROM_ADDRESS) is address
+        assert v1._address_from_json(Address(FROM_ADDRESS)) == address
+
+    def test_exports_are_reserved_names(self):
+        # Generated modules import these names, so a UDT must never take one.
+        assert set(v1.__all__) <= _GENERATED_MODULE_NAMES
+
+
+class TestSharedRuntimeBindings:
+    def test_inline_is_the_default(self):
+        assert generate_binding(_specs(), "none") == generate_binding(
+            _specs(), "none", runtime="inline"
+        )
+
+    def test_helpers_are_imported_not_defined(self):
+        source = generate_binding(_specs(), "none", runtime="shared")
+        defined = _defined_functions(source)
+        assert set(v1.__all__).isdisjoint(defined)
+        assert (
+            "from stellar_contract_bindings.runtime.v1 import UnparsedEventError, "
+            "_address_from_json, _address_from_raw, _address_from_scval, "
+            "_address_from_strkey, _address_to_scval, _address_topic, "
+            "_coerce_event_scval, _event_dispatch_key, _event_topics_and_data, "
+            "_event_topics_and_raw_data, _from_error_scval, _json_address, "
+            "_static_topic_key, _static_topic_keys, _static_topic_matches" in source
+        )
+
+    def test_only_what_the_module_uses_is_imported(self):
+        source = generate_binding([_error_enum()], "none", runtime="shared")
+        assert "from stellar_contract_bindings.runtime.v1 import _from_error_scval" in (
+            source
+        )
+        function = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0,
+            function_v0=xdr.SCSpecFunctionV0(
+                doc=b"",
+                name=xdr.SCSymbol(b"f"),
+                inputs=[],
+                outputs=[_type(xdr.SCSpecType.SC_SPEC_TYPE_U32)],
+            ),
+        )
+        source = generate_binding([function], "both", runtime="shared")
+        assert "stellar_contract_bindings" not in source.split("\n", 1)[1]
+
+    def test_shared_bindings_parse_events(self):
+        bindings = _load(generate_binding(_specs(), "none", runtime="shared"))
+        topics = [scval.to_symbol("transfer"), scval.to_address(FROM_ADDRESS)]
+        event = bindings["parse_event"](
+            ([t.to_xdr() for t in topics], scval.to_int128(5).to_xdr())
+        )
+        assert event.amount == 5
+        assert event.from_.address == FROM_ADDRESS
+        assert bindings["Error"].from_scval(bindings["Error"].Bad.to_scval()) is (
+            bindings["Error"].Bad
+        )
+
+    def test_every_binding_raises_the_same_exception_class(self):
+        first = _load(generate_binding(_specs(), "none", runtime="shared"))
+        second = _load(generate_binding(_specs(), "none", runtime="shared"))
+        assert first["UnparsedEventError"] is v1.UnparsedEventError
+        assert second["UnparsedEventError"] is v1.UnparsedEventError
+
+    def test_shared_bindings_read_and_write_xdr_bytes(self):
+        event = _transfer_event().event_v0
+        record = xdr.SCSpecEntry(
+            xdr.SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0,
+            udt_struct_v0=xdr.SCSpecUDTStructV0(
+                doc=b"",
+                lib=b"",
+                name=b"Record",
+                fields=[
+                    xdr.SCSpecUDTStructFieldV0(doc=b"", name=p.name, type=p.type)
+                    for p in event.params
+                ],
+            ),
+        )
+        source = generate_binding([record], "none", runtime="shared")
+        assert "def _xdr_" not in source
+        record_cls = _load(source)["Record"]
+        value = record_cls(FROM_ADDRESS, 5)
+        assert value.to_xdr_bytes() == value.to_scval().to_xdr_bytes()
+        decoded = record_cls.from_xdr_bytes(value.to_xdr_bytes())
+        assert (decoded.from_.address, decoded.amount) == (FROM_ADDRESS, 5)
+
+    def test_package_layout_imports_the_runtime(self):
+        files = generate_package(_specs(), "none", runtime="shared")
+        assert "import UnparsedEventError" in files["_events.py"]
+        assert "_from_error_scval" not in _defined_functions(files["_error.py"])
@@ -1,5 +1,8 @@
+import os
+
 from flask import Flask, render_template_string, request
 from typing import Literal
+from stellar_contract_bindings.cache import CACHE_DIR_ENV, lookup_contract_binding
 from stellar_contract_bindings.java import generate_binding as generate_java_binding
 from stellar_contract_bindings.python import generate_binding as generate_python_binding
 from stellar_contract_bindings.flutter import generate_binding as generate_flutter_binding
@@ -46,10 +49,29 @@ def generate_code(
     extra_fields: dict = None,
 ) -> str:
 
-    specs = get_specs_by_contract_id(contract_id, rpc_url)
-
     if extra_fields is None:
         extra_fields = {}
+    if language not in required_fields:
+        return "Unsupported language selected."
+
+    # Python bindings are formatted with black, so its version is in the key.
+    options = (
+        {"client_type": "both", "black": black.__version__}
+        if language == "python"
+        else extra_fields
+    )
+    cached = lookup_contract_binding(
+        os.environ.get(CACHE_DIR_ENV), contract_id, rpc_url, language, **options
+    )
+    if cached.content is not None:
+        return cached.content
+    specs = get_specs_by_contract_id(contract_id, rpc_url)
+    code = render_code(specs, language, extra_fields)
+    cached.store(code)
+    return code
+
+
+def render_code(specs, language: str, extra_fields: dict) -> str:
 
     if language == "python":
         code = generate_python_binding(specs, "both")